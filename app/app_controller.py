@@ -3,13 +3,12 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-import cv2
-
 from core.config import AppConfig
-from core.constants import KEY_ESC, KEY_R, KEY_T, WINDOW_NAME
+from core.constants import KEY_C, KEY_ESC, KEY_R, KEY_T, KEY_U, WINDOW_NAME
+from gestures.background_trainer import MODE_FULL, MODE_INCREMENTAL, BackgroundTrainer
+from gestures.dataset_compaction import NearDuplicateFilter
 from gestures.gesture_dataset import GestureDataset
 from gestures.gesture_predictor import GesturePredictor
-from gestures.gesture_trainer import GestureTrainer
 from interaction.interaction_engine import InteractionEngine
 from interaction.object_manager import ObjectManager
 from ui.renderer import Renderer
@@ -34,23 +33,31 @@ class AppController:
         self.landmark_processor = LandmarkProcessor()
 
         self.dataset = GestureDataset(self.config.dataset_path)
-        self.trainer = GestureTrainer(self.config, logger=self.logger)
         self.predictor = GesturePredictor(
             model_path=self.config.model_path,
             threshold=self.config.prediction_threshold,
             smoothing_window=self.config.smoothing_window,
             auto_reload_sec=self.config.model_auto_reload_sec,
             logger=self.logger,
+            feature_schema=str(LandmarkProcessor.feature_schema()["hash"]),
+            mmap=self.config.model_mmap,
+            backend=self.config.inference_backend,
+            onnx_threads=self.config.onnx_threads,
         )
+        self.trainer = BackgroundTrainer(self.config, self.predictor, logger=self.logger)
 
         self.object_manager = ObjectManager()
         self.interaction_engine = InteractionEngine(self.object_manager)
-        self.renderer = Renderer(WINDOW_NAME)
+        self.renderer = Renderer(WINDOW_NAME, backend=self.config.display_backend)
         self.fps_counter = FPSCounter(window_size=45)
 
         self.collect_mode = False
         self.collect_label = ""
         self.collect_count = 0
+        self.collect_skipped = 0
+        self.collect_filter: Optional[NearDuplicateFilter] = None
+        if self.config.collect_min_distance > 0:
+            self.collect_filter = NearDuplicateFilter(self.config.collect_min_distance)
 
     def run(self) -> None:
         self.logger.info(
@@ -75,13 +82,17 @@ class AppController:
 
                 self._process_frame(frame)
 
-                key = cv2.waitKey(1) & 0xFF
+                key = self.renderer.poll_key()
                 if key in (KEY_ESC,):
                     break
                 if key in (KEY_T, ord("T")):
                     self._start_collection()
                 if key in (KEY_R, ord("R")):
-                    self._train_model()
+                    self._train_model(MODE_FULL)
+                if key in (KEY_U, ord("U")):
+                    self._train_model(MODE_INCREMENTAL)
+                if key in (KEY_C, ord("C")):
+                    self.trainer.cancel()
         except Exception:
             self.logger.exception("Erro inesperado no loop principal.")
         finally:
@@ -113,7 +124,7 @@ class AppController:
                 gesture_label = hand_analysis.builtin_gesture
                 confidence = 0.65 if gesture_label != "unknown" else 0.0
 
-            self._collect_sample_if_needed(hand_analysis.features)
+            self._collect_sample_if_needed(hand_analysis.features, hand_analysis.points_norm)
 
         snapshot = self.interaction_engine.update(
             gesture_label=gesture_label,
@@ -122,10 +133,11 @@ class AppController:
         )
 
         self.fps_counter.tick()
+        job = self.trainer.visible_status()
         self.renderer.render(
             frame=frame,
-            objects=self.object_manager.objects(),
-            fps=self.fps_counter.get_fps(),
+            objects=self.object_manager.arrays(),
+            fps=self.fps_counter.get_display_fps(),
             gesture_label=gesture_label,
             confidence=confidence,
             state=snapshot.state,
@@ -136,6 +148,9 @@ class AppController:
             training_target=self.config.training_samples,
             hand_bbox=hand_bbox,
             hand_points=hand_points,
+            job_stage=job.stage if job else None,
+            job_progress=job.progress if job else 0.0,
+            job_message=job.message if job else "",
         )
 
     def _start_collection(self) -> None:
@@ -157,43 +172,47 @@ class AppController:
         self.collect_mode = True
         self.collect_label = label
         self.collect_count = 0
+        self.collect_skipped = 0
+        if self.collect_filter is not None:
+            self.collect_filter.reset()
         self.logger.info(
             "Coleta iniciada: gesto=%s | alvo=%s amostras",
             label,
             self.config.training_samples,
         )
 
-    def _collect_sample_if_needed(self, features) -> None:
+    def _collect_sample_if_needed(self, features, landmarks=None) -> None:
         if not self.collect_mode:
             return
 
+        if self.collect_filter is not None and not self.collect_filter.accept(features, self.collect_label):
+            self.collect_skipped += 1
+            return
+
         try:
-            self.dataset.append_sample(features=features, label=self.collect_label)
+            self.dataset.append_sample(features=features, label=self.collect_label, landmarks=landmarks)
             self.collect_count += 1
 
             if self.collect_count >= self.config.training_samples:
                 self.collect_mode = False
-                self.logger.info("Coleta finalizada para '%s'.", self.collect_label)
+                self.dataset.flush_index()
+                self.logger.info(
+                    "Coleta finalizada para '%s' (%s quase duplicadas ignoradas).",
+                    self.collect_label,
+                    self.collect_skipped,
+                )
         except Exception:
             self.collect_mode = False
             self.logger.exception("Erro na coleta de dados.")
 
-    def _train_model(self) -> None:
+    def _train_model(self, mode: str) -> None:
         try:
-            report = self.trainer.train()
-            self.predictor.reload_model(force=True)
-            self.logger.info(
-                "Treino concluido | amostras=%s | accuracy=%.4f | precision=%.4f | recall=%.4f",
-                report.samples,
-                report.accuracy,
-                report.precision,
-                report.recall,
-            )
-            self.logger.info("Matriz de confusao:\n%s", report.confusion_matrix)
+            self.trainer.start(mode=mode)
         except Exception:
-            self.logger.exception("Falha ao treinar modelo.")
+            self.logger.exception("Falha ao iniciar treino do modelo.")
 
     def _shutdown(self) -> None:
+        self.trainer.close()
         self.camera.stop()
         self.hand_tracker.close()
         self.renderer.close()
@@ -2,17 +2,24 @@ from __future__ import annotations
 
 import logging
 import time
+from pathlib import Path
 from typing import List, Optional, Tuple
 
-import cv2
 import numpy as np
 
 from core.config import AppConfig
-from core.constants import KEY_ESC, WINDOW_NAME_3D
+from core.constants import KEY_ESC, KEY_N, KEY_TAB, KEY_V, WINDOW_NAME_3D
 from gestures.gesture_recognizer import GestureRecognizer, HandState
 from interaction.floating_object import FloatingObject
+from interaction.object_simulation import ObjectSimulation
+from interaction.scene_3d import Scene3D
+from ui.debug_presenter import DebugPresenter
+from ui.display import NO_KEY
+from ui.model_loader import MODEL_RADIUS
+from ui.recorder import RecordingSession
 from ui.renderer_3d import Renderer3D
 from ui.renderer_debug import DebugRenderer
+from utils.fixed_step import FixedStepClock
 from utils.fps_counter import FPSCounter
 from vision.camera import CameraError, ThreadedCamera
 from vision.hand_tracker import HandDetection, HandTracker
@@ -39,13 +46,29 @@ class Gesture3DController:
         self.gesture_recognizer = GestureRecognizer(self.config, simple_mode=simple_mode)
 
         self.floating_object = FloatingObject()
+        self.scene = Scene3D(self.floating_object)
+        self.scene.populate_grid(self.config.scene_objects)
         self.renderer_3d = Renderer3D(self.config, WINDOW_NAME_3D)
-        self.debug_renderer = DebugRenderer("Gesture Debug")
+        if self.config.mesh_path is not None:
+            self._load_model(self.config.mesh_path)
+        self.debug_presenter: Optional[DebugPresenter] = None
+        if self.config.debug_fps > 0:
+            self.debug_presenter = DebugPresenter(
+                lambda: DebugRenderer("Gesture Debug", backend=self.config.display_backend),
+                fps=self.config.debug_fps,
+                threaded=self.config.debug_threaded,
+            )
         self.fps_counter = FPSCounter(window_size=45)
 
+        self.simulation = ObjectSimulation(
+            self.floating_object,
+            clock=FixedStepClock(self.config.sim_rate_hz, self.config.sim_max_catchup_sec),
+            spin_speed=60.0,
+            scene=self.scene,
+        )
+
         self._paused = False
-        self._last_frame_ts = time.perf_counter()
-        self._spin_speed = 60.0
+        self._recording: Optional[RecordingSession] = None
 
     def run(self) -> None:
         self.logger.info("Iniciando gesto 3D | modo=%s", "simples" if self.simple_mode else "avancado")
@@ -56,7 +79,8 @@ class Gesture3DController:
             self._shutdown()
             return
 
-        self.renderer_3d.start()
+        self._start_renderer()
+        self._start_debug()
 
         try:
             while True:
@@ -78,8 +102,6 @@ class Gesture3DController:
 
     def _process_frame(self, frame) -> bool:
         now = time.perf_counter()
-        dt = max(1e-4, now - self._last_frame_ts)
-        self._last_frame_ts = now
 
         detections = self.hand_tracker.process(frame)
         hand_states, hand_bbox, hand_points = self._build_hand_states(frame, detections)
@@ -93,6 +115,8 @@ class Gesture3DController:
 
         if gesture_output.reset:
             self.floating_object.reset()
+            self.simulation.clear_inputs()
+            self.simulation.snap()
             status = "reset"
 
         if gesture_output.toggle_object:
@@ -103,23 +127,28 @@ class Gesture3DController:
             self.floating_object.toggle_color()
             status = "cor alterada"
 
+        if gesture_output.select_point_px is not None:
+            status = self._pick(frame, gesture_output.select_point_px)
+
         if status == "ok" and gesture_output.calibration_active:
             status = "calibrando"
 
-        if not self._paused:
-            self.floating_object.apply_translation(gesture_output.translation)
-            self.floating_object.apply_rotation(gesture_output.rotation)
-            self.floating_object.apply_scale(gesture_output.scale_delta)
+        self.simulation.push(gesture_output, paused=self._paused)
+        self.simulation.advance(now)
 
-            if gesture_output.spin_active:
-                self.floating_object.apply_rotation(np.array([0.0, self._spin_speed * dt, 0.0], dtype=float))
-
-        self.renderer_3d.render(self.floating_object)
+        if not self.renderer_3d.threaded:
+            self.renderer_3d.render(
+                self.floating_object,
+                pose=self.simulation.render_pose(),
+                scene=self.simulation.snapshot.scene,
+            )
 
         self.fps_counter.tick()
-        self.debug_renderer.render(
+        if self.debug_presenter is None:
+            return False
+        self.debug_presenter.submit(
             frame=frame,
-            fps=self.fps_counter.get_fps(),
+            fps=self.fps_counter.get_display_fps(),
             gesture_label=gesture_output.gesture_name,
             scale=self.floating_object.scale,
             rotation=(
@@ -134,8 +163,92 @@ class Gesture3DController:
             hand_points=hand_points,
         )
 
-        key = cv2.waitKey(1) & 0xFF
-        return key == KEY_ESC
+        key = self.debug_presenter.poll_key()
+        while key != NO_KEY:
+            if key == KEY_ESC:
+                return True
+            if key == KEY_TAB:
+                self._select(self.scene.select_next())
+            elif key in (KEY_N, ord("N")):
+                self._select(self.scene.add_object(self.floating_object.object_type, self.floating_object.color))
+            elif key in (KEY_V, ord("V")):
+                self._toggle_recording()
+            key = self.debug_presenter.poll_key()
+        return False
+
+    def _select(self, index: int) -> None:
+        self.scene.select(index)
+        self.simulation.clear_inputs()
+        self.simulation.snap()
+        self.logger.info("Objeto ativo: %d/%d", index + 1, len(self.scene))
+
+    def _toggle_recording(self) -> None:
+        if self._recording is None:
+            self._recording = RecordingSession(
+                self.config.record_dir,
+                fps=self.config.record_fps,
+                ring_size=self.config.record_ring_size,
+            )
+            self.renderer_3d.frame_sink = self._recording.sink("3d")
+            if self.debug_presenter is not None:
+                self.debug_presenter.frame_sink = self._recording.sink("debug")
+            self.logger.info("Gravacao iniciada em %s", self.config.record_dir)
+            return
+        self.renderer_3d.frame_sink = None
+        if self.debug_presenter is not None:
+            self.debug_presenter.frame_sink = None
+        session, self._recording = self._recording, None
+        for source, stats in session.stop().items():
+            if stats.error:
+                self.logger.error("Gravacao %s falhou: %s", source, stats.error)
+                continue
+            self.logger.info(
+                "Gravacao %s salva: %s | quadros=%d descartados=%d codificacao=%.1f q/s",
+                source,
+                stats.path,
+                stats.frames_encoded,
+                stats.frames_dropped,
+                stats.encode_fps,
+            )
+
+    def _load_model(self, path: Path) -> None:
+        try:
+            object_type = self.renderer_3d.load_model(path)
+        except (OSError, ValueError, KeyError):
+            self.logger.exception("Falha ao carregar o modelo 3D: %s", path)
+            return
+        self.scene.add_type(object_type, MODEL_RADIUS)
+        self.floating_object.add_type(object_type)
+        self.floating_object.object_type = object_type
+        self.scene.store_active()
+        self.logger.info("Modelo 3D carregado: %s", object_type)
+
+    def _pick(self, frame, point_px: Tuple[int, int]) -> str:
+        height, width = frame.shape[:2]
+        aspect = self.config.render_width / self.config.render_height
+        index = self.scene.pick(point_px[0] / width, point_px[1] / height, aspect)
+        if index is None:
+            return "nada selecionado"
+        self._select(index)
+        return f"objeto {index + 1}/{len(self.scene)}"
+
+    def _start_renderer(self) -> None:
+        if self.config.render_threaded:
+            try:
+                self.renderer_3d.start_thread(lambda: self.simulation.snapshot)
+                return
+            except RuntimeError:
+                self.logger.exception("Render 3D em thread indisponivel; usando o loop principal.")
+        self.renderer_3d.start()
+
+    def _start_debug(self) -> None:
+        if self.debug_presenter is None:
+            return
+        try:
+            self.debug_presenter.start()
+        except RuntimeError:
+            self.logger.exception("Janela de debug indisponivel; seguindo sem ela.")
+            self.debug_presenter = None
 
     def _build_hand_states(
         self,
@@ -163,4 +276,7 @@ class Gesture3DController:
         self.camera.stop()
         self.hand_tracker.close()
         self.renderer_3d.close()
-        self.debug_renderer.close()
+        if self.debug_presenter is not None:
+            self.debug_presenter.close()
+        if self._recording is not None:
+            self._toggle_recording()
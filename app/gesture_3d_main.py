@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -8,6 +9,10 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# PyOpenGL picks its platform on first import; the offscreen backend renders through EGL.
+if os.getenv("GESTURE_DISPLAY_BACKEND", "").strip().lower() == "offscreen":
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
 from app.gesture_3d_controller import Gesture3DController
 from core.config import AppConfig
 from core.logger import configure_logging
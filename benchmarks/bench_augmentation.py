@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from sklearn.metrics import accuracy_score
+
+from gestures.augmentation import LandmarkAugmenter, augmented_batches
+from gestures.gesture_classifier import build_classifier
+from vision.landmark_processor import LandmarkProcessor
+
+
+def _recorded(rng: np.random.Generator, templates: np.ndarray, frames: int, noise: float) -> np.ndarray:
+    points = np.repeat(templates, frames, axis=0)
+    points = points + rng.normal(0.0, noise, size=points.shape).astype(np.float32)
+    return LandmarkProcessor.normalize_batch(points)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Augmentation de landmarks: throughput e accuracy")
+    parser.add_argument("--classes", type=int, default=6)
+    parser.add_argument("--frames", type=int, default=40, help="Frames gravados por gesto")
+    parser.add_argument("--copies", type=int, default=8)
+    parser.add_argument("--model", default="random_forest")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    processor = LandmarkProcessor()
+    base = rng.random((1, 21, 3)).astype(np.float32)
+    offsets = rng.normal(0.0, 0.08, size=(args.classes, 21, 3)).astype(np.float32)
+    templates = LandmarkProcessor.normalize_batch(base + offsets)
+    labels = np.repeat([f"gesture_{idx}" for idx in range(args.classes)], args.frames)
+
+    train_points = _recorded(rng, templates, args.frames, 0.01)
+    session = LandmarkAugmenter(max_rotation_deg=25.0, scale_range=(0.8, 1.2), jitter_std=0.02, seed=99)
+    test_points = session.augment(_recorded(rng, templates, 200, 0.01))
+    test_labels = np.repeat([f"gesture_{idx}" for idx in range(args.classes)], 200)
+    x_test = processor.build_feature_batch(test_points)
+
+    start = time.perf_counter()
+    single = np.stack([processor._build_feature_vector(points) for points in test_points])
+    single_sec = time.perf_counter() - start
+    start = time.perf_counter()
+    processor.build_feature_batch(test_points)
+    batch_sec = time.perf_counter() - start
+    print(f"features de {len(test_points)} maos: loop {single_sec * 1000:.1f} ms | lote {batch_sec * 1000:.1f} ms")
+    print(f"diferenca maxima loop x lote: {np.abs(single - x_test).max():.2e}")
+
+    x_train = processor.build_feature_batch(train_points)
+    for copies in (0, args.copies):
+        start = time.perf_counter()
+        parts_x, parts_y = [x_train], [labels]
+        if copies:
+            for batch_x, batch_y in augmented_batches(train_points, labels, copies):
+                parts_x.append(batch_x)
+                parts_y.append(batch_y)
+        x_all, y_all = np.concatenate(parts_x), np.concatenate(parts_y)
+        augment_sec = time.perf_counter() - start
+
+        model = build_classifier(args.model)
+        start = time.perf_counter()
+        model.fit(x_all, y_all)
+        fit_sec = time.perf_counter() - start
+        acc = accuracy_score(test_labels, model.predict(x_test))
+        print(
+            f"copias={copies:2d} | linhas={len(y_all):6d} | augmentation {augment_sec * 1000:7.1f} ms | "
+            f"fit {fit_sec:5.2f}s | accuracy {acc:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+import numpy as np  # noqa: E402
+
+from core.config import AppConfig  # noqa: E402
+from interaction.floating_object import FloatingObject  # noqa: E402
+from interaction.scene_3d import Scene3D  # noqa: E402
+from ui.renderer_3d import Renderer3D  # noqa: E402
+from ui.renderer_debug import DebugRenderer  # noqa: E402
+
+
+def _run(backend: str, frames: int, objects: int) -> float:
+    config = AppConfig(display_backend=backend, render_width=640, render_height=480)
+    obj = FloatingObject()
+    scene = Scene3D(obj)
+    scene.populate_grid(objects)
+    renderer = Renderer3D(config, "bench")
+    debug = DebugRenderer("bench", backend=backend)
+    camera_frame = np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    renderer.start()
+    start = time.perf_counter()
+    for idx in range(frames):
+        obj.apply_rotation(np.array([0.0, 3.0, 0.0]))
+        renderer.render(obj, scene=scene.snapshot())
+        debug.render(camera_frame, 30.0, "rotate", obj.scale, tuple(obj.rotation_deg), False, False, "ok")
+    elapsed = time.perf_counter() - start
+    renderer.close()
+    debug.close()
+    return frames / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Renderizacao sem janela: offscreen vs null")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--objects", type=int, default=100)
+    args = parser.parse_args()
+
+    for backend in ("null", "offscreen"):
+        fps = _run(backend, args.frames, args.objects)
+        print(f"  {backend:9s} {fps:7.1f} quadros/s (3D 640x480 + overlay, {args.objects} objetos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+from core.config import AppConfig  # noqa: E402
+from interaction.floating_object import FloatingObject  # noqa: E402
+from interaction.scene_3d import Scene3D  # noqa: E402
+from ui.renderer_3d import Renderer3D  # noqa: E402
+
+
+def _run(keepalive: float, frames: int, objects: int):
+    config = AppConfig(display_backend="offscreen", render_width=640, render_height=480, render_keepalive_sec=keepalive)
+    obj = FloatingObject()
+    scene = Scene3D(obj)
+    scene.populate_grid(objects)
+    renderer = Renderer3D(config, "bench")
+    renderer.start()
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(frames):
+        renderer.render(obj, scene=scene.snapshot())
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    drawn = renderer.frames_drawn
+    renderer.close()
+    return wall * 1e3 / frames, cpu * 1e3 / frames, drawn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cena 3D parada: redesenho sempre vs quadros sujos")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--objects", type=int, default=100)
+    args = parser.parse_args()
+
+    for name, keepalive in (("sempre", 0.0), ("sujos", 1.0)):
+        wall_ms, cpu_ms, drawn = _run(keepalive, args.frames, args.objects)
+        print(f"  {name:7s} {wall_ms:7.3f} ms/quadro | CPU {cpu_ms:7.3f} ms/quadro | desenhados {drawn}/{args.frames}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.config import AppConfig
+from gestures.gesture_trainer import GestureTrainer
+
+
+def _synthetic_rows(rng: np.random.Generator, label: str, count: int, feature_count: int) -> pd.DataFrame:
+    center = rng.normal(0.0, 1.0, size=feature_count)
+    data = rng.normal(center, 0.25, size=(count, feature_count)).astype(np.float32)
+    df = pd.DataFrame(data, columns=[f"feature_{idx + 1}" for idx in range(feature_count)])
+    df["label"] = label
+    return df
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Atualizacao incremental vs treino completo")
+    parser.add_argument("--classes", type=int, default=6)
+    parser.add_argument("--per-class", type=int, default=2000)
+    parser.add_argument("--new-samples", type=int, default=200)
+    parser.add_argument("--features", type=int, default=102)
+    parser.add_argument("--full-model", default="random_forest")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    logger = logging.getLogger("bench")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        dataset_path = tmp_path / "dataset.csv"
+        base = pd.concat(
+            [_synthetic_rows(rng, f"gesture_{idx}", args.per_class, args.features) for idx in range(args.classes)]
+        )
+        base.to_csv(dataset_path, index=False)
+
+        prototype_config = AppConfig(
+            dataset_path=dataset_path,
+            model_path=tmp_path / "prototype.pkl",
+            log_path=tmp_path / "bench.log",
+            feature_cache_dir=tmp_path / "features",
+            classifier_type="prototype",
+        )
+        GestureTrainer(prototype_config, logger).train()
+
+        new_rows = _synthetic_rows(rng, "new_gesture", args.new_samples, args.features)
+        new_rows.to_csv(dataset_path, mode="a", header=False, index=False)
+
+        incremental = _timed(lambda: GestureTrainer(prototype_config, logger).update_incremental())
+        prototype_full = _timed(lambda: GestureTrainer(prototype_config, logger).train())
+
+        full_config = AppConfig(
+            dataset_path=dataset_path,
+            model_path=tmp_path / "full.pkl",
+            log_path=tmp_path / "bench.log",
+            feature_cache_dir=tmp_path / "features",
+            classifier_type=args.full_model,
+        )
+        full = _timed(lambda: GestureTrainer(full_config, logger).train())
+
+    total = args.classes * args.per_class + args.new_samples
+    print(f"dataset: {total} linhas x {args.features} features | novas amostras: {args.new_samples}")
+    print(f"incremental (prototype)      : {incremental * 1000:9.1f} ms")
+    print(f"treino completo (prototype)  : {prototype_full * 1000:9.1f} ms")
+    print(f"treino completo ({args.full_model}): {full * 1000:9.1f} ms")
+    print(f"speedup vs {args.full_model}: {full / max(incremental, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
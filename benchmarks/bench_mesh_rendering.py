@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Callable
+
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+from OpenGL import GL  # noqa: E402
+from OpenGL.GLU import gluNewQuadric, gluSphere  # noqa: E402
+
+from ui.mesh_cache import MeshCache  # noqa: E402
+from ui.meshes import build_mesh  # noqa: E402
+from ui.offscreen_gl import OffscreenContext  # noqa: E402
+
+
+def _immediate(object_type: str) -> Callable[[], None]:
+    mesh = build_mesh(object_type)
+
+    def draw() -> None:
+        GL.glBegin(GL.GL_TRIANGLES)
+        for idx in mesh.indices.tolist():
+            GL.glNormal3f(*mesh.normals[idx].tolist())
+            GL.glVertex3f(*mesh.vertices[idx].tolist())
+        GL.glEnd()
+
+    return draw
+
+
+def _per_draw_us(draw: Callable[[], None], draws: int) -> float:
+    draw()
+    GL.glFinish()
+    start = time.perf_counter()
+    for _ in range(draws):
+        draw()
+    GL.glFinish()
+    return (time.perf_counter() - start) * 1e6 / draws
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Renderer3D: modo imediato vs VBO em contexto offscreen")
+    parser.add_argument("--draws", type=int, default=200)
+    args = parser.parse_args()
+
+    context = OffscreenContext(320, 240)
+    cache = MeshCache()
+    quadric = gluNewQuadric()
+    # Tiny on screen, so llvmpipe rasterisation does not hide the submission cost.
+    GL.glScalef(0.02, 0.02, 0.02)
+    print(f"GL {GL.glGetString(GL.GL_VERSION).decode()} | {GL.glGetString(GL.GL_RENDERER).decode()}")
+
+    rows = [
+        ("cube", _immediate("cube"), cache.get("cube").draw),
+        ("pyramid", _immediate("pyramid"), cache.get("pyramid").draw),
+        ("sphere (gluSphere 28x28)", lambda: gluSphere(quadric, 0.7, 28, 28), cache.get("sphere", 0).draw),
+    ]
+    for name, immediate, retained in rows:
+        old = _per_draw_us(immediate, args.draws)
+        new = _per_draw_us(retained, args.draws)
+        print(f"  {name:26s} imediato {old:9.1f} us | VBO {new:7.1f} us ({old / max(new, 1e-9):5.1f}x)")
+
+    cache.release()
+    context.release()
+
+
+if __name__ == "__main__":
+    main()
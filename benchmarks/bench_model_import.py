@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from ui.meshes import build_sphere
+from ui.model_loader import MeshStore, build_lods, load_obj, normalize_mesh
+
+
+def _write_obj(path: Path, segments: int) -> int:
+    mesh = build_sphere(slices=segments, stacks=segments)
+    lines = [f"v {x:.6f} {y:.6f} {z:.6f}" for x, y, z in mesh.vertices]
+    lines += [f"f {a + 1} {b + 1} {c + 1}" for a, b, c in mesh.indices.reshape(-1, 3)]
+    path.write_text("\n".join(lines))
+    return mesh.triangle_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Importacao de modelos 3D: OBJ vs cache .npy")
+    parser.add_argument("--segments", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "modelo.obj"
+        triangles = _write_obj(source, args.segments)
+        print(f"Modelo: {triangles} triangulos, {source.stat().st_size / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        lods = build_lods(normalize_mesh(load_obj(source)))
+        parse_ms = (time.perf_counter() - start) * 1e3
+        print(f"  parse + LODs sem cache:    {parse_ms:8.1f} ms | LODs {[mesh.triangle_count for mesh in lods]}")
+
+        store = MeshStore(Path(tmp) / "cache")
+        start = time.perf_counter()
+        store.load(source)
+        print(f"  primeira carga (gera cache): {(time.perf_counter() - start) * 1e3:6.1f} ms")
+        start = time.perf_counter()
+        store.load(source)
+        print(f"  carga seguinte (mmap):       {(time.perf_counter() - start) * 1e3:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
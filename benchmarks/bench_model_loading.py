@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from gestures.gesture_classifier import build_classifier
+from gestures.model_bundle import MMAP_MIN_BYTES, load_bundle, save_bundle
+
+
+def _timed_load(path: Path, mmap: bool, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load_bundle(path, mmap=mmap, mmap_min_bytes=0)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Carregamento do bundle: pickle completo vs mmap")
+    parser.add_argument("--classes", type=int, default=6)
+    parser.add_argument("--per-class", type=int, default=1500)
+    parser.add_argument("--noise", type=float, default=2.0, help="Mais ruido gera arvores maiores")
+    parser.add_argument("--features", type=int, default=102)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.normal(0.0, 1.0, size=(args.classes, args.features))
+    x = np.concatenate([rng.normal(center, args.noise, size=(args.per_class, args.features)) for center in centers])
+    y = np.repeat([f"gesture_{idx}" for idx in range(args.classes)], args.per_class)
+    model = build_classifier("random_forest")
+    model.fit(x.astype(np.float32), y)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "model.pkl"
+        manifest = save_bundle({"model": model, "labels": sorted(set(y)), "feature_count": args.features}, path)
+        full = _timed_load(path, mmap=False, repeats=args.repeats)
+        mapped = _timed_load(path, mmap=True, repeats=args.repeats)
+
+    print(f"bundle: {manifest['size_bytes'] / 1e6:.1f} MB | sha256 {manifest['checksum'][:12]}")
+    print(f"load completo: {full * 1000:8.1f} ms")
+    print(f"load mmap    : {mapped * 1000:8.1f} ms ({full / max(mapped, 1e-9):.1f}x)")
+    print(f"load_bundle usa mmap a partir de {MMAP_MIN_BYTES / 2**20:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from interaction.object_manager import ObjectManager, SceneObject
+from ui.renderer import Renderer
+from utils.math_utils import euclidean_distance
+
+
+def _linear_nearest(objects: Sequence[SceneObject], point: Tuple[int, int], max_distance: float) -> Optional[int]:
+    nearest_id, nearest_dist = None, float("inf")
+    for obj in objects:
+        distance = euclidean_distance((obj.x, obj.y), point)
+        if distance < nearest_dist:
+            nearest_id, nearest_dist = obj.object_id, distance
+    return nearest_id if nearest_dist <= max_distance else None
+
+
+def _linear_get(objects: Sequence[SceneObject], object_id: int) -> Optional[SceneObject]:
+    for obj in objects:
+        if obj.object_id == object_id:
+            return obj
+    return None
+
+
+def _draw_per_object(frame, objects: Sequence[SceneObject]) -> None:
+    for obj in objects:
+        x1, y1 = int(obj.x - obj.width / 2), int(obj.y - obj.height / 2)
+        x2, y2 = int(obj.x + obj.width / 2), int(obj.y + obj.height / 2)
+        color = (0, 230, 255) if obj.is_selected else (120, 160, 210)
+        cv2.rectangle(frame, (x1, y1), (x2, y2), color, 3 if obj.is_selected else 2, cv2.LINE_AA)
+        if obj.is_selected:
+            overlay = frame.copy()
+            cv2.rectangle(overlay, (x1, y1), (x2, y2), (0, 180, 255), -1, cv2.LINE_AA)
+            cv2.addWeighted(overlay, 0.08, frame, 0.92, 0, frame)
+
+
+def _per_call_us(fn: Callable[[int], object], calls: int) -> float:
+    start = time.perf_counter()
+    for idx in range(calls):
+        fn(idx)
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ObjectManager: indice espacial e arrays vs laco por objeto")
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--calls", type=int, default=2_000)
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    manager = ObjectManager()
+    centers = np.column_stack((rng.integers(0, args.width, args.objects), rng.integers(0, args.height, args.objects)))
+    start = time.perf_counter()
+    for x, y in centers.tolist():
+        manager.create_object((x, y))
+    build_ms = (time.perf_counter() - start) * 1000.0
+
+    points = [tuple(p) for p in np.column_stack((rng.integers(0, args.width, args.calls), rng.integers(0, args.height, args.calls))).tolist()]
+    objects = manager.objects()
+    ids = [obj.object_id for obj in objects]
+    linear_calls = max(1, args.calls // 20)
+
+    rows = [
+        ("select_nearest", _per_call_us(lambda i: manager.select_nearest(points[i]), args.calls),
+         _per_call_us(lambda i: _linear_nearest(objects, points[i], 220.0), linear_calls)),
+        ("get_selected", _per_call_us(lambda i: manager.get_selected(), args.calls),
+         _per_call_us(lambda i: _linear_get(objects, ids[-1]), linear_calls)),
+        ("objects_in_radius(150)", _per_call_us(lambda i: manager.objects_in_radius(points[i], 150.0), args.calls), None),
+    ]
+
+    def _move(i: int) -> None:
+        manager.selected_id = ids[i % len(ids)]
+        manager.move_selected(points[i])
+
+    rows.append(("select+move", _per_call_us(_move, args.calls), None))
+    rows.append(("translate(todos)", _per_call_us(lambda i: manager.translate((1, -1)), 50), None))
+    rows.append(("clamp_to_frame", _per_call_us(lambda i: manager.clamp_to_frame((args.height, args.width)), 50), None))
+
+    canvas = np.zeros((args.height, args.width, 3), dtype=np.uint8)
+    objects = manager.objects()
+    manager.selected_id = ids[len(ids) // 2]
+    rows.append(
+        ("desenho (arrays)", _per_call_us(lambda i: Renderer._draw_objects(canvas, manager.arrays()), 10),
+         _per_call_us(lambda i: _draw_per_object(canvas, objects), 10))
+    )
+
+    mismatches = sum(
+        (manager.select_nearest(p).object_id if manager.select_nearest(p) else None)
+        != _linear_nearest(manager.objects(), p, 220.0)
+        for p in points[:200]
+    )
+    print(f"{args.objects} objetos | criacao {build_ms:.1f} ms | divergencias vs linear: {mismatches}")
+    for name, indexed, linear in rows:
+        extra = f" | linear {linear:9.1f} us ({linear / max(indexed, 1e-9):6.0f}x)" if linear is not None else ""
+        print(f"  {name:24s} indice {indexed:7.2f} us{extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from gestures.gesture_classifier import build_classifier
+from gestures.onnx_backend import OnnxClassifier, export_onnx
+
+
+def _single_row_ms(model, x: np.ndarray, repeats: int) -> float:
+    timings = []
+    for idx in range(repeats):
+        row = x[idx % len(x)].reshape(1, -1)
+        start = time.perf_counter()
+        model.predict_proba(row)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return float(np.median(timings))
+
+
+def _threaded_rows_per_sec(model, x: np.ndarray, threads: int, per_thread: int) -> float:
+    def _work(offset: int) -> None:
+        for idx in range(per_thread):
+            model.predict_proba(x[(offset + idx) % len(x)].reshape(1, -1))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(_work, range(threads)))
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latencia de inferencia: sklearn vs onnxruntime")
+    parser.add_argument("--classifiers", default="random_forest,svm")
+    parser.add_argument("--features", type=int, default=102)
+    parser.add_argument("--per-class", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--onnx-threads", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.normal(0.0, 1.0, size=(6, args.features))
+    x = np.concatenate([rng.normal(center, 0.8, size=(args.per_class, args.features)) for center in centers])
+    x = x.astype(np.float32)
+    y = np.repeat([f"gesture_{idx}" for idx in range(len(centers))], args.per_class)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for classifier in args.classifiers.split(","):
+            model = build_classifier(classifier.strip())
+            model.fit(x, y)
+            path = export_onnx(model, args.features, Path(tmp) / f"{classifier}.onnx")
+            onnx_model = OnnxClassifier(path, model.classes_, threads=args.onnx_threads)
+            diff = float(np.abs(onnx_model.predict_proba(x[:500]) - model.predict_proba(x[:500])).max())
+
+            print(f"[{classifier}] diferenca maxima de probabilidade: {diff:.2e}")
+            for name, backend in (("sklearn", model), ("onnx", onnx_model)):
+                single = _single_row_ms(backend, x, args.repeats)
+                start = time.perf_counter()
+                backend.predict_proba(x)
+                batch = (time.perf_counter() - start) * 1000.0 / len(x)
+                threaded = _threaded_rows_per_sec(backend, x, args.threads, args.repeats // 2)
+                print(
+                    f"  {name:8s} 1 linha p50 {single:7.3f} ms | lote {batch:7.4f} ms/linha | "
+                    f"{args.threads} threads {threaded:8.0f} linhas/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from ui.overlay import draw_panel, draw_status_block, draw_training_badge, draw_training_job
+from ui.text_sprites import draw_text
+
+
+STATUS_LINES = ["FPS:  29.8", "Gesto: pinch", "Confianca:  91.0%", "Estado: MOVING", "Status: ok"]
+
+
+def _legacy_panel(frame, top_left, size, color=(18, 18, 22), alpha=0.72) -> None:
+    x, y = top_left
+    w, h = size
+    overlay = frame.copy()
+    cv2.rectangle(overlay, (x, y), (x + w, y + h), color, -1, cv2.LINE_AA)
+    cv2.addWeighted(overlay, alpha, frame, 1.0 - alpha, 0, frame)
+    cv2.rectangle(frame, (x, y), (x + w, y + h), (80, 80, 90), 1, cv2.LINE_AA)
+
+
+def _put_lines(frame) -> None:
+    for row, line in enumerate(STATUS_LINES):
+        cv2.putText(frame, line, (34, 45 + 25 * row), cv2.FONT_HERSHEY_SIMPLEX, 0.58, (225, 230, 240), 1, cv2.LINE_AA)
+
+
+def _sprite_lines(frame) -> None:
+    for row, line in enumerate(STATUS_LINES):
+        draw_text(frame, line, (34, 45 + 25 * row), 0.58, (225, 230, 240))
+
+
+def _time_us(fn, frame: np.ndarray, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(frame)
+    return (time.perf_counter() - start) * 1e6 / repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Custo dos overlays 2D por frame")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--repeats", type=int, default=500)
+    args = parser.parse_args()
+
+    frame = np.random.default_rng(0).integers(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+    cases = [
+        ("painel (frame inteiro)", lambda f: _legacy_panel(f, (18, 18), (370, 148))),
+        ("painel (so a ROI)", lambda f: draw_panel(f, (18, 18), (370, 148))),
+        ("texto putText (5 linhas)", _put_lines),
+        ("texto sprites (5 linhas)", _sprite_lines),
+        ("bloco de status", lambda f: draw_status_block(f, 30.0, "pinch", 0.9, "MOVING", "ok")),
+        ("badge de treino", lambda f: draw_training_badge(f, "pinch", 12, 40)),
+        ("job de treino", lambda f: draw_training_job(f, "fit", 0.4, "rf")),
+    ]
+    print(f"Frame {args.width}x{args.height}, {args.repeats} repeticoes")
+    for name, fn in cases:
+        print(f"  {name:24s} {_time_us(fn, frame, args.repeats):8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from interaction.bvh import SphereBVH, ray_sphere_brute_force
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Picking 3D: BVH vs varredura completa")
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--rays", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    directions = rng.normal(size=(args.rays, 3)) * [0.3, 0.3, 0.0] + [0.0, 0.0, -1.0]
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    origin = np.zeros(3)
+
+    for count in args.counts:
+        centers = rng.uniform([-4, -3, -12], [4, 3, -2], (count, 3))
+        radii = rng.uniform(0.05, 0.3, count)
+
+        start = time.perf_counter()
+        bvh = SphereBVH(centers, radii)
+        build_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        for direction in directions:
+            ray_sphere_brute_force(origin, direction, centers, radii)
+        brute_us = (time.perf_counter() - start) * 1e6 / args.rays
+
+        start = time.perf_counter()
+        for direction in directions:
+            bvh.intersect(origin, direction)
+        bvh_us = (time.perf_counter() - start) * 1e6 / args.rays
+
+        moved = rng.integers(0, count, 200)
+        start = time.perf_counter()
+        for index in moved:
+            bvh.refit(int(index), centers[index] + 0.05, radii[index])
+        refit_us = (time.perf_counter() - start) * 1e6 / len(moved)
+
+        print(
+            f"  {count:5d} objetos | varredura {brute_us:7.1f} us | BVH {bvh_us:6.1f} us"
+            f" | refit {refit_us:5.1f} us | build {build_ms:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+from OpenGL import GL  # noqa: E402
+
+from core.config import AppConfig  # noqa: E402
+from interaction.floating_object import FloatingObject  # noqa: E402
+from interaction.scene_3d import Scene3D  # noqa: E402
+from ui.offscreen_gl import OffscreenContext  # noqa: E402
+from ui.renderer_3d import Renderer3D  # noqa: E402
+
+
+def _frame_ms(renderer: Renderer3D, scene: Scene3D, frames: int) -> float:
+    active = scene.active
+    snapshot = scene.snapshot()
+    renderer._draw_scene(active.pose(), active.object_type, active.color, snapshot)
+    GL.glFinish()
+    start = time.perf_counter()
+    for _ in range(frames):
+        renderer._draw_scene(active.pose(), active.object_type, active.color, snapshot)
+    GL.glFinish()
+    return (time.perf_counter() - start) * 1e3 / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Renderer3D: cena instanciada vs objeto a objeto (offscreen)")
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 100, 1000])
+    args = parser.parse_args()
+
+    context = OffscreenContext(320, 240)
+    print(f"GL {GL.glGetString(GL.GL_VERSION).decode()} | {GL.glGetString(GL.GL_RENDERER).decode()}")
+    for count in args.counts:
+        scene = Scene3D(FloatingObject())
+        scene.populate_grid(count - 1)
+        timings = []
+        for instanced in (False, True):
+            renderer = Renderer3D(AppConfig(render_width=context.width, render_height=context.height), "bench")
+            renderer._setup_gl()
+            if not instanced:
+                renderer._instances._instanced = False
+            timings.append((_frame_ms(renderer, scene, args.frames), renderer._instances.draw_calls))
+            renderer._release_gl()
+        (loop_ms, loop_calls), (inst_ms, inst_calls) = timings
+        print(
+            f"  {count:5d} objetos | objeto a objeto {loop_ms:8.2f} ms ({loop_calls:4d} chamadas)"
+            f" | instanciado {inst_ms:6.2f} ms ({inst_calls} chamadas)"
+        )
+    context.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import json
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 
-from core.constants import DEFAULT_DATASET_PATH, DEFAULT_LOG_PATH, DEFAULT_MODEL_PATH
+from core.constants import (
+    DEFAULT_DATASET_PATH,
+    DEFAULT_FEATURE_CACHE_PATH,
+    DEFAULT_LOG_PATH,
+    DEFAULT_MESH_CACHE_PATH,
+    DEFAULT_MODEL_PATH,
+    DEFAULT_RECORD_PATH,
+    DEFAULT_TUNING_CACHE_PATH,
+)
 
 
 @dataclass
@@ -24,16 +34,37 @@ class AppConfig:
     prediction_threshold: float = 0.8
     smoothing_window: int = 5
     model_auto_reload_sec: float = 1.0
+    # Windows cannot replace a file while it is memory-mapped.
+    model_mmap: bool = os.name != "nt"
+    inference_backend: str = "sklearn"
+    onnx_threads: int = 1
 
     training_samples: int = 200
+    collect_min_distance: float = 0.0
+    max_samples_per_label: int = 0
+    augment_copies: int = 0
     test_size: float = 0.2
     random_state: int = 42
     classifier_type: str = "random_forest"
+    classifier_params: Dict[str, Any] = field(default_factory=dict)
 
     debug_mode: bool = False
 
+    display_backend: str = "window"
     render_width: int = 960
     render_height: int = 720
+    # SDL on macOS only pumps window events from the main thread.
+    render_threaded: bool = sys.platform != "darwin"
+    render_fps: int = 60
+    render_extrapolation_sec: float = 0.05
+    # Unchanged frames are skipped, but redrawn at least this often (0 redraws every frame).
+    render_keepalive_sec: float = 1.0
+    # The debug window is diagnostic only; 0 disables it.
+    debug_fps: float = 10.0
+    debug_threaded: bool = sys.platform != "darwin"
+    record_fps: float = 30.0
+    record_ring_size: int = 16
+    scene_objects: int = 0
     dominant_hand: str = "Right"
     deadzone_px: float = 8.0
     translation_sensitivity: float = 0.004
@@ -46,11 +77,19 @@ class AppConfig:
     swap_hold_sec: float = 1.0
     spin_hold_sec: float = 0.4
     color_hold_sec: float = 0.6
+    select_hold_sec: float = 0.5
     pause_cooldown_sec: float = 1.2
+    sim_rate_hz: float = 120.0
+    sim_max_catchup_sec: float = 0.25
 
     dataset_path: Path = DEFAULT_DATASET_PATH
     model_path: Path = DEFAULT_MODEL_PATH
     log_path: Path = DEFAULT_LOG_PATH
+    tuning_cache_dir: Path = DEFAULT_TUNING_CACHE_PATH
+    feature_cache_dir: Path = DEFAULT_FEATURE_CACHE_PATH
+    mesh_path: Optional[Path] = None
+    mesh_cache_dir: Path = DEFAULT_MESH_CACHE_PATH
+    record_dir: Path = DEFAULT_RECORD_PATH
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -72,6 +111,13 @@ class AppConfig:
                 return default
             return value.strip().lower() in {"1", "true", "yes", "on"}
 
+        def _json_dict(name: str) -> Dict[str, Any]:
+            try:
+                value = json.loads(os.getenv(name, "") or "{}")
+            except ValueError:
+                return {}
+            return value if isinstance(value, dict) else {}
+
         return cls(
             camera_index=_int("GESTURE_CAMERA_INDEX", 0),
             frame_width=_int("GESTURE_FRAME_WIDTH", 1280),
@@ -85,13 +131,30 @@ class AppConfig:
             prediction_threshold=max(0.0, min(1.0, _float("GESTURE_PREDICTION_THRESHOLD", 0.8))),
             smoothing_window=max(1, _int("GESTURE_SMOOTHING_WINDOW", 5)),
             model_auto_reload_sec=max(0.1, _float("GESTURE_MODEL_RELOAD_SEC", 1.0)),
+            model_mmap=_bool("GESTURE_MODEL_MMAP", os.name != "nt"),
+            inference_backend=os.getenv("GESTURE_INFERENCE_BACKEND", "sklearn").strip().lower(),
+            onnx_threads=max(1, _int("GESTURE_ONNX_THREADS", 1)),
             training_samples=max(20, _int("GESTURE_TRAIN_SAMPLES", 200)),
+            collect_min_distance=max(0.0, _float("GESTURE_COLLECT_MIN_DISTANCE", 0.0)),
+            max_samples_per_label=max(0, _int("GESTURE_MAX_SAMPLES_PER_LABEL", 0)),
+            augment_copies=max(0, _int("GESTURE_AUGMENT_COPIES", 0)),
             test_size=max(0.05, min(0.4, _float("GESTURE_TEST_SIZE", 0.2))),
             random_state=_int("GESTURE_RANDOM_STATE", 42),
             classifier_type=os.getenv("GESTURE_CLASSIFIER", "random_forest").strip().lower(),
+            classifier_params=_json_dict("GESTURE_CLASSIFIER_PARAMS"),
             debug_mode=_bool("GESTURE_DEBUG", False),
+            display_backend=os.getenv("GESTURE_DISPLAY_BACKEND", "window").strip().lower(),
             render_width=_int("GESTURE_RENDER_WIDTH", 960),
             render_height=_int("GESTURE_RENDER_HEIGHT", 720),
+            render_threaded=_bool("GESTURE_RENDER_THREADED", sys.platform != "darwin"),
+            render_fps=max(0, _int("GESTURE_RENDER_FPS", 60)),
+            render_extrapolation_sec=max(0.0, _float("GESTURE_RENDER_EXTRAPOLATION_SEC", 0.05)),
+            render_keepalive_sec=max(0.0, _float("GESTURE_RENDER_KEEPALIVE_SEC", 1.0)),
+            debug_fps=max(0.0, _float("GESTURE_DEBUG_FPS", 10.0)),
+            debug_threaded=_bool("GESTURE_DEBUG_THREADED", sys.platform != "darwin"),
+            record_fps=max(1.0, _float("GESTURE_RECORD_FPS", 30.0)),
+            record_ring_size=max(2, _int("GESTURE_RECORD_RING", 16)),
+            scene_objects=max(0, _int("GESTURE_SCENE_OBJECTS", 0)),
             dominant_hand=os.getenv("GESTURE_DOMINANT_HAND", "Right").strip().capitalize(),
             deadzone_px=max(1.0, _float("GESTURE_DEADZONE_PX", 8.0)),
             translation_sensitivity=_float("GESTURE_TRANSLATION_SENS", 0.004),
@@ -104,10 +167,18 @@ class AppConfig:
             swap_hold_sec=max(0.3, _float("GESTURE_SWAP_HOLD_SEC", 1.0)),
             spin_hold_sec=max(0.2, _float("GESTURE_SPIN_HOLD_SEC", 0.4)),
             color_hold_sec=max(0.2, _float("GESTURE_COLOR_HOLD_SEC", 0.6)),
+            select_hold_sec=max(0.2, _float("GESTURE_SELECT_HOLD_SEC", 0.5)),
             pause_cooldown_sec=max(0.4, _float("GESTURE_PAUSE_COOLDOWN_SEC", 1.2)),
+            sim_rate_hz=max(10.0, _float("GESTURE_SIM_RATE_HZ", 120.0)),
+            sim_max_catchup_sec=max(0.01, _float("GESTURE_SIM_MAX_CATCHUP_SEC", 0.25)),
             dataset_path=Path(os.getenv("GESTURE_DATASET_PATH", str(DEFAULT_DATASET_PATH))),
             model_path=Path(os.getenv("GESTURE_MODEL_PATH", str(DEFAULT_MODEL_PATH))),
             log_path=Path(os.getenv("GESTURE_LOG_PATH", str(DEFAULT_LOG_PATH))),
+            tuning_cache_dir=Path(os.getenv("GESTURE_TUNING_CACHE_DIR", str(DEFAULT_TUNING_CACHE_PATH))),
+            feature_cache_dir=Path(os.getenv("GESTURE_FEATURE_CACHE_DIR", str(DEFAULT_FEATURE_CACHE_PATH))),
+            mesh_path=Path(os.environ["GESTURE_MESH_PATH"]) if os.getenv("GESTURE_MESH_PATH") else None,
+            mesh_cache_dir=Path(os.getenv("GESTURE_MESH_CACHE_DIR", str(DEFAULT_MESH_CACHE_PATH))),
+            record_dir=Path(os.getenv("GESTURE_RECORD_DIR", str(DEFAULT_RECORD_PATH))),
         )
 
     @property
@@ -5,9 +5,17 @@ APP_NAME = "Gesture AI System"
 WINDOW_NAME = "Gesture AI - Commercial Prototype"
 WINDOW_NAME_3D = "Gesture AI - 3D Hands"
 
+CAMERA_FOV_DEG = 45.0
+CAMERA_NEAR = 0.1
+CAMERA_FAR = 100.0
+
 DEFAULT_DATASET_PATH = Path("data/dataset.csv")
 DEFAULT_MODEL_PATH = Path("models/saved_models/gesture_model.pkl")
 DEFAULT_LOG_PATH = Path("logs/gesture_ai.log")
+DEFAULT_TUNING_CACHE_PATH = Path("models/tuning_cache")
+DEFAULT_FEATURE_CACHE_PATH = Path("models/feature_cache")
+DEFAULT_MESH_CACHE_PATH = Path("models/mesh_cache")
+DEFAULT_RECORD_PATH = Path("recordings")
 
 STATE_IDLE = "IDLE"
 STATE_CREATING = "CREATING"
@@ -18,6 +26,11 @@ STATE_DELETING = "DELETING"
 KEY_ESC = 27
 KEY_T = ord("t")
 KEY_R = ord("r")
+KEY_C = ord("c")
+KEY_U = ord("u")
+KEY_N = ord("n")
+KEY_V = ord("v")
+KEY_TAB = 9
 
 GESTURE_TO_STATE = {
     "open_palm": STATE_CREATING,
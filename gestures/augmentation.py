@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from vision.landmark_processor import LandmarkProcessor
+
+
+HAND_POINTS = 21
+
+
+@dataclass
+class LandmarkAugmenter:
+    """Random in-plane rotation, anisotropic scale, mirroring and jitter of normalized hands."""
+
+    max_rotation_deg: float = 15.0
+    scale_range: Tuple[float, float] = (0.9, 1.1)
+    mirror_prob: float = 0.5
+    jitter_std: float = 0.01
+    seed: int = 42
+    _rng: np.random.Generator = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rng = np.random.default_rng(self.seed)
+
+    def transforms(self, count: int) -> np.ndarray:
+        theta = self._rng.uniform(-1.0, 1.0, size=count) * math.radians(self.max_rotation_deg)
+        cos, sin = np.cos(theta), np.sin(theta)
+        scale = self._rng.uniform(self.scale_range[0], self.scale_range[1], size=(count, 2))
+        mirror = np.where(self._rng.random(count) < self.mirror_prob, -1.0, 1.0)
+
+        matrices = np.zeros((count, 3, 3), dtype=np.float32)
+        matrices[:, 0, 0] = mirror * cos * scale[:, 0]
+        matrices[:, 0, 1] = -mirror * sin * scale[:, 1]
+        matrices[:, 1, 0] = sin * scale[:, 0]
+        matrices[:, 1, 1] = cos * scale[:, 1]
+        matrices[:, 2, 2] = scale.mean(axis=1)
+        return matrices
+
+    def augment(self, points: np.ndarray, copies: int = 1) -> np.ndarray:
+        points = np.asarray(points, dtype=np.float32).reshape(-1, HAND_POINTS, 3)
+        batch = np.repeat(points, max(1, copies), axis=0)
+        moved = np.einsum("nij,npj->npi", self.transforms(batch.shape[0]), batch)
+        if self.jitter_std > 0:
+            moved += self._rng.normal(0.0, self.jitter_std, size=moved.shape).astype(np.float32)
+        return LandmarkProcessor.normalize_batch(moved)
+
+
+def augmented_batches(
+    landmarks: np.ndarray,
+    labels: np.ndarray,
+    copies: int,
+    augmenter: Optional[LandmarkAugmenter] = None,
+    processor: Optional[LandmarkProcessor] = None,
+    batch_rows: int = 2048,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    augmenter = augmenter or LandmarkAugmenter()
+    processor = processor or LandmarkProcessor()
+    landmarks = np.asarray(landmarks, dtype=np.float32).reshape(-1, HAND_POINTS, 3)
+    labels = np.asarray(labels)
+    for start in range(0, landmarks.shape[0], max(1, batch_rows)):
+        points = augmenter.augment(landmarks[start : start + batch_rows], copies)
+        yield processor.build_feature_batch(points), np.repeat(labels[start : start + batch_rows], copies)
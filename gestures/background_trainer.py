@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from core.config import AppConfig
+from gestures.gesture_predictor import GesturePredictor, LoadedModel
+from gestures.gesture_trainer import GestureTrainer, TrainingCancelled, TrainingReport
+from gestures.model_bundle import load_bundle, manifest_path, onnx_path, promote_bundle, read_manifest
+
+
+STAGE_IDLE = "ocioso"
+STAGE_STARTING = "iniciando"
+STAGE_VALIDATING = "validando"
+STAGE_DONE = "concluido"
+STAGE_CANCELLED = "cancelado"
+STAGE_FAILED = "falhou"
+
+MODE_FULL = "full"
+MODE_INCREMENTAL = "incremental"
+
+
+@dataclass(frozen=True)
+class TrainingProgress:
+    stage: str
+    progress: float
+    running: bool
+    message: str = ""
+    updated_at: float = 0.0
+
+
+def _training_worker(config: AppConfig, events, cancel_event, candidate_path: str, mode: str) -> None:
+    logger = logging.getLogger("gesture_ai.training_worker")
+
+    def _progress(stage: str, fraction: float) -> None:
+        events.put(("progress", stage, fraction))
+
+    try:
+        trainer = GestureTrainer(config, logger=logger)
+        run = trainer.update_incremental if mode == MODE_INCREMENTAL else trainer.train
+        report = run(
+            progress=_progress,
+            should_cancel=cancel_event.is_set,
+            output_path=Path(candidate_path),
+        )
+        events.put(("done", report))
+    except TrainingCancelled:
+        events.put(("cancelled",))
+    except Exception as exc:
+        events.put(("error", f"{exc}\n{traceback.format_exc()}"))
+
+
+class BackgroundTrainer:
+    def __init__(
+        self,
+        config: AppConfig,
+        predictor: GesturePredictor,
+        logger: Optional[logging.Logger] = None,
+        cancel_grace_sec: float = 1.0,
+    ) -> None:
+        self.config = config
+        self.predictor = predictor
+        self.logger = logger or logging.getLogger("gesture_ai")
+        self.cancel_grace_sec = max(0.1, cancel_grace_sec)
+
+        self._ctx = mp.get_context("spawn")
+        self._process = None
+        self._events = None
+        self._cancel_event = None
+        self._monitor: Optional[threading.Thread] = None
+        self._status = TrainingProgress(stage=STAGE_IDLE, progress=0.0, running=False)
+        self.last_report: Optional[TrainingReport] = None
+
+    @property
+    def status(self) -> TrainingProgress:
+        return self._status
+
+    @property
+    def is_running(self) -> bool:
+        return self._status.running
+
+    @property
+    def candidate_path(self) -> Path:
+        model_path = self.config.model_path
+        return model_path.with_name(f"{model_path.stem}.candidate{model_path.suffix}")
+
+    def start(self, mode: str = MODE_FULL) -> bool:
+        if mode not in (MODE_FULL, MODE_INCREMENTAL):
+            raise ValueError(f"Modo de treino '{mode}' nao suportado.")
+        if self.is_running:
+            self.logger.info("Treino em andamento (%s).", self._status.stage)
+            return False
+
+        self._events = self._ctx.Queue()
+        self._cancel_event = self._ctx.Event()
+        self._process = self._ctx.Process(
+            target=_training_worker,
+            args=(self.config, self._events, self._cancel_event, str(self.candidate_path), mode),
+            daemon=True,
+        )
+        self._set_status(STAGE_STARTING, 0.0, running=True)
+        self.predictor.pause_auto_reload(True)
+        self._process.start()
+
+        self._monitor = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._monitor.start()
+        self.logger.info("Treino %s iniciado em segundo plano (pid=%s).", mode, self._process.pid)
+        return True
+
+    def cancel(self) -> None:
+        if not self.is_running or self._cancel_event is None:
+            return
+        self._cancel_event.set()
+        self.logger.info("Cancelamento de treino solicitado.")
+
+    def visible_status(self, linger_sec: float = 3.0) -> Optional[TrainingProgress]:
+        status = self._status
+        if status.running:
+            return status
+        if status.stage == STAGE_IDLE:
+            return None
+        if time.perf_counter() - status.updated_at <= linger_sec:
+            return status
+        return None
+
+    def close(self) -> None:
+        self.cancel()
+        if self._monitor and self._monitor.is_alive():
+            self._monitor.join(timeout=self.cancel_grace_sec + 1.0)
+
+    def _monitor_loop(self) -> None:
+        cancel_requested_at: Optional[float] = None
+        outcome = None
+
+        while outcome is None:
+            try:
+                outcome = self._handle_event(self._events.get(timeout=0.1))
+            except queue.Empty:
+                pass
+
+            if outcome is not None:
+                break
+
+            if self._cancel_event.is_set():
+                now = time.perf_counter()
+                if cancel_requested_at is None:
+                    cancel_requested_at = now
+                elif now - cancel_requested_at >= self.cancel_grace_sec and self._process.is_alive():
+                    self._process.terminate()
+                    outcome = ("cancelled",)
+
+            if outcome is None and not self._process.is_alive():
+                try:
+                    outcome = self._handle_event(self._events.get(timeout=0.5))
+                except queue.Empty:
+                    outcome = ("error", f"Processo de treino encerrou (exitcode={self._process.exitcode}).")
+
+        self._process.join(timeout=self.cancel_grace_sec)
+        try:
+            self._finish(outcome)
+        finally:
+            self.predictor.pause_auto_reload(False)
+            self._discard_candidate()
+
+    def _handle_event(self, event):
+        kind = event[0]
+        if kind == "progress":
+            _, stage, fraction = event
+            self._set_status(stage, float(fraction), running=True)
+            return None
+        return event
+
+    def _finish(self, outcome) -> None:
+        kind = outcome[0]
+        if kind == "cancelled":
+            self._set_status(STAGE_CANCELLED, 0.0, running=False)
+            self.logger.info("Treino cancelado; modelo anterior mantido.")
+            return
+        if kind == "error":
+            self._set_status(STAGE_FAILED, 0.0, running=False, message="ver log")
+            self.logger.error("Falha ao treinar modelo em segundo plano:\n%s", outcome[1])
+            return
+
+        report: TrainingReport = outcome[1]
+        self._set_status(STAGE_VALIDATING, 0.95, running=True)
+        try:
+            payload = load_bundle(self.candidate_path, mmap=self.predictor.mmap, verify=True)
+            self._validate_candidate(payload)
+            manifest = read_manifest(self.candidate_path)
+            promote_bundle(self.candidate_path, self.config.model_path)
+            mtime = self.config.model_path.stat().st_mtime
+            self.predictor.swap_model(payload, mtime=mtime, manifest=manifest)
+        except Exception:
+            self._set_status(STAGE_FAILED, 0.0, running=False, message="modelo invalido")
+            self.logger.exception("Modelo treinado rejeitado na validacao.")
+            return
+
+        self.last_report = report
+        self._set_status(STAGE_DONE, 1.0, running=False, message=f"acc={report.accuracy:.3f}")
+        self.logger.info(
+            "Treino concluido | amostras=%s | accuracy=%.4f | precision=%.4f | recall=%.4f",
+            report.samples,
+            report.accuracy,
+            report.precision,
+            report.recall,
+        )
+        self.logger.info("Matriz de confusao:\n%s", report.confusion_matrix)
+
+    @staticmethod
+    def _validate_candidate(payload) -> None:
+        loaded = LoadedModel.from_payload(payload)
+        if loaded.model is None or not hasattr(loaded.model, "predict_proba"):
+            raise ValueError("Modelo candidato sem predict_proba.")
+        if loaded.feature_count is None:
+            raise ValueError("Modelo candidato sem feature_count.")
+
+        probe = np.zeros((1, loaded.feature_count), dtype=np.float32)
+        probabilities = np.asarray(loaded.model.predict_proba(probe))
+        if probabilities.shape != (1, len(getattr(loaded.model, "classes_", loaded.labels))):
+            raise ValueError(f"Saida inesperada do modelo candidato: shape={probabilities.shape}")
+        if not np.all(np.isfinite(probabilities)):
+            raise ValueError("Modelo candidato produziu probabilidades invalidas.")
+
+    def _discard_candidate(self) -> None:
+        for path in (
+            self.candidate_path,
+            self.candidate_path.with_name(f"{self.candidate_path.name}.tmp"),
+            manifest_path(self.candidate_path),
+            onnx_path(self.candidate_path),
+        ):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self.logger.warning("Nao foi possivel remover %s", path)
+
+    def _set_status(self, stage: str, progress: float, running: bool, message: str = "") -> None:
+        self._status = TrainingProgress(
+            stage=stage,
+            progress=max(0.0, min(1.0, progress)),
+            running=running,
+            message=message,
+            updated_at=time.perf_counter(),
+        )
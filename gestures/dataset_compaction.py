@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+
+from core.config import AppConfig
+from gestures.feature_cache import featurize_rows
+from gestures.gesture_classifier import build_classifier
+from gestures.gesture_dataset import GestureDataset
+from vision.landmark_processor import LandmarkProcessor
+
+
+class _LabelIndex:
+    def __init__(self, feature_count: int) -> None:
+        self.cells: Dict[int, List[int]] = {}
+        self.vectors = np.empty((64, feature_count), dtype=np.float32)
+        self.size = 0
+
+    def add(self, vector: np.ndarray, cell: int) -> None:
+        if self.size == self.vectors.shape[0]:
+            grown = np.empty((self.size * 2, self.vectors.shape[1]), dtype=np.float32)
+            grown[: self.size] = self.vectors
+            self.vectors = grown
+        self.vectors[self.size] = vector
+        self.cells.setdefault(cell, []).append(self.size)
+        self.size += 1
+
+
+class NearDuplicateFilter:
+    """Greedy per-label filter that drops samples close to an already kept one.
+
+    Kept samples are bucketed on a grid over a random orthonormal projection.
+    Projection never increases distances, so every neighbour within ``radius``
+    lies in one of the adjacent cells and only those are checked exactly.
+    """
+
+    def __init__(self, radius: float, projection_dims: int = 3, seed: int = 0) -> None:
+        if radius <= 0:
+            raise ValueError("radius deve ser positivo.")
+        self.radius = float(radius)
+        self.projection_dims = max(1, projection_dims)
+        self.seed = seed
+        self._radius_sq = self.radius * self.radius
+        self._projection: Optional[np.ndarray] = None
+        self._bits = 62 // self.projection_dims
+        weights = np.array([1 << (self._bits * dim) for dim in range(self.projection_dims)], dtype=np.int64)
+        offsets = np.array(list(itertools.product((-1, 0, 1), repeat=self.projection_dims)), dtype=np.int64)
+        self._weights = weights
+        self._neighbour_offsets = offsets @ weights
+        self._indexes: Dict[str, _LabelIndex] = {}
+        self._last_kept: Dict[str, np.ndarray] = {}
+
+    @property
+    def kept_counts(self) -> Dict[str, int]:
+        return {label: index.size for label, index in self._indexes.items()}
+
+    def reset(self) -> None:
+        self._indexes.clear()
+        self._last_kept.clear()
+
+    def accept(self, features, label: str) -> bool:
+        vector = np.asarray(features, dtype=np.float32).flatten()
+        cell = int(self._cells(vector.reshape(1, -1))[0])
+        return self._accept(vector, str(label), cell)
+
+    def filter_batch(self, x, y) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float32)
+        labels = np.asarray(y).astype(str)
+        keep = np.zeros(x.shape[0], dtype=bool)
+        if x.shape[0] == 0:
+            return keep
+
+        cells = self._cells(x).tolist()
+        for row in range(x.shape[0]):
+            keep[row] = self._accept(x[row], labels[row], cells[row])
+        return keep
+
+    def _cells(self, x: np.ndarray) -> np.ndarray:
+        if self._projection is None or self._projection.shape[0] != x.shape[1]:
+            rng = np.random.default_rng(self.seed)
+            basis, _ = np.linalg.qr(rng.normal(size=(x.shape[1], self.projection_dims)))
+            self._projection = basis.astype(np.float32)
+            self.reset()
+        limit = (1 << (self._bits - 1)) - 2
+        cells = np.floor((x @ self._projection) / self.radius).astype(np.int64)
+        cells = np.clip(cells, -limit, limit) + (1 << (self._bits - 1))
+        return cells @ self._weights
+
+    def _accept(self, vector: np.ndarray, label: str, cell: int) -> bool:
+        last = self._last_kept.get(label)
+        if last is not None and float(np.sum(np.square(last - vector))) <= self._radius_sq:
+            return False
+
+        index = self._indexes.get(label)
+        if index is None:
+            index = self._indexes[label] = _LabelIndex(vector.size)
+        else:
+            candidates: List[int] = []
+            for key in (self._neighbour_offsets + cell).tolist():
+                bucket = index.cells.get(key)
+                if bucket:
+                    candidates.extend(bucket)
+            if candidates:
+                diff = index.vectors[candidates] - vector
+                if bool((np.einsum("ij,ij->i", diff, diff) <= self._radius_sq).any()):
+                    return False
+
+        index.add(vector, cell)
+        self._last_kept[label] = vector.copy()
+        return True
+
+
+@dataclass
+class CompactionReport:
+    rows_before: int
+    rows_after: int
+    labels_before: Dict[str, int]
+    labels_after: Dict[str, int]
+    duration_sec: float
+
+    @property
+    def removed_ratio(self) -> float:
+        return 1.0 - self.rows_after / max(1, self.rows_before)
+
+
+@dataclass
+class CompactionEvaluation:
+    train_rows_full: int
+    train_rows_compacted: int
+    fit_sec_full: float
+    fit_sec_compacted: float
+    accuracy_full: float
+    accuracy_compacted: float
+
+
+def _feature_matrix(dataset: GestureDataset) -> Tuple[np.ndarray, np.ndarray]:
+    """Features of every row in file order, rebuilt from the landmarks like ``FeatureCache`` does.
+
+    Raw landmark columns are not part of the result, and rows whose stored
+    features went stale after a layout change get their current features back.
+    Rows that cannot be rebuilt are NaN.
+    """
+    if dataset.index().landmark_count == 0:
+        return dataset.load_arrays()
+    stored, y, points = dataset.load_arrays(landmarks=True)
+    return featurize_rows(LandmarkProcessor(), points, stored), y
+
+
+def _filter_rows(x: np.ndarray, y: np.ndarray, radius: float) -> np.ndarray:
+    """Near-duplicate mask over ``x``; rows without usable features are left alone."""
+    finite = np.isfinite(x).all(axis=1)
+    keep = np.ones(len(y), dtype=bool)
+    keep[finite] = NearDuplicateFilter(radius).filter_batch(x[finite], y[finite])
+    return keep
+
+
+def _label_counts(labels: np.ndarray) -> Dict[str, int]:
+    values, counts = np.unique(labels, return_counts=True)
+    return {str(v): int(c) for v, c in zip(values, counts)}
+
+
+def compact_dataset(
+    dataset_path: Path,
+    radius: float,
+    output_path: Optional[Path] = None,
+    dry_run: bool = False,
+) -> CompactionReport:
+    start = time.perf_counter()
+    dataset = GestureDataset(dataset_path)
+    df = dataset.load_dataframe()
+    if "label" not in df.columns:
+        raise ValueError("Dataset invalido: coluna 'label' nao encontrada.")
+    x, y = _feature_matrix(dataset)
+    if len(y) != len(df):
+        raise ValueError("Dataset invalido: indice fora de sincronia com o CSV.")
+    keep = _filter_rows(x, y, radius)
+
+    report = CompactionReport(
+        rows_before=int(len(y)),
+        rows_after=int(keep.sum()),
+        labels_before=_label_counts(y),
+        labels_after=_label_counts(y[keep]),
+        duration_sec=time.perf_counter() - start,
+    )
+    if dry_run:
+        return report
+
+    target = Path(output_path) if output_path is not None else Path(dataset_path)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    df[keep].to_csv(tmp_path, index=False)
+    if target == Path(dataset_path):
+        os.replace(target, target.with_name(f"{target.name}.bak"))
+    os.replace(tmp_path, target)
+    GestureDataset(target).invalidate_index()
+    return report
+
+
+def evaluate_compaction(config: AppConfig, radius: float) -> CompactionEvaluation:
+    x, y = _feature_matrix(GestureDataset(config.dataset_path))
+    finite = np.isfinite(x).all(axis=1)
+    x, y = x[finite], y[finite]
+    stratify = y if min(_label_counts(y).values()) >= 2 else None
+    x_train, x_test, y_train, y_test = train_test_split(
+        x,
+        y,
+        test_size=config.test_size,
+        random_state=config.random_state,
+        stratify=stratify,
+    )
+    keep = NearDuplicateFilter(radius).filter_batch(x_train, y_train)
+
+    results = []
+    for features, labels in ((x_train, y_train), (x_train[keep], y_train[keep])):
+        model = build_classifier(config.classifier_type, config.random_state, config.classifier_params)
+        start = time.perf_counter()
+        model.fit(features, labels)
+        elapsed = time.perf_counter() - start
+        results.append((elapsed, float(accuracy_score(y_test, model.predict(x_test)))))
+
+    return CompactionEvaluation(
+        train_rows_full=int(len(y_train)),
+        train_rows_compacted=int(keep.sum()),
+        fit_sec_full=results[0][0],
+        fit_sec_compacted=results[1][0],
+        accuracy_full=results[0][1],
+        accuracy_compacted=results[1][1],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Remove amostras quase duplicadas do dataset")
+    parser.add_argument("--radius", type=float, default=0.1, help="Distancia minima entre amostras do mesmo gesto")
+    parser.add_argument("--output", type=Path, default=None, help="Destino (padrao: sobrescreve com backup .bak)")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--evaluate", action="store_true", help="Compara tempo de treino e accuracy antes/depois")
+    args = parser.parse_args()
+
+    config = AppConfig.from_env()
+    logger = logging.getLogger("gesture_ai")
+
+    if args.evaluate:
+        evaluation = evaluate_compaction(config, args.radius)
+        print(
+            f"treino: {evaluation.train_rows_full} -> {evaluation.train_rows_compacted} linhas | "
+            f"fit {evaluation.fit_sec_full:.2f}s -> {evaluation.fit_sec_compacted:.2f}s | "
+            f"accuracy {evaluation.accuracy_full:.4f} -> {evaluation.accuracy_compacted:.4f}"
+        )
+
+    report = compact_dataset(config.dataset_path, args.radius, output_path=args.output, dry_run=args.dry_run)
+    print(
+        f"{report.rows_before} -> {report.rows_after} linhas "
+        f"({report.removed_ratio * 100:.1f}% removidas) em {report.duration_sec:.2f}s"
+    )
+    for label, before in sorted(report.labels_before.items()):
+        print(f"  {label:20s} {before:7d} -> {report.labels_after.get(label, 0):7d}")
+    if not args.dry_run:
+        logger.info("Dataset compactado salvo em %s", args.output or config.dataset_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from gestures.gesture_dataset import DatasetIndex, GestureDataset
+from utils.npy_store import load_npy, save_npy_atomic
+from vision.landmark_processor import LandmarkProcessor
+
+
+CACHE_CHUNK_ROWS = 4096
+STORED_FEATURES_TAG = "csv"
+
+
+class FeatureCache:
+    """Per-chunk ``.npy`` cache of labels, raw landmarks and feature matrices.
+
+    Chunks are keyed by dataset generation and row range. Feature matrices are
+    also keyed by the ``LandmarkProcessor`` schema hash, so a new feature layout
+    is recomputed once from the cached landmarks instead of re-collecting.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        processor: Optional[LandmarkProcessor] = None,
+        chunk_rows: int = CACHE_CHUNK_ROWS,
+    ) -> None:
+        self.root = Path(root)
+        self.processor = processor or LandmarkProcessor()
+        self.chunk_rows = max(1, chunk_rows)
+        self.schema = self.processor.feature_schema()
+
+    @property
+    def schema_hash(self) -> str:
+        return str(self.schema["hash"])
+
+    def directory(self, dataset: GestureDataset, index: DatasetIndex) -> Path:
+        return self.root / f"{dataset.csv_path.stem}_{index.generation}"
+
+    def prune(self, dataset: GestureDataset) -> None:
+        keep = self.directory(dataset, dataset.index())
+        if not self.root.exists():
+            return
+        for path in self.root.glob(f"{dataset.csv_path.stem}_*"):
+            if path != keep and path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+
+    def iter_chunks(
+        self,
+        dataset: GestureDataset,
+        start_row: int = 0,
+        stop_row: Optional[int] = None,
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        index = dataset.index()
+        stop = index.rows if stop_row is None else min(stop_row, index.rows)
+        for chunk_idx in range(start_row // self.chunk_rows, -(-stop // self.chunk_rows)):
+            chunk_start = chunk_idx * self.chunk_rows
+            x, y, _ = self._chunk(dataset, index, chunk_idx, landmarks=False)
+            lo = max(start_row, chunk_start) - chunk_start
+            hi = min(stop, chunk_start + len(y)) - chunk_start
+            x, y = np.asarray(x[lo:hi]), np.asarray(y[lo:hi])
+            finite = np.isfinite(x).all(axis=1)
+            yield x[finite], y[finite]
+
+    def take(
+        self,
+        dataset: GestureDataset,
+        rows: Optional[np.ndarray] = None,
+        stop_row: Optional[int] = None,
+        landmarks: bool = False,
+    ) -> Tuple[np.ndarray, ...]:
+        index = dataset.index()
+        stop = index.rows if stop_row is None else min(stop_row, index.rows)
+        if rows is None:
+            rows = np.arange(stop, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        rows = rows[rows < stop]
+
+        feature_count = int(self.schema["feature_count"]) if index.landmark_count else index.feature_count
+        x = np.empty((rows.size, feature_count), dtype=np.float32)
+        y = np.empty(rows.size, dtype=object)
+        points = np.empty((rows.size, index.landmark_count if landmarks else 0), dtype=np.float32)
+
+        chunk_ids = rows // self.chunk_rows
+        for chunk_idx in np.unique(chunk_ids).tolist():
+            mask = chunk_ids == chunk_idx
+            local = rows[mask] - chunk_idx * self.chunk_rows
+            chunk_x, chunk_y, chunk_points = self._chunk(dataset, index, chunk_idx, landmarks)
+            x[mask] = chunk_x[local]
+            y[mask] = chunk_y[local]
+            if landmarks:
+                points[mask] = chunk_points[local]
+
+        finite = np.isfinite(x).all(axis=1)
+        arrays = (x[finite], y[finite].astype(str))
+        return arrays + (points[finite],) if landmarks else arrays
+
+    def _chunk(
+        self,
+        dataset: GestureDataset,
+        index: DatasetIndex,
+        chunk_idx: int,
+        landmarks: bool,
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        start = chunk_idx * self.chunk_rows
+        rows = min(self.chunk_rows, index.rows - start)
+        folder = self.directory(dataset, index)
+        base = f"{start:010d}_{rows}"
+        paths: Dict[str, Path] = {
+            "labels": folder / f"{base}.labels.npy",
+            "stored": folder / f"{base}.{STORED_FEATURES_TAG}.features.npy",
+            "landmarks": folder / f"{base}.landmarks.npy",
+            "features": folder / f"{base}.{self.schema_hash}.features.npy",
+        }
+        has_landmarks = index.landmark_count > 0
+
+        if not paths["labels"].exists():
+            folder.mkdir(parents=True, exist_ok=True)
+            for stale in folder.glob(f"{start:010d}_*"):
+                stale.unlink(missing_ok=True)
+            arrays = dataset.load_arrays(start, start + rows, landmarks=has_landmarks)
+            save_npy_atomic(paths["stored"], arrays[0])
+            if has_landmarks:
+                save_npy_atomic(paths["landmarks"], arrays[2])
+            save_npy_atomic(paths["labels"], arrays[1])
+
+        if not has_landmarks:
+            return load_npy(paths["stored"]), load_npy(paths["labels"]), None
+
+        if not paths["features"].exists():
+            features = featurize_rows(self.processor, load_npy(paths["landmarks"]), load_npy(paths["stored"]))
+            save_npy_atomic(paths["features"], features)
+        points = load_npy(paths["landmarks"]) if landmarks else None
+        return load_npy(paths["features"]), load_npy(paths["labels"]), points
+
+
+def featurize_rows(processor: LandmarkProcessor, points: np.ndarray, stored: np.ndarray) -> np.ndarray:
+    """Features in ``processor``'s schema for each row, NaN where they cannot be rebuilt."""
+    feature_count = processor.feature_count()
+    features = np.full((points.shape[0], feature_count), np.nan, dtype=np.float32)
+    valid = np.isfinite(points).all(axis=1)
+    if valid.any():
+        features[valid] = processor.build_feature_batch(points[valid].reshape(-1, 21, 3))
+    # Rows collected before landmarks were stored keep their CSV features
+    # only while the layout size still matches; otherwise they are dropped.
+    if stored.shape[1] == feature_count:
+        features[~valid] = stored[~valid]
+    return features
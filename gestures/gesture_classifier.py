@@ -1,65 +1,82 @@
 from __future__ import annotations
 
+from typing import Any, Dict, Optional
+
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.neural_network import MLPClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVC
 
+from gestures.prototype_classifier import PrototypeClassifier
 
-def build_classifier(classifier_type: str, random_state: int = 42):
-    classifier_type = (classifier_type or "random_forest").strip().lower()
 
-    if classifier_type == "random_forest":
-        return Pipeline(
-            [
-                ("scaler", StandardScaler()),
-                (
-                    "classifier",
-                    RandomForestClassifier(
-                        n_estimators=320,
-                        random_state=random_state,
-                        n_jobs=-1,
-                        class_weight="balanced_subsample",
-                    ),
-                ),
-            ]
-        )
+DEFAULT_PARAMS: Dict[str, Dict[str, Any]] = {
+    "random_forest": {
+        "n_estimators": 320,
+        "n_jobs": -1,
+        "class_weight": "balanced_subsample",
+    },
+    "svm": {
+        "kernel": "rbf",
+        "C": 3.0,
+        "gamma": "scale",
+        "probability": True,
+    },
+    "mlp": {
+        "hidden_layer_sizes": (128, 64),
+        "max_iter": 600,
+        "early_stopping": True,
+    },
+    "prototype": {
+        "temperature": 0.1,
+    },
+}
+
+_ESTIMATORS = {
+    "random_forest": RandomForestClassifier,
+    "svm": SVC,
+    "mlp": MLPClassifier,
+    "prototype": PrototypeClassifier,
+}
 
-    if classifier_type == "svm":
-        return Pipeline(
-            [
-                ("scaler", StandardScaler()),
-                (
-                    "classifier",
-                    SVC(
-                        kernel="rbf",
-                        C=3.0,
-                        gamma="scale",
-                        probability=True,
-                        random_state=random_state,
-                    ),
-                ),
-            ]
-        )
 
-    if classifier_type == "mlp":
-        return Pipeline(
-            [
-                ("scaler", StandardScaler()),
-                (
-                    "classifier",
-                    MLPClassifier(
-                        hidden_layer_sizes=(128, 64),
-                        max_iter=600,
-                        early_stopping=True,
-                        random_state=random_state,
-                    ),
-                ),
-            ]
+def build_estimator(
+    classifier_type: str,
+    random_state: int = 42,
+    params: Optional[Dict[str, Any]] = None,
+):
+    classifier_type = (classifier_type or "random_forest").strip().lower()
+    if classifier_type not in _ESTIMATORS:
+        raise ValueError(
+            f"classifier_type '{classifier_type}' nao suportado. "
+            "Use random_forest, svm, mlp ou prototype."
         )
 
-    raise ValueError(
-        f"classifier_type '{classifier_type}' nao suportado. "
-        "Use random_forest, svm ou mlp."
+    kwargs = dict(DEFAULT_PARAMS[classifier_type])
+    kwargs.update(params or {})
+    if classifier_type != "prototype":
+        kwargs.setdefault("random_state", random_state)
+    if "hidden_layer_sizes" in kwargs:
+        kwargs["hidden_layer_sizes"] = tuple(kwargs["hidden_layer_sizes"])
+    return _ESTIMATORS[classifier_type](**kwargs)
+
+
+def build_classifier(
+    classifier_type: str,
+    random_state: int = 42,
+    params: Optional[Dict[str, Any]] = None,
+):
+    estimator = build_estimator(classifier_type, random_state, params)
+    if isinstance(estimator, PrototypeClassifier):
+        return estimator
+    return Pipeline(
+        [
+            ("scaler", StandardScaler()),
+            ("classifier", estimator),
+        ]
     )
+
+
+def supports_incremental(model) -> bool:
+    return hasattr(model, "partial_fit") and not hasattr(model, "steps")
@@ -1,56 +1,394 @@
 from __future__ import annotations
 
+import bisect
 import csv
+import hashlib
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 
+CHECKPOINT_ROWS = 1024
+INDEX_FLUSH_ROWS = 32
+HEAD_DIGEST_BYTES = 4096
+LANDMARK_PREFIX = "lm_"
+
+
+@dataclass
+class DatasetIndex:
+    columns: List[str]
+    checkpoint_rows: int = CHECKPOINT_ROWS
+    rows: int = 0
+    size_bytes: int = 0
+    head_bytes: int = 0
+    head_digest: str = ""
+    label_counts: Dict[str, int] = field(default_factory=dict)
+    label_runs: Dict[str, List[List[int]]] = field(default_factory=dict)
+    checkpoints: List[List[int]] = field(default_factory=list)
+    generation: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    @property
+    def landmark_count(self) -> int:
+        return sum(1 for name in self.columns if name.startswith(LANDMARK_PREFIX))
+
+    @property
+    def feature_count(self) -> int:
+        return max(0, len(self.columns) - 1 - self.landmark_count)
+
+    def record_row(self, label: str, byte_offset: int) -> None:
+        if self.rows % self.checkpoint_rows == 0:
+            self.checkpoints.append([self.rows, byte_offset])
+        self.label_counts[label] = self.label_counts.get(label, 0) + 1
+        runs = self.label_runs.setdefault(label, [])
+        if runs and runs[-1][1] == self.rows:
+            runs[-1][1] += 1
+        else:
+            runs.append([self.rows, self.rows + 1])
+        self.rows += 1
+
+    def seek_point(self, row: int) -> Tuple[int, int]:
+        if not self.checkpoints:
+            return 0, self.size_bytes
+        position = bisect.bisect_right([cp[0] for cp in self.checkpoints], row) - 1
+        cp_row, offset = self.checkpoints[max(0, position)]
+        return cp_row, offset
+
+    def label_rows(self, label: str) -> np.ndarray:
+        runs = self.label_runs.get(label, [])
+        if not runs:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(start, end, dtype=np.int64) for start, end in runs])
+
+
 class GestureDataset:
-    def __init__(self, csv_path: Path) -> None:
+    def __init__(self, csv_path: Path, checkpoint_rows: int = CHECKPOINT_ROWS) -> None:
         self.csv_path = Path(csv_path)
         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_rows = max(1, checkpoint_rows)
+        self._index: Optional[DatasetIndex] = None
+        self._unsaved_rows = 0
 
-    def _read_feature_count_from_header(self) -> Optional[int]:
+    @property
+    def index_path(self) -> Path:
+        return self.csv_path.with_name(f"{self.csv_path.name}.idx.json")
+
+    def _read_header(self) -> Optional[List[str]]:
         if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
             return None
         with open(self.csv_path, "r", newline="", encoding="utf-8") as fp:
             first = fp.readline().strip()
         if not first:
             return None
-        return max(0, len(first.split(",")) - 1)
+        return first.split(",")
+
+    def _read_feature_count_from_header(self) -> Optional[int]:
+        columns = self._read_header()
+        if columns is None:
+            return None
+        return DatasetIndex(columns=columns).feature_count
 
-    def ensure_schema(self, feature_count: int) -> None:
+    @property
+    def landmark_count(self) -> int:
+        columns = self._read_header()
+        return DatasetIndex(columns=columns).landmark_count if columns else 0
+
+    def ensure_schema(self, feature_count: int, landmark_count: int = 0) -> int:
         existing = self._read_feature_count_from_header()
         if existing is None:
-            header = [f"feature_{idx + 1}" for idx in range(feature_count)] + ["label"]
+            header = (
+                [f"feature_{idx + 1}" for idx in range(feature_count)]
+                + [f"{LANDMARK_PREFIX}{idx + 1}" for idx in range(landmark_count)]
+                + ["label"]
+            )
             with open(self.csv_path, "w", newline="", encoding="utf-8") as fp:
                 writer = csv.writer(fp)
                 writer.writerow(header)
-            return
-        if existing != feature_count:
+            self._index = None
+            return feature_count
+        if existing != feature_count and not (landmark_count and self.landmark_count == landmark_count):
             raise ValueError(
                 f"Schema de dataset inconsistente. Esperado {existing}, recebido {feature_count}."
             )
+        return existing
 
-    def append_sample(self, features, label: str) -> None:
+    def append_sample(self, features, label: str, landmarks=None) -> None:
+        if "\n" in str(label) or "\r" in str(label):
+            # The index counts one row per line.
+            raise ValueError("Label invalido: quebras de linha nao sao permitidas.")
         vector = np.asarray(features, dtype=np.float32).flatten()
-        self.ensure_schema(vector.size)
-        row = vector.tolist() + [label]
+        points = None if landmarks is None else np.asarray(landmarks, dtype=np.float32).flatten()
+        stored_count = self.ensure_schema(vector.size, 0 if points is None else points.size)
+        if stored_count != vector.size:
+            # Features are recomputed from the landmarks, so a layout change
+            # only leaves the stale feature columns empty.
+            vector = np.full(stored_count, np.nan, dtype=np.float32)
+        index = self.index()
+        row = vector.tolist()
+        if index.landmark_count:
+            if points is None or points.size != index.landmark_count:
+                points = np.full(index.landmark_count, np.nan, dtype=np.float32)
+            row += points.tolist()
+        row.append(label)
         with open(self.csv_path, "a", newline="", encoding="utf-8") as fp:
+            offset = fp.tell()
             writer = csv.writer(fp)
             writer.writerow(row)
+            fp.flush()
+            size = os.fstat(fp.fileno()).st_size
 
-    def load_dataframe(self) -> pd.DataFrame:
+        if index.size_bytes != offset:
+            self._index = None
+            return
+        index.record_row(str(label), offset)
+        index.size_bytes = size
+        self._unsaved_rows += 1
+        if self._unsaved_rows >= INDEX_FLUSH_ROWS:
+            self.flush_index()
+
+    def index(self) -> DatasetIndex:
         if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
             raise FileNotFoundError(f"Dataset nao encontrado em {self.csv_path}")
+
+        size = self.csv_path.stat().st_size
+        index = self._index
+        if index is not None and index.size_bytes == size:
+            return index
+
+        if index is None:
+            index = self._load_index_file()
+        if index is not None and (size < index.size_bytes or not self._head_matches(index)):
+            index = None
+
+        if index is None:
+            index = self._build_index()
+        elif index.size_bytes < size:
+            self._scan_rows(index, index.size_bytes)
+
+        self._index = index
+        self.flush_index()
+        return index
+
+    def flush_index(self) -> None:
+        index = self._index
+        if index is None:
+            return
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(asdict(index), fp)
+        os.replace(tmp_path, self.index_path)
+        self._unsaved_rows = 0
+
+    def invalidate_index(self) -> None:
+        self._index = None
+        try:
+            self.index_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load_index_file(self) -> Optional[DatasetIndex]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as fp:
+                index = DatasetIndex(**json.load(fp))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+        return index if index.checkpoint_rows == self.checkpoint_rows else None
+
+    def _head_digest(self, length: int) -> str:
+        with open(self.csv_path, "rb") as fp:
+            return hashlib.sha1(fp.read(length)).hexdigest()
+
+    def _head_matches(self, index: DatasetIndex) -> bool:
+        return index.head_bytes > 0 and self._head_digest(index.head_bytes) == index.head_digest
+
+    def _build_index(self) -> DatasetIndex:
+        with open(self.csv_path, "rb") as fp:
+            header = fp.readline()
+        columns = header.decode("utf-8").strip().split(",")
+        if columns[-1] != "label":
+            raise ValueError("Dataset invalido: coluna 'label' nao encontrada.")
+        head_bytes = min(HEAD_DIGEST_BYTES, self.csv_path.stat().st_size)
+        index = DatasetIndex(
+            columns=columns,
+            checkpoint_rows=self.checkpoint_rows,
+            size_bytes=len(header),
+            head_bytes=head_bytes,
+            head_digest=self._head_digest(head_bytes),
+        )
+        self._scan_rows(index, len(header))
+        return index
+
+    def _scan_rows(self, index: DatasetIndex, start_offset: int) -> None:
+        with open(self.csv_path, "rb") as fp:
+            fp.seek(start_offset)
+            offset = start_offset
+            for line in fp:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    index.record_row(_row_label(line), offset)
+                offset += len(line)
+        index.size_bytes = offset
+
+    def _usecols(self, index: DatasetIndex, landmarks: bool) -> List[str]:
+        features = [name for name in index.columns[:-1] if not name.startswith(LANDMARK_PREFIX)]
+        points = [name for name in index.columns[:-1] if name.startswith(LANDMARK_PREFIX)]
+        return features + (points if landmarks else []) + [index.columns[-1]]
+
+    def iter_chunks(
+        self,
+        chunk_rows: int = 4096,
+        start_row: int = 0,
+        stop_row: Optional[int] = None,
+        landmarks: bool = False,
+    ) -> Iterator[Tuple[np.ndarray, ...]]:
+        index = self.index()
+        stop = index.rows if stop_row is None else min(stop_row, index.rows)
+        if start_row >= stop:
+            return
+        if landmarks and index.landmark_count == 0:
+            raise ValueError("Dataset sem landmarks brutos; colete novamente para usar augmentation.")
+
+        usecols = self._usecols(index, landmarks)
+        dtypes: Dict[str, object] = {name: np.float32 for name in usecols[:-1]}
+        dtypes[usecols[-1]] = str
+        feature_count = index.feature_count
+
+        cp_row, offset = index.seek_point(start_row)
+        with open(self.csv_path, "rb") as fp:
+            fp.seek(offset)
+            reader = pd.read_csv(
+                fp,
+                header=None,
+                names=index.columns,
+                usecols=usecols,
+                dtype=dtypes,
+                skiprows=start_row - cp_row,
+                nrows=stop - start_row,
+                chunksize=max(1, chunk_rows),
+            )
+            for frame in reader:
+                values = frame[usecols[:-1]].to_numpy(dtype=np.float32, copy=False)
+                y = frame[usecols[-1]].to_numpy(dtype=str)
+                if landmarks:
+                    yield values[:, :feature_count], y, values[:, feature_count:]
+                else:
+                    yield values, y
+
+    def load_arrays(
+        self,
+        start_row: int = 0,
+        stop_row: Optional[int] = None,
+        chunk_rows: int = 4096,
+        landmarks: bool = False,
+    ) -> Tuple[np.ndarray, ...]:
+        index = self.index()
+        stop = index.rows if stop_row is None else min(stop_row, index.rows)
+        total = max(0, stop - start_row)
+        width = index.feature_count + (index.landmark_count if landmarks else 0)
+        values = np.empty((total, width), dtype=np.float32)
+        labels: List[np.ndarray] = []
+        filled = 0
+        for chunk in self.iter_chunks(chunk_rows, start_row, stop, landmarks=landmarks):
+            rows = len(chunk[1])
+            values[filled : filled + rows] = np.hstack((chunk[0], chunk[2])) if landmarks else chunk[0]
+            labels.append(chunk[1])
+            filled += rows
+        y = np.concatenate(labels) if labels else np.empty(0, dtype=str)
+        return self._split_values(values[:filled], y, index, landmarks)
+
+    @staticmethod
+    def _split_values(
+        values: np.ndarray,
+        y: np.ndarray,
+        index: DatasetIndex,
+        landmarks: bool,
+    ) -> Tuple[np.ndarray, ...]:
+        if not landmarks:
+            return values, y
+        return values[:, : index.feature_count], y, values[:, index.feature_count :]
+
+    def stratified_sample(
+        self,
+        per_label: int,
+        seed: int = 42,
+        stop_row: Optional[int] = None,
+        landmarks: bool = False,
+    ) -> Tuple[np.ndarray, ...]:
+        index = self.index()
+        stop = index.rows if stop_row is None else min(stop_row, index.rows)
+        selected = self.sample_rows(per_label, seed, stop)
+
+        width = index.feature_count + (index.landmark_count if landmarks else 0)
+        values = np.empty((selected.size, width), dtype=np.float32)
+        y = np.empty(selected.size, dtype=object)
+        filled = 0
+        blocks = np.unique(selected // index.checkpoint_rows)
+        for first, last in _contiguous_ranges(blocks):
+            block_start = int(first * index.checkpoint_rows)
+            block_stop = int(min(stop, (last + 1) * index.checkpoint_rows))
+            wanted = selected[(selected >= block_start) & (selected < block_stop)]
+            cursor = block_start
+            for chunk in self.iter_chunks(4096, block_start, block_stop, landmarks=landmarks):
+                chunk_y = chunk[1]
+                local = wanted[(wanted >= cursor) & (wanted < cursor + len(chunk_y))] - cursor
+                chunk_values = np.hstack((chunk[0], chunk[2])) if landmarks else chunk[0]
+                values[filled : filled + local.size] = chunk_values[local]
+                y[filled : filled + local.size] = chunk_y[local]
+                filled += local.size
+                cursor += len(chunk_y)
+        return self._split_values(values[:filled], y[:filled].astype(str), index, landmarks)
+
+    def sample_rows(self, per_label: int, seed: int = 42, stop_row: Optional[int] = None) -> np.ndarray:
+        index = self.index()
+        stop = index.rows if stop_row is None else min(stop_row, index.rows)
+        rng = np.random.default_rng(seed)
+
+        picks = []
+        for label in sorted(index.label_runs):
+            rows = index.label_rows(label)
+            rows = rows[rows < stop]
+            if rows.size > per_label:
+                rows = rng.choice(rows, size=per_label, replace=False)
+            picks.append(rows)
+        return np.sort(np.concatenate(picks)) if picks else np.empty(0, dtype=np.int64)
+
+    def load_dataframe(self, start_row: int = 0) -> pd.DataFrame:
+        if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
+            raise FileNotFoundError(f"Dataset nao encontrado em {self.csv_path}")
+        if start_row > 0:
+            return pd.read_csv(self.csv_path, skiprows=range(1, start_row + 1))
         return pd.read_csv(self.csv_path)
 
+    def count_rows(self) -> int:
+        if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
+            return 0
+        return self.index().rows
+
     def labels_distribution(self) -> Dict[str, int]:
-        df = self.load_dataframe()
-        if "label" not in df.columns:
-            return {}
-        series = df["label"].value_counts()
-        return {str(idx): int(val) for idx, val in series.items()}
+        if not self.csv_path.exists() or self.csv_path.stat().st_size == 0:
+            raise FileNotFoundError(f"Dataset nao encontrado em {self.csv_path}")
+        return dict(self.index().label_counts)
+
+
+def _row_label(line: bytes) -> str:
+    """Last field of a CSV row; only labels the writer had to quote go through the csv module."""
+    row = line.rstrip(b"\r\n")
+    if not row.endswith(b'"'):
+        return row.rsplit(b",", 1)[-1].decode("utf-8")
+    return next(csv.reader([row.decode("utf-8")]))[-1]
+
+
+def _contiguous_ranges(values: np.ndarray) -> List[Tuple[int, int]]:
+    ranges: List[Tuple[int, int]] = []
+    for value in values.tolist():
+        if ranges and value == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], value)
+        else:
+            ranges.append((value, value))
+    return ranges
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
-import joblib
 import numpy as np
 
+from gestures.model_bundle import file_checksum, load_bundle, onnx_path, read_manifest
+from gestures.onnx_backend import BACKEND_ONNX, BACKEND_SKLEARN, OnnxClassifier
 from utils.smoothing import TemporalSmoother
 
 
@@ -20,6 +22,31 @@ class PredictionResult:
     raw_confidence: float
 
 
+@dataclass(frozen=True)
+class LoadedModel:
+    model: object
+    labels: list[str]
+    feature_count: Optional[int]
+    feature_schema: Optional[str] = None
+
+    @classmethod
+    def from_payload(cls, payload) -> "LoadedModel":
+        if isinstance(payload, dict) and "model" in payload:
+            feature_count = payload.get("feature_count")
+            schema = payload.get("feature_schema") or {}
+            return cls(
+                model=payload.get("model"),
+                labels=[str(v) for v in payload.get("labels", [])],
+                feature_count=int(feature_count) if feature_count is not None else None,
+                feature_schema=schema.get("hash"),
+            )
+        return cls(
+            model=payload,
+            labels=[str(v) for v in getattr(payload, "classes_", [])],
+            feature_count=None,
+        )
+
+
 class GesturePredictor:
     def __init__(
         self,
@@ -28,70 +55,147 @@ class GesturePredictor:
         smoothing_window: int = 5,
         auto_reload_sec: float = 1.0,
         logger: Optional[logging.Logger] = None,
+        feature_schema: Optional[str] = None,
+        mmap: bool = True,
+        backend: str = BACKEND_SKLEARN,
+        onnx_threads: int = 1,
     ) -> None:
         self.model_path = Path(model_path)
         self.threshold = threshold
         self.auto_reload_sec = auto_reload_sec
+        self.feature_schema = feature_schema
+        self.mmap = mmap
+        self.backend = backend
+        self.onnx_threads = onnx_threads
+        self.active_backend = BACKEND_SKLEARN
         self.logger = logger or logging.getLogger("gesture_ai")
 
         self.smoother = TemporalSmoother(window_size=smoothing_window)
 
-        self._model = None
-        self._labels: list[str] = []
-        self._feature_count: Optional[int] = None
+        # The active model lives in a single immutable reference, so a swap is
+        # one assignment and predict() never observes a half-updated state.
+        self._loaded: Optional[LoadedModel] = None
         self._last_mtime: Optional[float] = None
+        self._manifest: Optional[dict] = None
         self._last_reload_check = 0.0
+        self._auto_reload_paused = False
+        self._swap_lock = threading.Lock()
+        # The smoother belongs to the predict() thread; a swap only asks it to clear.
+        self._smoother_reset_pending = False
 
         self.reload_model(force=True)
 
+    @property
+    def has_model(self) -> bool:
+        return self._loaded is not None
+
+    @property
+    def feature_count(self) -> Optional[int]:
+        loaded = self._loaded
+        return loaded.feature_count if loaded else None
+
+    @property
+    def manifest(self) -> Optional[dict]:
+        return self._manifest
+
+    def pause_auto_reload(self, paused: bool) -> None:
+        self._auto_reload_paused = paused
+
     def reload_model(self, force: bool = False) -> None:
+        if not force and self._auto_reload_paused:
+            return
+
         now = time.perf_counter()
         if not force and now - self._last_reload_check < self.auto_reload_sec:
             return
         self._last_reload_check = now
 
         if not self.model_path.exists():
-            self._model = None
+            self._loaded = None
             return
 
         mtime = self.model_path.stat().st_mtime
         if not force and self._last_mtime is not None and mtime <= self._last_mtime:
             return
 
-        payload = joblib.load(self.model_path)
-        if isinstance(payload, dict) and "model" in payload:
-            self._model = payload.get("model")
-            self._labels = [str(v) for v in payload.get("labels", [])]
-            feature_count = payload.get("feature_count")
-            self._feature_count = int(feature_count) if feature_count is not None else None
-        else:
-            self._model = payload
-            self._labels = [str(v) for v in getattr(self._model, "classes_", [])]
-            self._feature_count = None
+        manifest = read_manifest(self.model_path)
+        current = self._manifest
+        if (
+            not force
+            and manifest is not None
+            and current is not None
+            and manifest.get("checksum") == current.get("checksum")
+        ):
+            self._last_mtime = mtime
+            return
 
-        self._last_mtime = mtime
-        self.smoother.reset()
-        self.logger.info("Modelo carregado/recarregado: %s", self.model_path)
+        payload = load_bundle(self.model_path, mmap=self.mmap)
+        self.swap_model(payload, mtime=mtime, manifest=manifest)
+
+    def swap_model(self, payload, mtime: Optional[float] = None, manifest: Optional[dict] = None) -> None:
+        loaded = LoadedModel.from_payload(payload)
+        backend = BACKEND_SKLEARN
+        if self.backend == BACKEND_ONNX and loaded.model is not None:
+            onnx_model = self._load_onnx(payload, loaded)
+            if onnx_model is not None:
+                loaded = replace(loaded, model=onnx_model)
+                backend = BACKEND_ONNX
+        mismatch = (
+            self.feature_schema is not None
+            and loaded.feature_schema is not None
+            and loaded.feature_schema != self.feature_schema
+        )
+        with self._swap_lock:
+            self._loaded = None if mismatch else loaded
+            self._manifest = manifest
+            self.active_backend = backend
+            if mtime is not None:
+                self._last_mtime = mtime
+            self._smoother_reset_pending = True
+        if mismatch:
+            self.logger.warning(
+                "Modelo ignorado: schema de features %s difere do atual %s. Re-treine o modelo.",
+                loaded.feature_schema,
+                self.feature_schema,
+            )
+            return
+        self.logger.info("Modelo carregado/recarregado: %s (%s)", self.model_path, backend)
+
+    def _load_onnx(self, payload, loaded: LoadedModel) -> Optional[OnnxClassifier]:
+        info = payload.get("onnx") if isinstance(payload, dict) else None
+        path = onnx_path(self.model_path)
+        if not info or not path.exists():
+            self.logger.warning("Modelo sem exportacao ONNX; usando sklearn.")
+            return None
+        try:
+            if file_checksum(path) != info.get("checksum"):
+                raise ValueError("checksum ONNX nao confere com o bundle")
+            classes = getattr(loaded.model, "classes_", loaded.labels)
+            return OnnxClassifier(path, classes, threads=self.onnx_threads)
+        except Exception as exc:
+            self.logger.warning("Backend ONNX indisponivel (%s); usando sklearn.", exc)
+            return None
 
     def predict(self, features) -> Optional[PredictionResult]:
         self.reload_model(force=False)
-        if self._model is None:
+        loaded = self._loaded
+        if loaded is None or loaded.model is None:
             return None
 
         vector = np.asarray(features, dtype=np.float32).flatten()
-        if self._feature_count is not None and vector.size != self._feature_count:
+        if loaded.feature_count is not None and vector.size != loaded.feature_count:
             self.logger.warning(
                 "Feature vector incompativel com modelo. esperado=%s recebido=%s",
-                self._feature_count,
+                loaded.feature_count,
                 vector.size,
             )
             return None
 
-        if not hasattr(self._model, "predict_proba"):
+        if not hasattr(loaded.model, "predict_proba"):
             return None
 
-        probabilities = self._model.predict_proba(vector.reshape(1, -1))[0]
-        classes = [str(v) for v in getattr(self._model, "classes_", self._labels)]
+        probabilities = loaded.model.predict_proba(vector.reshape(1, -1))[0]
+        classes = [str(v) for v in getattr(loaded.model, "classes_", loaded.labels)]
         if not classes:
             return None
 
@@ -100,6 +204,10 @@ class GesturePredictor:
         raw_conf = float(probabilities[best_idx])
 
         filtered_label = raw_label if raw_conf >= self.threshold else "unknown"
+        if self._smoother_reset_pending:
+            with self._swap_lock:
+                self._smoother_reset_pending = False
+            self.smoother.reset()
         smoothed_label, smoothed_conf = self.smoother.update(
             filtered_label,
             raw_conf if filtered_label != "unknown" else 0.0,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
@@ -48,6 +48,11 @@ class GestureOutput:
     toggle_pause: bool
     spin_active: bool
     calibration_active: bool
+    # Per-second rates, to be integrated over elapsed time by the caller.
+    translation_rate: np.ndarray = field(default_factory=lambda: np.zeros(3, dtype=np.float32))
+    scale_rate: float = 0.0
+    # Index fingertip in frame pixels when a held pointing gesture asks to pick an object.
+    select_point_px: Optional[Tuple[int, int]] = None
 
 
 class GestureLatch:
@@ -75,6 +80,10 @@ class GestureLatch:
         return False, held
 
 
+# Rate terms were tuned as per-frame deltas at this camera frame rate.
+RATE_REFERENCE_FPS = 30.0
+
+
 class GestureRecognizer:
     TIP_IDS = [4, 8, 12, 16, 20]
     MID_IDS = [3, 6, 10, 14, 18]
@@ -93,24 +102,30 @@ class GestureRecognizer:
         self._translation_smoother = VectorSmoother(dims=3, alpha=0.35)
         self._rotation_smoother = VectorSmoother(dims=3, alpha=0.3)
         self._scale_smoother = ExponentialSmoother(alpha=0.4)
+        self._translation_rate_smoother = VectorSmoother(dims=3, alpha=0.35)
+        self._scale_rate_smoother = ExponentialSmoother(alpha=0.4)
 
         self._reset_latch = GestureLatch(self.config.reset_hold_sec, cooldown_sec=1.0)
         self._swap_latch = GestureLatch(self.config.swap_hold_sec, cooldown_sec=1.0)
         self._color_latch = GestureLatch(self.config.color_hold_sec, cooldown_sec=0.6)
         self._pause_latch = GestureLatch(0.2, cooldown_sec=self.config.pause_cooldown_sec)
         self._spin_latch = GestureLatch(self.config.spin_hold_sec)
+        self._select_latch = GestureLatch(self.config.select_hold_sec, cooldown_sec=0.8)
 
     def update(self, hands: List[HandState], now: Optional[float] = None) -> GestureOutput:
         timestamp = now or time.perf_counter()
         translation = np.zeros(3, dtype=np.float32)
         rotation = np.zeros(3, dtype=np.float32)
         scale_delta = 0.0
+        translation_rate = np.zeros(3, dtype=np.float32)
+        scale_rate = 0.0
 
         reset = False
         toggle_object = False
         toggle_color = False
         toggle_pause = False
         spin_active = False
+        select_point_px = None
         gesture_name = "idle"
 
         if not hands:
@@ -136,7 +151,7 @@ class GestureRecognizer:
         if primary:
             gesture_name = self._label_primary(primary)
             translation += self._translate_from_palm(primary)
-            translation[2] += self._translate_depth(primary)
+            translation_rate[2] += self._translate_depth(primary) * RATE_REFERENCE_FPS
 
             pinch_delta = self._scale_from_pinch(primary)
             if abs(pinch_delta) > 1e-4:
@@ -172,15 +187,23 @@ class GestureRecognizer:
             if spin_active:
                 gesture_name = "spin"
 
+            select, _ = self._select_latch.update(self._is_pointing(primary), timestamp)
+            if select:
+                tip = primary.analysis.points_px[8]
+                select_point_px = (int(tip[0]), int(tip[1]))
+                gesture_name = "select"
+
         if not self.simple_mode and primary and secondary:
             two_hand_scale = self._scale_from_two_hands(primary, secondary)
             if abs(two_hand_scale) > 1e-4:
-                scale_delta += two_hand_scale
+                scale_rate += two_hand_scale * RATE_REFERENCE_FPS
                 gesture_name = "two_hand_scale"
 
         translation = np.array(self._translation_smoother.update(translation), dtype=np.float32)
         rotation = np.array(self._rotation_smoother.update(rotation), dtype=np.float32)
         scale_delta = float(self._scale_smoother.update(scale_delta))
+        translation_rate = np.array(self._translation_rate_smoother.update(translation_rate), dtype=np.float32)
+        scale_rate = float(self._scale_rate_smoother.update(scale_rate))
 
         return GestureOutput(
             gesture_name=gesture_name,
@@ -193,6 +216,9 @@ class GestureRecognizer:
             toggle_pause=toggle_pause,
             spin_active=spin_active,
             calibration_active=calibration_active,
+            translation_rate=translation_rate,
+            scale_rate=scale_rate,
+            select_point_px=select_point_px,
         )
 
     def _select_primary(self, hands: List[HandState]) -> HandState:
@@ -327,6 +353,8 @@ class GestureRecognizer:
             return "two_fingers"
         if self._is_open_palm(hand):
             return "open_palm"
+        if self._is_pointing(hand):
+            return "point"
         if self._is_fist(hand):
             return "fist"
         if self._is_v_sign(hand):
@@ -337,7 +365,11 @@ class GestureRecognizer:
         return hand.fingers.extended_count >= 4
 
     def _is_fist(self, hand: HandState) -> bool:
-        return hand.fingers.extended_count <= 1 and not hand.fingers.thumb
+        return hand.fingers.extended_count <= 1 and not hand.fingers.thumb and not hand.fingers.index
+
+    def _is_pointing(self, hand: HandState) -> bool:
+        fingers = hand.fingers
+        return fingers.index and not (fingers.thumb or fingers.middle or fingers.ring or fingers.pinky)
 
     def _is_pinch(self, hand: HandState) -> bool:
         return hand.analysis.pinch_distance < 0.18
@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
 
-import joblib
 import numpy as np
 import pandas as pd
 from sklearn.metrics import accuracy_score, confusion_matrix, precision_score, recall_score
 from sklearn.model_selection import train_test_split
 
 from core.config import AppConfig
-from gestures.gesture_classifier import build_classifier
+from gestures.augmentation import LandmarkAugmenter, augmented_batches
+from gestures.feature_cache import FeatureCache
+from gestures.gesture_classifier import build_classifier, supports_incremental
 from gestures.gesture_dataset import GestureDataset
+from gestures.model_bundle import file_checksum, load_bundle, measure_latency, onnx_path, save_bundle
+from gestures.onnx_backend import BACKEND_ONNX, export_onnx, onnx_available
+
+
+ProgressCallback = Callable[[str, float], None]
+CancelCheck = Callable[[], bool]
+
+
+class TrainingCancelled(RuntimeError):
+    pass
 
 
 @dataclass
@@ -29,16 +42,37 @@ class GestureTrainer:
         self.config = config
         self.logger = logger
         self.dataset = GestureDataset(self.config.dataset_path)
+        self.feature_cache = FeatureCache(self.config.feature_cache_dir)
+
+    def train(
+        self,
+        progress: Optional[ProgressCallback] = None,
+        should_cancel: Optional[CancelCheck] = None,
+        output_path: Optional[Path] = None,
+    ) -> TrainingReport:
+        _stage = self._stage_reporter(progress, should_cancel)
 
-    def train(self) -> TrainingReport:
-        df = self.dataset.load_dataframe()
-        if "label" not in df.columns:
-            raise ValueError("Dataset invalido: coluna 'label' nao encontrada.")
-        if len(df.index) < 20:
+        _stage("carregando", 0.05)
+        dataset_rows = self.dataset.count_rows()
+        if dataset_rows < 20:
             raise ValueError("Dataset insuficiente para treino. Colete ao menos 20 amostras.")
 
-        y = df["label"].astype(str).values
-        x = df.drop(columns=["label"]).astype(np.float32).values
+        index = self.dataset.index()
+        has_landmarks = index.landmark_count > 0
+        augment = self.config.augment_copies > 0 and has_landmarks
+        if self.config.augment_copies > 0 and not augment:
+            self.logger.warning("Dataset sem landmarks brutos; augmentation desativada.")
+        rows = None
+        if self.config.max_samples_per_label > 0:
+            rows = self.dataset.sample_rows(
+                self.config.max_samples_per_label,
+                seed=self.config.random_state,
+                stop_row=dataset_rows,
+            )
+        arrays = self.feature_cache.take(self.dataset, rows, stop_row=dataset_rows, landmarks=augment)
+        self.feature_cache.prune(self.dataset)
+        x, y = arrays[0], arrays[1]
+        landmarks = arrays[2] if augment else np.empty((len(y), 0), dtype=np.float32)
         unique_labels = sorted(pd.Series(y).unique().tolist())
         if len(unique_labels) < 2:
             raise ValueError("Treino requer ao menos 2 classes de gesto.")
@@ -48,17 +82,31 @@ class GestureTrainer:
         if (class_counts < 2).any():
             stratify = None
 
-        x_train, x_test, y_train, y_test = train_test_split(
+        _stage("dividindo", 0.15)
+        x_train, x_test, y_train, y_test, lm_train, _ = train_test_split(
             x,
             y,
+            landmarks,
             test_size=self.config.test_size,
             random_state=self.config.random_state,
             stratify=stratify,
         )
 
-        model = build_classifier(self.config.classifier_type, self.config.random_state)
-        model.fit(x_train, y_train)
+        model = build_classifier(
+            self.config.classifier_type,
+            self.config.random_state,
+            self.config.classifier_params,
+        )
+        _stage("treinando", 0.25)
+        if augment:
+            self._fit_augmented(model, x_train, y_train, lm_train, _stage)
+        else:
+            model.fit(x_train, y_train)
+
+        _stage("avaliando", 0.8)
         y_pred = model.predict(x_test)
+        if supports_incremental(model):
+            model.partial_fit(x_test, y_test)
 
         acc = float(accuracy_score(y_test, y_pred))
         precision = float(precision_score(y_test, y_pred, average="weighted", zero_division=0))
@@ -71,15 +119,202 @@ class GestureTrainer:
             "labels": labels,
             "feature_count": int(x.shape[1]),
             "classifier_type": self.config.classifier_type,
+            "classifier_params": dict(self.config.classifier_params),
+            "dataset_offset": int(dataset_rows),
+            # ``dataset_offset`` only means something for this version of the CSV.
+            "dataset_generation": index.generation,
+            "augment_copies": self.config.augment_copies if augment else 0,
+            "feature_schema": dict(self.feature_cache.schema) if has_landmarks else None,
+            "metrics": _metrics(acc, precision, recall, len(y_test)),
+            "latency": measure_latency(model, x_test),
         }
-        joblib.dump(bundle, self.config.model_path)
+        _stage("salvando", 0.9)
+        target = Path(output_path) if output_path is not None else self.config.model_path
+        bundle["onnx"] = self._export_onnx(model, int(x.shape[1]), target)
+        save_bundle(bundle, target)
 
-        self.logger.info("Modelo salvo em %s", self.config.model_path)
+        self.logger.info("Modelo salvo em %s", target)
         return TrainingReport(
             accuracy=acc,
             precision=precision,
             recall=recall,
             confusion_matrix=cm,
             labels=labels,
-            samples=len(df.index),
+            samples=int(len(y)),
         )
+
+    def update_incremental(
+        self,
+        progress: Optional[ProgressCallback] = None,
+        should_cancel: Optional[CancelCheck] = None,
+        output_path: Optional[Path] = None,
+    ) -> TrainingReport:
+        _stage = self._stage_reporter(progress, should_cancel)
+
+        _stage("carregando", 0.05)
+        if not self.config.model_path.exists():
+            raise FileNotFoundError("Nenhum modelo treinado encontrado. Execute um treino completo.")
+        bundle = load_bundle(self.config.model_path, mmap=False)
+        model = bundle.get("model") if isinstance(bundle, dict) else None
+        if model is None or not supports_incremental(model):
+            raise ValueError("Modelo atual nao suporta atualizacao incremental. Use classifier_type=prototype.")
+
+        offset = int(bundle.get("dataset_offset", 0))
+        total_rows = self.dataset.count_rows()
+        index = self.dataset.index()
+        generation = bundle.get("dataset_generation")
+        if generation and generation != index.generation:
+            raise ValueError(
+                "Dataset foi reescrito desde o ultimo treino (ex.: compactacao). Execute um treino completo."
+            )
+        if offset > total_rows:
+            raise ValueError(
+                f"Dataset tem {total_rows} linhas mas o modelo consumiu {offset}. Execute um treino completo."
+            )
+        if offset == total_rows:
+            raise ValueError("Nenhuma amostra nova desde o ultimo treino.")
+
+        schema = bundle.get("feature_schema")
+        if schema and schema.get("hash") != self.feature_cache.schema_hash:
+            raise ValueError("Schema de features mudou desde o ultimo treino. Execute um treino completo.")
+
+        feature_count = bundle.get("feature_count")
+        dataset_features = int(self.feature_cache.schema["feature_count"]) if index.landmark_count else index.feature_count
+        if feature_count is not None and dataset_features != int(feature_count):
+            raise ValueError(
+                f"Schema de dataset inconsistente. Esperado {feature_count}, recebido {dataset_features}."
+            )
+
+        truth: list[np.ndarray] = []
+        predicted: list[np.ndarray] = []
+        consumed = 0
+        latency_x = None
+        for chunk_x, chunk_y in self.feature_cache.iter_chunks(self.dataset, offset, total_rows):
+            _stage("treinando", 0.1 + 0.8 * consumed / (total_rows - offset))
+            if len(chunk_y):
+                predicted.append(model.predict(chunk_x))
+                truth.append(chunk_y)
+                model.partial_fit(chunk_x, chunk_y)
+                latency_x = chunk_x
+            consumed += len(chunk_y)
+        if not truth:
+            raise ValueError("Nenhuma amostra valida entre as linhas novas do dataset.")
+
+        y = np.concatenate(truth)
+        y_pred = np.concatenate(predicted)
+        acc = float(accuracy_score(y, y_pred))
+        precision = float(precision_score(y, y_pred, average="weighted", zero_division=0))
+        recall = float(recall_score(y, y_pred, average="weighted", zero_division=0))
+        labels = sorted(pd.Series(np.concatenate([y, y_pred])).unique().tolist())
+        cm = confusion_matrix(y, y_pred, labels=labels)
+
+        bundle.update(
+            {
+                "model": model,
+                "labels": [str(v) for v in model.classes_],
+                "feature_count": int(dataset_features),
+                "dataset_offset": int(total_rows),
+                "dataset_generation": index.generation,
+                "metrics": _metrics(acc, precision, recall, len(y)),
+                "latency": measure_latency(model, latency_x),
+            }
+        )
+        _stage("salvando", 0.9)
+        target = Path(output_path) if output_path is not None else self.config.model_path
+        onnx_path(target).unlink(missing_ok=True)
+        bundle["onnx"] = None
+        save_bundle(bundle, target)
+
+        self.logger.info(
+            "Modelo atualizado incrementalmente em %s | linhas %s-%s",
+            target,
+            offset,
+            bundle["dataset_offset"],
+        )
+        return TrainingReport(
+            accuracy=acc,
+            precision=precision,
+            recall=recall,
+            confusion_matrix=cm,
+            labels=labels,
+            samples=consumed,
+        )
+
+    def _fit_augmented(self, model, x_train, y_train, lm_train, _stage: ProgressCallback) -> None:
+        copies = self.config.augment_copies
+        valid = np.isfinite(lm_train).all(axis=1)
+        batches = augmented_batches(
+            lm_train[valid],
+            y_train[valid],
+            copies,
+            augmenter=LandmarkAugmenter(seed=self.config.random_state),
+        )
+        total = int(valid.sum()) * copies
+
+        incremental = supports_incremental(model)
+        if incremental:
+            model.fit(x_train, y_train)
+        else:
+            x_all = np.empty((len(y_train) + total, x_train.shape[1]), dtype=np.float32)
+            y_all = np.empty(len(y_train) + total, dtype=y_train.dtype)
+            x_all[: len(y_train)] = x_train
+            y_all[: len(y_train)] = y_train
+
+        done = 0
+        for batch_x, batch_y in batches:
+            _stage("augmentando", 0.25 + 0.45 * done / max(1, total))
+            if batch_x.shape[1] != x_train.shape[1]:
+                raise ValueError(
+                    f"Features geradas ({batch_x.shape[1]}) nao batem com o dataset ({x_train.shape[1]})."
+                )
+            if incremental:
+                model.partial_fit(batch_x, batch_y)
+            else:
+                offset = len(y_train) + done
+                x_all[offset : offset + len(batch_y)] = batch_x
+                y_all[offset : offset + len(batch_y)] = batch_y
+            done += len(batch_y)
+
+        if not incremental:
+            _stage("treinando", 0.7)
+            model.fit(x_all, y_all)
+
+        self.logger.info(
+            "Augmentation: %s amostras reais + %s sinteticas (%s por amostra)",
+            len(y_train),
+            total,
+            copies,
+        )
+
+    def _export_onnx(self, model, feature_count: int, target: Path) -> Optional[dict]:
+        path = onnx_path(target)
+        path.unlink(missing_ok=True)
+        if self.config.inference_backend != BACKEND_ONNX:
+            return None
+        if not onnx_available():
+            self.logger.warning("skl2onnx/onnxruntime nao instalados; exportacao ONNX ignorada.")
+            return None
+        try:
+            export_onnx(model, feature_count, path)
+        except Exception as exc:
+            self.logger.warning("Exportacao ONNX falhou (%s); predictor usara sklearn.", exc)
+            path.unlink(missing_ok=True)
+            return None
+        return {"file": path.name, "checksum": file_checksum(path)}
+
+    @staticmethod
+    def _stage_reporter(
+        progress: Optional[ProgressCallback],
+        should_cancel: Optional[CancelCheck],
+    ) -> ProgressCallback:
+        def _stage(name: str, fraction: float) -> None:
+            if should_cancel is not None and should_cancel():
+                raise TrainingCancelled(f"Treino cancelado durante '{name}'.")
+            if progress is not None:
+                progress(name, fraction)
+
+        return _stage
+
+
+def _metrics(accuracy: float, precision: float, recall: float, samples: int) -> dict:
+    return {"accuracy": accuracy, "precision": precision, "recall": recall, "evaluated_samples": int(samples)}
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import math
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+
+from core.config import AppConfig
+from gestures.feature_cache import STORED_FEATURES_TAG, FeatureCache
+from gestures.gesture_classifier import build_estimator
+from gestures.gesture_dataset import GestureDataset
+
+
+PARAM_SPACES: Dict[str, Dict[str, Sequence[Any]]] = {
+    "random_forest": {
+        "n_estimators": [80, 160, 320],
+        "max_depth": [None, 16],
+        "min_samples_leaf": [1, 3],
+    },
+    "svm": {
+        "C": [0.5, 1.0, 3.0, 10.0],
+        "gamma": ["scale", 0.01, 0.05],
+    },
+    "mlp": {
+        "hidden_layer_sizes": [(64,), (128, 64), (256, 128)],
+        "alpha": [1e-4, 1e-3],
+    },
+    "prototype": {
+        "temperature": [0.05, 0.1, 0.2],
+    },
+}
+
+LATENCY_SAMPLES = 40
+
+
+def expand_grid(space: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    keys = sorted(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[key] for key in keys))]
+
+
+@dataclass
+class Candidate:
+    classifier_type: str
+    params: Dict[str, Any]
+    fold_scores: Dict[int, float] = field(default_factory=dict)
+    fold_latency_ms: Dict[int, float] = field(default_factory=dict)
+    pareto: bool = False
+
+    @property
+    def mean_accuracy(self) -> float:
+        return float(np.mean(list(self.fold_scores.values()))) if self.fold_scores else 0.0
+
+    @property
+    def std_accuracy(self) -> float:
+        return float(np.std(list(self.fold_scores.values()))) if self.fold_scores else 0.0
+
+    @property
+    def latency_ms(self) -> float:
+        return float(np.median(list(self.fold_latency_ms.values()))) if self.fold_latency_ms else math.inf
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "classifier_type": self.classifier_type,
+            "params": self.params,
+            "folds_evaluated": len(self.fold_scores),
+            "mean_accuracy": self.mean_accuracy,
+            "std_accuracy": self.std_accuracy,
+            "latency_ms_p50": self.latency_ms,
+            "pareto": self.pareto,
+        }
+
+
+@dataclass
+class TuningReport:
+    candidates: List[Candidate]
+    samples: int
+    folds: int
+    duration_sec: float
+    cache_hit: bool
+
+    @property
+    def pareto_front(self) -> List[Candidate]:
+        return sorted((c for c in self.candidates if c.pareto), key=lambda c: c.latency_ms)
+
+    def best(self, classifier_type: Optional[str] = None) -> Optional[Candidate]:
+        pool = [c for c in self.candidates if classifier_type in (None, c.classifier_type)]
+        if not pool:
+            return None
+        most_folds = max(len(c.fold_scores) for c in pool)
+        complete = [c for c in pool if len(c.fold_scores) == most_folds]
+        return max(complete, key=lambda c: (c.mean_accuracy, -c.latency_ms))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "folds": self.folds,
+            "duration_sec": self.duration_sec,
+            "cache_hit": self.cache_hit,
+            "pareto_front": [c.to_dict() for c in self.pareto_front],
+            "candidates": [c.to_dict() for c in self.candidates],
+        }
+
+
+def mark_pareto_front(candidates: Sequence[Candidate], folds: Optional[int] = None) -> None:
+    """Flag the accuracy x latency front among candidates scored on ``folds`` folds (default: the most).
+
+    Candidates dropped early by successive halving are never on the front: a
+    lucky single fold must not hide configurations averaged over every fold.
+    """
+    if not candidates:
+        return
+    folds = max(len(c.fold_scores) for c in candidates) if folds is None else folds
+    best_accuracy = -math.inf
+    for candidate in sorted(candidates, key=lambda c: (c.latency_ms, -c.mean_accuracy)):
+        candidate.pareto = len(candidate.fold_scores) == folds and candidate.mean_accuracy > best_accuracy
+        if candidate.pareto:
+            best_accuracy = candidate.mean_accuracy
+
+
+class FoldCache:
+    def __init__(
+        self,
+        root: Path,
+        dataset_path: Path,
+        folds: int,
+        random_state: int,
+        feature_cache: Optional[FeatureCache] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.dataset_path = Path(dataset_path)
+        self.folds = folds
+        self.random_state = random_state
+        self.feature_cache = feature_cache
+
+    def directory(self) -> Path:
+        digest = hashlib.sha1()
+        with open(self.dataset_path, "rb") as fp:
+            for block in iter(lambda: fp.read(1 << 20), b""):
+                digest.update(block)
+        schema = self.feature_cache.schema_hash if self.feature_cache is not None else STORED_FEATURES_TAG
+        return self.root / f"{digest.hexdigest()[:16]}_{schema}_k{self.folds}_rs{self.random_state}"
+
+    def ensure(self, dataset: GestureDataset) -> Tuple[Path, bool]:
+        fold_dir = self.directory()
+        manifest = fold_dir / "manifest.json"
+        if manifest.exists():
+            return fold_dir, True
+
+        if self.feature_cache is not None:
+            x, y = self.feature_cache.take(dataset)
+        else:
+            x, y = dataset.load_arrays()
+        if np.unique(y).size < 2:
+            raise ValueError("Tuning requer ao menos 2 classes de gesto.")
+
+        splitter = StratifiedKFold(n_splits=self.folds, shuffle=True, random_state=self.random_state)
+        tmp_dir = fold_dir.with_name(f"{fold_dir.name}.tmp{os.getpid()}")
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        for fold_idx, (train_idx, test_idx) in enumerate(splitter.split(x, y)):
+            scaler = StandardScaler().fit(x[train_idx])
+            np.save(tmp_dir / f"fold{fold_idx}_x_train.npy", scaler.transform(x[train_idx]).astype(np.float32))
+            np.save(tmp_dir / f"fold{fold_idx}_x_test.npy", scaler.transform(x[test_idx]).astype(np.float32))
+            np.save(tmp_dir / f"fold{fold_idx}_y_train.npy", y[train_idx])
+            np.save(tmp_dir / f"fold{fold_idx}_y_test.npy", y[test_idx])
+
+        with open(tmp_dir / "manifest.json", "w", encoding="utf-8") as fp:
+            json.dump({"samples": int(len(y)), "folds": self.folds, "random_state": self.random_state}, fp)
+        os.replace(tmp_dir, fold_dir)
+        return fold_dir, False
+
+    @staticmethod
+    def samples(fold_dir: Path) -> int:
+        with open(fold_dir / "manifest.json", "r", encoding="utf-8") as fp:
+            return int(json.load(fp)["samples"])
+
+    @staticmethod
+    def load_fold(fold_dir: Path, fold_idx: int):
+        def _load(name: str):
+            return np.load(fold_dir / f"fold{fold_idx}_{name}.npy", mmap_mode="r")
+
+        return _load("x_train"), _load("y_train"), _load("x_test"), _load("y_test")
+
+
+def _evaluate_fold(task: Tuple[str, int, str, Dict[str, Any], int]) -> Tuple[float, float]:
+    fold_dir, fold_idx, classifier_type, params, random_state = task
+    x_train, y_train, x_test, y_test = FoldCache.load_fold(Path(fold_dir), fold_idx)
+
+    worker_params = dict(params)
+    if classifier_type == "random_forest":
+        worker_params.setdefault("n_jobs", 1)
+    model = build_estimator(classifier_type, random_state, worker_params)
+    model.fit(np.asarray(x_train), np.asarray(y_train))
+    accuracy = float(accuracy_score(np.asarray(y_test), model.predict(np.asarray(x_test))))
+
+    rows = np.asarray(x_test[:LATENCY_SAMPLES])
+    for row in rows[:3]:
+        model.predict_proba(row.reshape(1, -1))
+    timings = []
+    for row in rows:
+        start = time.perf_counter()
+        model.predict_proba(row.reshape(1, -1))
+        timings.append(time.perf_counter() - start)
+    return accuracy, float(np.median(timings) * 1000.0)
+
+
+class GestureTuner:
+    def __init__(
+        self,
+        config: AppConfig,
+        logger: logging.Logger,
+        folds: int = 5,
+        eta: int = 3,
+        workers: Optional[int] = None,
+        halving: bool = True,
+        spaces: Optional[Dict[str, Dict[str, Sequence[Any]]]] = None,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.folds = max(2, folds)
+        self.eta = max(2, eta)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.halving = halving
+        self.spaces = spaces or PARAM_SPACES
+        self.dataset = GestureDataset(self.config.dataset_path)
+        self.fold_cache = FoldCache(
+            self.config.tuning_cache_dir,
+            self.config.dataset_path,
+            self.folds,
+            self.config.random_state,
+            FeatureCache(self.config.feature_cache_dir),
+        )
+
+    def run(self, classifier_types: Sequence[str]) -> TuningReport:
+        start = time.perf_counter()
+        fold_dir, cache_hit = self.fold_cache.ensure(self.dataset)
+        self.logger.info("Folds %s em %s", "reutilizados" if cache_hit else "gerados", fold_dir)
+
+        survivors: Dict[str, List[Candidate]] = {}
+        for classifier_type in classifier_types:
+            if classifier_type not in self.spaces:
+                raise ValueError(f"Sem espaco de parametros para '{classifier_type}'.")
+            survivors[classifier_type] = [
+                Candidate(classifier_type=classifier_type, params=params)
+                for params in expand_grid(self.spaces[classifier_type])
+            ]
+        candidates = [c for group in survivors.values() for c in group]
+
+        n_folds = 1 if self.halving else self.folds
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context("spawn")) as pool:
+            while True:
+                active = [c for group in survivors.values() for c in group]
+                self._evaluate(pool, fold_dir, active, n_folds)
+                self.logger.info("Rodada com %s folds: %s candidatos avaliados", n_folds, len(active))
+                if n_folds >= self.folds:
+                    break
+                for classifier_type, group in survivors.items():
+                    keep = max(1, math.ceil(len(group) / self.eta))
+                    survivors[classifier_type] = sorted(
+                        group,
+                        key=lambda c: (-c.mean_accuracy, c.latency_ms),
+                    )[:keep]
+                n_folds = min(self.folds, n_folds * self.eta)
+
+        mark_pareto_front(candidates, self.folds)
+        return TuningReport(
+            candidates=candidates,
+            samples=FoldCache.samples(fold_dir),
+            folds=self.folds,
+            duration_sec=time.perf_counter() - start,
+            cache_hit=cache_hit,
+        )
+
+    def _evaluate(self, pool, fold_dir: Path, candidates: Sequence[Candidate], n_folds: int) -> None:
+        pending = []
+        for candidate in candidates:
+            for fold_idx in range(n_folds):
+                if fold_idx in candidate.fold_scores:
+                    continue
+                task = (str(fold_dir), fold_idx, candidate.classifier_type, candidate.params, self.config.random_state)
+                pending.append((candidate, fold_idx, pool.submit(_evaluate_fold, task)))
+
+        for candidate, fold_idx, future in pending:
+            accuracy, latency_ms = future.result()
+            candidate.fold_scores[fold_idx] = accuracy
+            candidate.fold_latency_ms[fold_idx] = latency_ms
+
+
+def write_report(report: TuningReport, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(report.to_dict(), fp, indent=2, default=str)
+
+
+def main() -> None:
+    from core.logger import configure_logging
+
+    parser = argparse.ArgumentParser(description="Busca de hiperparametros com validacao cruzada")
+    parser.add_argument("--classifiers", default="random_forest,svm,mlp")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--eta", type=int, default=3, help="Fator de eliminacao do successive halving")
+    parser.add_argument("--workers", type=int, default=0, help="Processos (0 = todos os nucleos)")
+    parser.add_argument("--no-halving", action="store_true")
+    parser.add_argument("--report", type=Path, default=None)
+    args = parser.parse_args()
+
+    config = AppConfig.from_env()
+    config.ensure_paths()
+    logger = configure_logging(config.log_path, config.debug_mode)
+
+    tuner = GestureTuner(
+        config,
+        logger,
+        folds=args.folds,
+        eta=args.eta,
+        workers=args.workers or None,
+        halving=not args.no_halving,
+    )
+    report = tuner.run([name.strip() for name in args.classifiers.split(",") if name.strip()])
+    report_path = args.report or config.model_path.parent / "tuning_report.json"
+    write_report(report, report_path)
+
+    print(f"{report.samples} amostras | {report.folds} folds | {report.duration_sec:.1f}s | cache={report.cache_hit}")
+    print("Fronteira de Pareto (accuracy x latencia):")
+    for candidate in report.pareto_front:
+        print(
+            f"  {candidate.classifier_type:14s} acc={candidate.mean_accuracy:.4f} "
+            f"lat={candidate.latency_ms:7.3f}ms folds={len(candidate.fold_scores)} {candidate.params}"
+        )
+    best = report.best()
+    if best is not None:
+        print(f"Melhor: GESTURE_CLASSIFIER={best.classifier_type} GESTURE_CLASSIFIER_PARAMS='{json.dumps(best.params)}'")
+    print(f"Relatorio: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import joblib
+import numpy as np
+
+
+BUNDLE_FORMAT_VERSION = 2
+# joblib maps every array separately; below this size a plain read is faster.
+MMAP_MIN_BYTES = 64 * 1024 * 1024
+
+
+def manifest_path(model_path: Path) -> Path:
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.name}.manifest.json")
+
+
+def onnx_path(model_path: Path) -> Path:
+    return Path(model_path).with_suffix(".onnx")
+
+
+def file_checksum(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for block in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def measure_latency(model, x: np.ndarray, repeats: int = 50) -> Dict[str, float]:
+    x = np.asarray(x, dtype=np.float32)
+    if x.shape[0] == 0 or not hasattr(model, "predict_proba"):
+        return {}
+    rows = x[np.arange(repeats) % x.shape[0]]
+    model.predict_proba(rows[:1])
+    timings = []
+    for row in rows:
+        start = time.perf_counter()
+        model.predict_proba(row.reshape(1, -1))
+        timings.append((time.perf_counter() - start) * 1000.0)
+    start = time.perf_counter()
+    model.predict_proba(rows)
+    batch_ms = (time.perf_counter() - start) * 1000.0
+    return {
+        "single_p50_ms": float(np.percentile(timings, 50)),
+        "single_p95_ms": float(np.percentile(timings, 95)),
+        "batch_row_ms": batch_ms / len(rows),
+    }
+
+
+def build_manifest(bundle: Dict[str, Any], checksum: str, size_bytes: int) -> Dict[str, Any]:
+    return {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "checksum": checksum,
+        "size_bytes": int(size_bytes),
+        "classifier_type": bundle.get("classifier_type"),
+        "classifier_params": bundle.get("classifier_params", {}),
+        "labels": [str(v) for v in bundle.get("labels", [])],
+        "feature_count": bundle.get("feature_count"),
+        "feature_schema": bundle.get("feature_schema"),
+        "dataset_offset": bundle.get("dataset_offset"),
+        "metrics": bundle.get("metrics", {}),
+        "latency": bundle.get("latency", {}),
+        "onnx": bundle.get("onnx"),
+    }
+
+
+def save_bundle(bundle: Dict[str, Any], target: Path) -> Dict[str, Any]:
+    """Write an uncompressed joblib bundle plus its JSON manifest.
+
+    Uncompressed arrays can be memory-mapped by ``load_bundle``. The manifest is
+    replaced before the model so a reader that sees the new model file always
+    finds its manifest.
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    joblib.dump(bundle, tmp_path, compress=0)
+
+    manifest = build_manifest(bundle, file_checksum(tmp_path), tmp_path.stat().st_size)
+    _write_json_atomic(manifest_path(target), manifest)
+    os.replace(tmp_path, target)
+    return manifest
+
+
+def promote_bundle(source: Path, target: Path) -> None:
+    source_onnx = onnx_path(source)
+    if source_onnx.exists():
+        os.replace(source_onnx, onnx_path(target))
+    else:
+        onnx_path(target).unlink(missing_ok=True)
+    source_manifest = manifest_path(source)
+    if source_manifest.exists():
+        os.replace(source_manifest, manifest_path(target))
+    os.replace(source, target)
+
+
+def read_manifest(model_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(manifest_path(model_path), "r", encoding="utf-8") as fp:
+            manifest = json.load(fp)
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def load_bundle(
+    model_path: Path,
+    mmap: bool = True,
+    verify: bool = False,
+    mmap_min_bytes: int = MMAP_MIN_BYTES,
+):
+    model_path = Path(model_path)
+    if verify:
+        manifest = read_manifest(model_path)
+        if manifest is not None and file_checksum(model_path) != manifest.get("checksum"):
+            raise ValueError(f"Checksum do modelo nao confere com o manifest: {model_path}")
+    use_mmap = mmap and model_path.stat().st_size >= mmap_min_bytes
+    return joblib.load(model_path, mmap_mode="r" if use_mmap else None)
+
+
+def _write_json_atomic(path: Path, payload: Dict[str, Any]) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as fp:
+        json.dump(payload, fp, indent=2, default=str)
+    os.replace(tmp_path, path)
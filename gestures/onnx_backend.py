@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+
+BACKEND_SKLEARN = "sklearn"
+BACKEND_ONNX = "onnx"
+
+
+def onnx_available() -> bool:
+    try:
+        import onnxruntime  # noqa: F401
+        import skl2onnx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def export_onnx(model, feature_count: int, target: Path) -> Path:
+    from skl2onnx import to_onnx
+    from skl2onnx.common.data_types import FloatTensorType
+
+    estimator = model.steps[-1][1] if hasattr(model, "steps") else model
+    onnx_model = to_onnx(
+        model,
+        initial_types=[("input", FloatTensorType([None, int(feature_count)]))],
+        options={id(estimator): {"zipmap": False}},
+    )
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    with open(tmp_path, "wb") as fp:
+        fp.write(onnx_model.SerializeToString())
+    tmp_path.replace(target)
+    return target
+
+
+class OnnxClassifier:
+    """sklearn-like ``predict_proba`` over an onnxruntime CPU session."""
+
+    def __init__(self, path: Path, classes: Sequence[str], threads: int = 1) -> None:
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = max(1, int(threads))
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        self.session = ort.InferenceSession(
+            str(path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.classes_ = np.asarray([str(v) for v in classes])
+        self._input_name = self.session.get_inputs()[0].name
+        outputs = [output.name for output in self.session.get_outputs()]
+        self._proba_name = next((name for name in outputs if "prob" in name), outputs[-1])
+
+    def predict_proba(self, x) -> np.ndarray:
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        return self.session.run([self._proba_name], {self._input_name: x})[0]
+
+    def predict(self, x) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(x), axis=1)]
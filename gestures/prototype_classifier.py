@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+
+
+class PrototypeClassifier(ClassifierMixin, BaseEstimator):
+    """Nearest-class-mean classifier that can absorb new samples and classes.
+
+    Only per-class sums, squared sums and counts are kept, so ``partial_fit``
+    costs O(new samples) and the standardisation statistics stay exact no
+    matter how the data arrived.
+    """
+
+    def __init__(self, temperature: float = 0.1, min_variance: float = 1e-6) -> None:
+        self.temperature = temperature
+        self.min_variance = min_variance
+
+    def fit(self, x, y) -> "PrototypeClassifier":
+        self._sums: Dict[str, np.ndarray] = {}
+        self._squares: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+        return self.partial_fit(x, y)
+
+    def partial_fit(self, x, y, classes: Optional[list] = None) -> "PrototypeClassifier":
+        if not hasattr(self, "_counts"):
+            self._sums, self._squares, self._counts = {}, {}, {}
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y).astype(str)
+        if x.ndim != 2 or x.shape[0] != y.shape[0]:
+            raise ValueError("x deve ser 2D e ter o mesmo numero de linhas que y.")
+        if self._counts and x.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"Numero de features inconsistente. Esperado {self.n_features_in_}, recebido {x.shape[1]}."
+            )
+
+        for label in np.unique(y):
+            rows = x[y == label]
+            if label not in self._counts:
+                self._sums[label] = np.zeros(x.shape[1], dtype=np.float64)
+                self._squares[label] = np.zeros(x.shape[1], dtype=np.float64)
+                self._counts[label] = 0
+            self._sums[label] += rows.sum(axis=0)
+            self._squares[label] += np.square(rows).sum(axis=0)
+            self._counts[label] += int(rows.shape[0])
+
+        self.n_features_in_ = int(x.shape[1])
+        self._refresh()
+        return self
+
+    @property
+    def class_counts(self) -> Dict[str, int]:
+        return dict(getattr(self, "_counts", {}))
+
+    def _refresh(self) -> None:
+        labels = sorted(self._counts)
+        counts = np.array([self._counts[label] for label in labels], dtype=np.float64)
+        sums = np.stack([self._sums[label] for label in labels])
+        squares = np.stack([self._squares[label] for label in labels])
+
+        total = counts.sum()
+        self.mean_ = sums.sum(axis=0) / total
+        variance = squares.sum(axis=0) / total - np.square(self.mean_)
+        self.scale_ = np.sqrt(np.maximum(variance, self.min_variance))
+        self.centroids_ = ((sums / counts[:, None]) - self.mean_) / self.scale_
+        self.classes_ = np.array(labels)
+
+    def predict_proba(self, x) -> np.ndarray:
+        z = (np.asarray(x, dtype=np.float64) - self.mean_) / self.scale_
+        distances = (
+            np.square(z).sum(axis=1)[:, None]
+            - 2.0 * z @ self.centroids_.T
+            + np.square(self.centroids_).sum(axis=1)[None, :]
+        ) / self.n_features_in_
+        logits = -np.maximum(distances, 0.0) / max(self.temperature, 1e-6)
+        logits -= logits.max(axis=1, keepdims=True)
+        weights = np.exp(logits)
+        return weights / weights.sum(axis=1, keepdims=True)
+
+    def predict(self, x) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(x), axis=1)]
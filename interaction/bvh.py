@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+LEAF_SIZE = 4
+
+
+class SphereBVH:
+    """Axis-aligned bounding-volume hierarchy over bounding spheres.
+
+    Built top-down with median splits on the widest axis of the centers.
+    Nodes are kept as plain Python lists because a ray visits a few dozen of
+    them at most, and per-element NumPy access would dominate the query.
+    ``refit`` moves one item and grows/shrinks only the boxes on its path to
+    the root, so transforms do not require a rebuild.
+    """
+
+    def __init__(self, centers: np.ndarray, radii: np.ndarray) -> None:
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+        radii = np.asarray(radii, dtype=np.float64).reshape(-1)
+        if len(centers) != len(radii):
+            raise ValueError("centers e radii devem ter o mesmo tamanho.")
+        self._centers: List[List[float]] = centers.tolist()
+        self._radii: List[float] = radii.tolist()
+        self._lo: List[List[float]] = []
+        self._hi: List[List[float]] = []
+        self._children: List[Optional[Tuple[int, int]]] = []
+        self._items: List[List[int]] = []
+        self._parent: List[int] = []
+        self._axis: List[int] = []
+        self._leaf_of = [0] * len(radii)
+        if len(radii):
+            self._build(centers, radii)
+
+    def __len__(self) -> int:
+        return len(self._radii)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._lo)
+
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Root box as ``(lo, hi)``."""
+        return np.array(self._lo[0]), np.array(self._hi[0])
+
+    def _build(self, centers: np.ndarray, radii: np.ndarray) -> None:
+        lo_all = centers - radii[:, None]
+        hi_all = centers + radii[:, None]
+        stack = [(np.arange(len(radii)), -1, 0)]
+        while stack:
+            items, parent, side = stack.pop()
+            node = len(self._lo)
+            self._lo.append(lo_all[items].min(axis=0).tolist())
+            self._hi.append(hi_all[items].max(axis=0).tolist())
+            self._parent.append(parent)
+            self._children.append(None)
+            self._items.append([])
+            self._axis.append(0)
+            if parent >= 0:
+                left, right = self._children[parent]
+                self._children[parent] = (node, right) if side == 0 else (left, node)
+
+            if len(items) <= LEAF_SIZE:
+                self._items[node] = items.tolist()
+                for item in self._items[node]:
+                    self._leaf_of[item] = node
+                continue
+
+            points = centers[items]
+            axis = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+            mid = len(items) // 2
+            order = np.argpartition(points[:, axis], mid)
+            self._children[node] = (-1, -1)
+            self._axis[node] = axis
+            stack.append((items[order[mid:]], node, 1))
+            stack.append((items[order[:mid]], node, 0))
+
+    def refit(self, index: int, center: Sequence[float], radius: float) -> None:
+        """Move item ``index`` and update the boxes on its path to the root."""
+        self._centers[index] = [float(center[0]), float(center[1]), float(center[2])]
+        self._radii[index] = float(radius)
+        node = self._leaf_of[index]
+        lo, hi = [math.inf] * 3, [-math.inf] * 3
+        for item in self._items[node]:
+            c, r = self._centers[item], self._radii[item]
+            for axis in range(3):
+                lo[axis] = min(lo[axis], c[axis] - r)
+                hi[axis] = max(hi[axis], c[axis] + r)
+        self._lo[node], self._hi[node] = lo, hi
+
+        node = self._parent[node]
+        while node >= 0:
+            left, right = self._children[node]
+            self._lo[node] = [min(a, b) for a, b in zip(self._lo[left], self._lo[right])]
+            self._hi[node] = [max(a, b) for a, b in zip(self._hi[left], self._hi[right])]
+            node = self._parent[node]
+
+    def intersect(
+        self,
+        origin: Sequence[float],
+        direction: Sequence[float],
+        max_distance: float = math.inf,
+    ) -> Optional[Tuple[int, float]]:
+        """Nearest item hit by the ray as ``(index, distance)``, or ``None``.
+
+        ``direction`` must be unit length so distances are in scene units.
+        """
+        if not self._radii:
+            return None
+        ox, oy, oz = (float(v) for v in origin)
+        dx, dy, dz = (float(v) for v in direction)
+        inv = [1.0 / v if abs(v) > 1e-12 else math.copysign(1e12, v) for v in (dx, dy, dz)]
+        o, d = (ox, oy, oz), (dx, dy, dz)
+
+        best: Optional[Tuple[int, float]] = None
+        best_t = max_distance
+        ix, iy, iz = inv
+        lo_nodes, hi_nodes, children_of, axis_of = self._lo, self._hi, self._children, self._axis
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            lo, hi = lo_nodes[node], hi_nodes[node]
+            tx0, tx1 = (lo[0] - ox) * ix, (hi[0] - ox) * ix
+            ty0, ty1 = (lo[1] - oy) * iy, (hi[1] - oy) * iy
+            tz0, tz1 = (lo[2] - oz) * iz, (hi[2] - oz) * iz
+            t_near = max(0.0, min(tx0, tx1), min(ty0, ty1), min(tz0, tz1))
+            t_far = min(best_t, max(tx0, tx1), max(ty0, ty1), max(tz0, tz1))
+            if t_near > t_far:
+                continue
+            children = children_of[node]
+            if children is not None:
+                # Pop the child on the ray's side of the split first so hits prune the other.
+                stack.extend((children[1], children[0]) if d[axis_of[node]] >= 0.0 else children)
+                continue
+            for item in self._items[node]:
+                t = _ray_sphere(o, d, self._centers[item], self._radii[item])
+                if t is not None and t < best_t:
+                    best, best_t = (item, t), t
+        return best
+
+
+def _ray_sphere(origin, direction, center, radius) -> Optional[float]:
+    ox, oy, oz = center[0] - origin[0], center[1] - origin[1], center[2] - origin[2]
+    along = ox * direction[0] + oy * direction[1] + oz * direction[2]
+    off_axis = ox * ox + oy * oy + oz * oz - along * along
+    radius_sq = radius * radius
+    if off_axis > radius_sq:
+        return None
+    half_chord = math.sqrt(radius_sq - off_axis)
+    t = along - half_chord
+    if t < 0.0:
+        t = along + half_chord
+    return t if t >= 0.0 else None
+
+
+def ray_sphere_brute_force(
+    origin: Sequence[float],
+    direction: Sequence[float],
+    centers: np.ndarray,
+    radii: np.ndarray,
+) -> Optional[Tuple[int, float]]:
+    """Vectorised reference for ``SphereBVH.intersect`` (used by tests and benchmarks)."""
+    offsets = np.asarray(centers, dtype=np.float64) - np.asarray(origin, dtype=np.float64)
+    along = offsets @ np.asarray(direction, dtype=np.float64)
+    off_axis = np.einsum("ij,ij->i", offsets, offsets) - along * along
+    radius_sq = np.asarray(radii, dtype=np.float64) ** 2
+    half_chord = np.sqrt(np.maximum(radius_sq - off_axis, 0.0))
+    t = np.where(along - half_chord >= 0.0, along - half_chord, along + half_chord)
+    t = np.where((off_axis <= radius_sq) & (t >= 0.0), t, np.inf)
+    if not len(t) or not np.isfinite(t.min()):
+        return None
+    index = int(np.argmin(t))
+    return index, float(t[index])
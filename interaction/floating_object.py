@@ -1,17 +1,95 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from functools import cached_property
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 
-from utils.math_utils import clamp
+from utils.math_utils import (
+    clamp,
+    quat_from_euler_deg,
+    quat_identity,
+    quat_multiply,
+    quat_normalize,
+    quat_slerp,
+    quat_to_euler_deg,
+    quat_to_matrix,
+)
+
+
+POSITION_MIN = np.array([-2.5, -2.0, -8.0], dtype=np.float32)
+POSITION_MAX = np.array([2.5, 2.0, -1.2], dtype=np.float32)
+SCALE_MIN = 0.25
+SCALE_MAX = 3.0
+TRACKED_FIELDS = frozenset({"position", "orientation", "scale", "object_type", "color"})
+
+
+def compose_model_matrix(position: Sequence[float], orientation: Sequence[float], scale: float) -> np.ndarray:
+    """Row-major ``(4, 4)`` translate * rotate * scale matrix."""
+    matrix = np.zeros((4, 4), dtype=np.float32)
+    matrix[:3, :3] = quat_to_matrix(orientation) * float(scale)
+    matrix[:3, 3] = position
+    matrix[3, 3] = 1.0
+    return matrix
+
+
+@dataclass(frozen=True)
+class ObjectPose:
+    position: np.ndarray
+    orientation: np.ndarray
+    scale: float
+
+    @classmethod
+    def from_euler(cls, position: Sequence[float], rotation_deg: Sequence[float], scale: float) -> "ObjectPose":
+        return cls(np.asarray(position, dtype=np.float32), quat_from_euler_deg(rotation_deg), float(scale))
+
+    @property
+    def rotation_deg(self) -> np.ndarray:
+        return quat_to_euler_deg(self.orientation)
+
+    @cached_property
+    def model_matrix(self) -> np.ndarray:
+        return compose_model_matrix(self.position, self.orientation, self.scale)
+
+    def lerp(self, other: "ObjectPose", alpha: float) -> "ObjectPose":
+        return self._blend(other, float(clamp(alpha, 0.0, 1.0)))
+
+    def extrapolate(self, other: "ObjectPose", alpha: float) -> "ObjectPose":
+        """Continue the motion from ``self`` to ``other`` past ``alpha=1``, kept in bounds."""
+        pose = self._blend(other, float(alpha))
+        return ObjectPose(
+            position=np.clip(pose.position, POSITION_MIN, POSITION_MAX),
+            orientation=pose.orientation,
+            scale=float(clamp(pose.scale, SCALE_MIN, SCALE_MAX)),
+        )
+
+    def _blend(self, other: "ObjectPose", alpha: float) -> "ObjectPose":
+        if alpha == 0.0:
+            return self
+        return ObjectPose(
+            position=self.position + (other.position - self.position) * alpha,
+            orientation=quat_slerp(self.orientation, other.orientation, alpha),
+            scale=self.scale + (other.scale - self.scale) * alpha,
+        )
 
 
 @dataclass
 class FloatingObject:
+    """The manipulated 3D object.
+
+    Orientation is a unit quaternion ``(w, x, y, z)``; rotation deltas are
+    composed about the fixed view axes, so no combination of them locks an
+    axis. ``rotation_deg`` is a derived Euler view for the HUD.
+
+    ``version`` grows whenever a visible field is assigned a different value,
+    so renderers can skip frames in which nothing changed and ``model_matrix``
+    is only rebuilt after a change. Fields must be reassigned rather than
+    mutated in place for the change to count.
+    """
+
     position: np.ndarray = field(default_factory=lambda: np.array([0.0, 0.0, -3.0], dtype=np.float32))
-    rotation_deg: np.ndarray = field(default_factory=lambda: np.array([0.0, 0.0, 0.0], dtype=np.float32))
+    orientation: np.ndarray = field(default_factory=quat_identity)
     scale: float = 1.0
     object_type: str = "cube"
     color: Tuple[float, float, float] = (0.2, 0.85, 1.0)
@@ -26,24 +104,63 @@ class FloatingObject:
     )
 
     _types: List[str] = field(default_factory=lambda: ["cube", "pyramid", "sphere"])
+    version: int = field(default=0, init=False, compare=False)
+    _matrix: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _matrix_version: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in TRACKED_FIELDS:
+            old = self.__dict__.get(name)
+            changed = not np.array_equal(old, value) if isinstance(value, np.ndarray) else old != value
+            if changed:
+                self.__dict__["version"] = self.__dict__.get("version", 0) + 1
+        object.__setattr__(self, name, value)
+
+    @property
+    def rotation_deg(self) -> np.ndarray:
+        return quat_to_euler_deg(self.orientation)
+
+    @rotation_deg.setter
+    def rotation_deg(self, angles_deg: Sequence[float]) -> None:
+        self.orientation = quat_from_euler_deg(angles_deg)
+
+    @property
+    def model_matrix(self) -> np.ndarray:
+        """Row-major translate * rotate * scale, rebuilt only when ``version`` changed."""
+        if self._matrix_version != self.version:
+            self._matrix = compose_model_matrix(self.position, self.orientation, self.scale)
+            self._matrix_version = self.version
+        return self._matrix
 
     def apply_translation(self, delta: np.ndarray) -> None:
-        self.position = self.position + delta
-        self.position[0] = clamp(self.position[0], -2.5, 2.5)
-        self.position[1] = clamp(self.position[1], -2.0, 2.0)
-        self.position[2] = clamp(self.position[2], -8.0, -1.2)
+        self.position = np.clip(self.position + delta, POSITION_MIN, POSITION_MAX)
 
     def apply_rotation(self, delta_deg: np.ndarray) -> None:
-        self.rotation_deg = (self.rotation_deg + delta_deg) % 360.0
+        """Turn by ``delta_deg`` (x, y, z) about the view axes."""
+        if not np.any(delta_deg):
+            return
+        self.orientation = quat_normalize(quat_multiply(quat_from_euler_deg(delta_deg), self.orientation))
 
     def apply_scale(self, delta: float) -> None:
-        self.scale = float(clamp(self.scale + delta, 0.25, 3.0))
+        self.scale = float(clamp(self.scale + delta, SCALE_MIN, SCALE_MAX))
+
+    def pose(self) -> ObjectPose:
+        return ObjectPose(
+            position=np.array(self.position, dtype=np.float32),
+            orientation=self.orientation.copy(),
+            scale=float(self.scale),
+        )
 
     def reset(self) -> None:
         self.position = np.array([0.0, 0.0, -3.0], dtype=np.float32)
-        self.rotation_deg = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+        self.orientation = quat_identity()
         self.scale = 1.0
 
+    def add_type(self, object_type: str) -> None:
+        """Add ``object_type`` (e.g. an imported model) to the ``toggle_type`` cycle."""
+        if object_type not in self._types:
+            self._types.append(object_type)
+
     def toggle_type(self) -> None:
         current = self._types.index(self.object_type) if self.object_type in self._types else 0
         self.object_type = self._types[(current + 1) % len(self._types)]
@@ -2,79 +2,254 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from itertools import count
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from utils.math_utils import clamp, euclidean_distance
+import numpy as np
+
+from interaction.spatial_index import UniformGrid
+from utils.math_utils import clamp
+
+
+DEFAULT_SIZE = (120, 120)
+DEFAULT_COLOR = (0, 208, 255)
+MIN_SIZE = 40
+MAX_SIZE = 420
 
 
-@dataclass
 class SceneObject:
-    object_id: int
-    x: int
-    y: int
-    width: int = 120
-    height: int = 120
-    color: Tuple[int, int, int] = (0, 208, 255)
-    is_selected: bool = False
+    """Attribute view over one row of the manager's arrays.
+
+    A deleted object keeps a detached copy of its last values.
+    """
+
+    __slots__ = ("object_id", "_manager", "_detached")
+
+    def __init__(self, manager: Optional["ObjectManager"], object_id: int) -> None:
+        self.object_id = object_id
+        self._manager = manager
+        self._detached: Dict[str, object] = {}
+
+    def _row(self) -> int:
+        return self._manager._slots[self.object_id]
+
+    def _get(self, name: str, array: str, column: Optional[int] = None):
+        if self._manager is None:
+            return self._detached[name]
+        values = getattr(self._manager, array)[self._row()]
+        return int(values[column]) if column is not None else tuple(int(v) for v in values)
+
+    def _set(self, array: str, column: int, value) -> None:
+        if self._manager is None:
+            raise ValueError("Objeto removido da cena.")
+        getattr(self._manager, array)[self._row(), column] = int(value)
+
+    @property
+    def x(self) -> int:
+        return self._get("x", "_centers", 0)
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._set("_centers", 0, value)
+        self._manager._index.move(self.object_id, self.x, self.y)
+
+    @property
+    def y(self) -> int:
+        return self._get("y", "_centers", 1)
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._set("_centers", 1, value)
+        self._manager._index.move(self.object_id, self.x, self.y)
+
+    @property
+    def width(self) -> int:
+        return self._get("width", "_sizes", 0)
+
+    @width.setter
+    def width(self, value: int) -> None:
+        self._set("_sizes", 0, value)
+
+    @property
+    def height(self) -> int:
+        return self._get("height", "_sizes", 1)
+
+    @height.setter
+    def height(self, value: int) -> None:
+        self._set("_sizes", 1, value)
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        return self._get("color", "_colors")
+
+    @color.setter
+    def color(self, value: Tuple[int, int, int]) -> None:
+        if self._manager is None:
+            raise ValueError("Objeto removido da cena.")
+        self._manager._colors[self._row()] = value
+
+    @property
+    def is_selected(self) -> bool:
+        if self._manager is None:
+            return False
+        return self._manager.selected_id == self.object_id
+
+    @is_selected.setter
+    def is_selected(self, value: bool) -> None:
+        if self._manager is None:
+            return
+        if value:
+            self._manager.selected_id = self.object_id
+        elif self._manager.selected_id == self.object_id:
+            self._manager.selected_id = None
+
+    def _detach(self) -> None:
+        self._detached = {
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height,
+            "color": self.color,
+        }
+        self._manager = None
+
+    def __repr__(self) -> str:
+        return (
+            f"SceneObject(object_id={self.object_id}, x={self.x}, y={self.y}, "
+            f"width={self.width}, height={self.height}, is_selected={self.is_selected})"
+        )
+
+
+@dataclass(frozen=True)
+class ObjectArrays:
+    ids: np.ndarray
+    centers: np.ndarray
+    sizes: np.ndarray
+    colors: np.ndarray
+    selected: int = -1
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    def corners(self) -> Tuple[np.ndarray, np.ndarray]:
+        half = self.sizes / 2.0
+        top_left = (self.centers - half).astype(np.int32)
+        bottom_right = (self.centers + half).astype(np.int32)
+        return top_left, bottom_right
+
+    @classmethod
+    def from_objects(cls, objects: Iterable[SceneObject]) -> "ObjectArrays":
+        objects = list(objects)
+        selected = next((row for row, obj in enumerate(objects) if obj.is_selected), -1)
+        return cls(
+            ids=np.array([obj.object_id for obj in objects], dtype=np.int64),
+            centers=np.array([(obj.x, obj.y) for obj in objects], dtype=np.int32).reshape(-1, 2),
+            sizes=np.array([(obj.width, obj.height) for obj in objects], dtype=np.int32).reshape(-1, 2),
+            colors=np.array([obj.color for obj in objects], dtype=np.uint8).reshape(-1, 3),
+            selected=selected,
+        )
 
 
 class ObjectManager:
-    def __init__(self) -> None:
+    def __init__(self, cell_size: float = 128.0, capacity: int = 64) -> None:
         self._id_generator = count(start=1)
-        self._objects: List[SceneObject] = []
-        self.selected_id: Optional[int] = None
+        capacity = max(1, capacity)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._centers = np.zeros((capacity, 2), dtype=np.int32)
+        self._sizes = np.zeros((capacity, 2), dtype=np.int32)
+        self._colors = np.zeros((capacity, 3), dtype=np.uint8)
+        self._count = 0
+        self._slots: Dict[int, int] = {}
+        self._views: Dict[int, SceneObject] = {}
+        self._index = UniformGrid(cell_size)
+        self._selected_id: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def selected_id(self) -> Optional[int]:
+        return self._selected_id
+
+    @selected_id.setter
+    def selected_id(self, object_id: Optional[int]) -> None:
+        self._selected_id = object_id if object_id in self._slots else None
 
     def create_object(self, center: Tuple[int, int]) -> SceneObject:
-        obj = SceneObject(object_id=next(self._id_generator), x=center[0], y=center[1])
-        self._objects.append(obj)
-        self.selected_id = obj.object_id
-        self._sync_selected_flag()
-        return obj
+        if self._count == self._ids.shape[0]:
+            self._grow()
+        object_id = next(self._id_generator)
+        row = self._count
+        self._ids[row] = object_id
+        self._centers[row] = (int(center[0]), int(center[1]))
+        self._sizes[row] = DEFAULT_SIZE
+        self._colors[row] = DEFAULT_COLOR
+        self._count += 1
+        self._slots[object_id] = row
+        self._views[object_id] = SceneObject(self, object_id)
+        self._index.insert(object_id, int(center[0]), int(center[1]))
+        self.selected_id = object_id
+        return self._views[object_id]
 
     def objects(self) -> List[SceneObject]:
-        return list(self._objects)
+        return [self._views[object_id] for object_id in self._ids[: self._count].tolist()]
 
-    def get_selected(self) -> Optional[SceneObject]:
-        for obj in self._objects:
-            if obj.object_id == self.selected_id:
-                return obj
-        return None
+    def arrays(self, copy: bool = False) -> ObjectArrays:
+        n = self._count
+        selected = self._slots.get(self._selected_id, -1) if self._selected_id is not None else -1
+        pick = (lambda arr: arr[:n].copy()) if copy else (lambda arr: arr[:n])
+        return ObjectArrays(
+            ids=pick(self._ids),
+            centers=pick(self._centers),
+            sizes=pick(self._sizes),
+            colors=pick(self._colors),
+            selected=selected,
+        )
 
-    def select_nearest(self, point: Tuple[int, int], max_distance: float = 220.0) -> Optional[SceneObject]:
-        if not self._objects:
-            self.selected_id = None
+    def get(self, object_id: int) -> Optional[SceneObject]:
+        return self._views.get(object_id)
+
+    def get_selected(self) -> Optional[SceneObject]:
+        if self._selected_id is None:
             return None
+        return self._views.get(self._selected_id)
 
-        nearest_obj = None
-        nearest_dist = float("inf")
-        for obj in self._objects:
-            distance = euclidean_distance((obj.x, obj.y), point)
-            if distance < nearest_dist:
-                nearest_dist = distance
-                nearest_obj = obj
+    def select_nearest(self, point: Tuple[int, int], max_distance: float = 220.0) -> Optional[SceneObject]:
+        hit = self._index.nearest(point, max_distance=max_distance)
+        self.selected_id = hit[0] if hit is not None else None
+        return self.get_selected()
 
-        if nearest_obj and nearest_dist <= max_distance:
-            self.selected_id = nearest_obj.object_id
-        else:
-            self.selected_id = None
+    def objects_in_radius(self, point: Tuple[int, int], radius: float) -> List[SceneObject]:
+        return [self._views[object_id] for object_id, _ in self._index.within(point, radius)]
 
-        self._sync_selected_flag()
-        return self.get_selected()
+    def hit_test(self, point: Tuple[int, int]) -> List[SceneObject]:
+        """Objects whose rectangle contains ``point``, topmost (last drawn) first."""
+        top_left, bottom_right = self.arrays().corners()
+        px, py = int(point[0]), int(point[1])
+        inside = (
+            (top_left[:, 0] <= px)
+            & (px <= bottom_right[:, 0])
+            & (top_left[:, 1] <= py)
+            & (py <= bottom_right[:, 1])
+        )
+        rows = np.flatnonzero(inside)[::-1]
+        return [self._views[object_id] for object_id in self._ids[rows].tolist()]
 
     def move_selected(self, point: Tuple[int, int], frame_shape=None) -> Optional[SceneObject]:
         selected = self.get_selected()
         if selected is None:
             return None
 
+        row = self._slots[selected.object_id]
         if frame_shape is not None:
             frame_h, frame_w = frame_shape[:2]
-            half_w = selected.width // 2
-            half_h = selected.height // 2
-            selected.x = int(clamp(point[0], half_w, frame_w - half_w))
-            selected.y = int(clamp(point[1], half_h, frame_h - half_h))
+            half_w = int(self._sizes[row, 0]) // 2
+            half_h = int(self._sizes[row, 1]) // 2
+            x = int(clamp(point[0], half_w, frame_w - half_w))
+            y = int(clamp(point[1], half_h, frame_h - half_h))
         else:
-            selected.x = int(point[0])
-            selected.y = int(point[1])
+            x, y = int(point[0]), int(point[1])
+        self._centers[row] = (x, y)
+        self._index.move(selected.object_id, x, y)
         return selected
 
     def resize_selected(self, scale: float) -> Optional[SceneObject]:
@@ -82,17 +257,34 @@ class ObjectManager:
         if selected is None:
             return None
 
-        selected.width = int(clamp(selected.width * scale, 40, 420))
-        selected.height = int(clamp(selected.height * scale, 40, 420))
+        # The index tracks centers only, so resizing leaves it untouched.
+        row = self._slots[selected.object_id]
+        self._sizes[row] = self._scaled_sizes(self._sizes[row : row + 1], scale)[0]
         return selected
 
+    def translate(self, delta: Tuple[int, int], ids: Optional[Iterable[int]] = None) -> None:
+        rows = self._rows(ids)
+        self._centers[rows] += np.asarray(delta, dtype=np.int32)
+        self._reindex(rows)
+
+    def scale(self, factor: float, ids: Optional[Iterable[int]] = None) -> None:
+        rows = self._rows(ids)
+        self._sizes[rows] = self._scaled_sizes(self._sizes[rows], factor)
+
+    def clamp_to_frame(self, frame_shape, ids: Optional[Iterable[int]] = None) -> None:
+        frame_h, frame_w = frame_shape[:2]
+        rows = self._rows(ids)
+        half = self._sizes[rows] // 2
+        low = half
+        high = np.array([frame_w, frame_h], dtype=np.int32) - half
+        self._centers[rows] = np.minimum(np.maximum(self._centers[rows], low), np.maximum(high, low))
+        self._reindex(rows)
+
     def delete_selected(self) -> bool:
         selected = self.get_selected()
         if selected is None:
             return False
-        self._objects = [obj for obj in self._objects if obj.object_id != selected.object_id]
-        self.selected_id = None
-        self._sync_selected_flag()
+        self._delete(selected.object_id)
         return True
 
     def delete_nearest(self, point: Tuple[int, int], max_distance: float = 220.0) -> bool:
@@ -101,6 +293,41 @@ class ObjectManager:
             return False
         return self.delete_selected()
 
-    def _sync_selected_flag(self) -> None:
-        for obj in self._objects:
-            obj.is_selected = obj.object_id == self.selected_id
+    def _delete(self, object_id: int) -> None:
+        if self._selected_id == object_id:
+            self._selected_id = None
+        view = self._views.pop(object_id)
+        view._detach()
+        row = self._slots.pop(object_id)
+        last = self._count - 1
+        # Shift instead of swap-remove so draw order stays creation order.
+        for array in (self._ids, self._centers, self._sizes, self._colors):
+            array[row:last] = array[row + 1 : self._count]
+        self._count = last
+        for moved_row, moved_id in enumerate(self._ids[row:last].tolist(), start=row):
+            self._slots[moved_id] = moved_row
+        self._index.remove(object_id)
+
+    def _rows(self, ids: Optional[Iterable[int]]) -> np.ndarray:
+        if ids is None:
+            return np.arange(self._count)
+        return np.array([self._slots[object_id] for object_id in ids], dtype=np.int64)
+
+    def _reindex(self, rows: np.ndarray) -> None:
+        if len(rows) * 4 >= self._count:
+            self._index.rebuild(self._ids[: self._count], self._centers[: self._count])
+            return
+        for object_id, (x, y) in zip(self._ids[rows].tolist(), self._centers[rows].tolist()):
+            self._index.move(object_id, x, y)
+
+    @staticmethod
+    def _scaled_sizes(sizes: np.ndarray, factor: float) -> np.ndarray:
+        return np.clip(sizes * float(factor), MIN_SIZE, MAX_SIZE).astype(np.int32)
+
+    def _grow(self) -> None:
+        capacity = self._ids.shape[0] * 2
+        for name in ("_ids", "_centers", "_sizes", "_colors"):
+            old = getattr(self, name)
+            grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[: self._count] = old[: self._count]
+            setattr(self, name, grown)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from gestures.gesture_recognizer import GestureOutput
+from interaction.floating_object import FloatingObject, ObjectPose
+from interaction.scene_3d import Scene3D, SceneSnapshot
+from utils.fixed_step import FixedStepClock
+
+
+@dataclass(frozen=True)
+class PoseSnapshot:
+    """Immutable view of the last two simulated states, safe to share across threads."""
+
+    previous: ObjectPose
+    current: ObjectPose
+    timestamp: float
+    step: float
+    object_type: str
+    color: Tuple[float, float, float]
+    version: int
+    scene: Optional[SceneSnapshot] = None
+    object_version: int = 0
+
+    def pose_at(self, now: float, max_extrapolation: float = 0.05) -> ObjectPose:
+        """Pose at wall time ``now``, one step behind the simulation like ``render_pose``.
+
+        ``previous`` is shown at ``timestamp`` and ``current`` one step later;
+        past that the motion is extrapolated for at most ``max_extrapolation``
+        seconds and then held.
+        """
+        elapsed = min(now - self.timestamp, self.step + max(0.0, max_extrapolation))
+        alpha = elapsed / self.step
+        if alpha <= 1.0:
+            return self.previous.lerp(self.current, alpha)
+        return self.previous.extrapolate(self.current, alpha)
+
+
+class ObjectSimulation:
+    """Advances a ``FloatingObject`` on a fixed timestep.
+
+    Gesture displacements (palm motion, pinch, finger rotation) are queued and
+    spread over the steps that cover the next camera interval, so their total is
+    exact whatever the frame rate. Rate terms (depth push, two-hand scale, spin)
+    are integrated as ``rate * step``.
+
+    ``snapshot`` is replaced (never mutated) after every advance, so a render
+    thread can read it without locking.
+    """
+
+    def __init__(
+        self,
+        floating_object: FloatingObject,
+        clock: Optional[FixedStepClock] = None,
+        spin_speed: float = 60.0,
+        scene: Optional[Scene3D] = None,
+    ) -> None:
+        self.floating_object = floating_object
+        self.scene = scene
+        self.clock = clock or FixedStepClock()
+        self.spin_speed = spin_speed
+        self.steps_run = 0
+
+        self._pending_translation = np.zeros(3, dtype=np.float64)
+        self._pending_rotation = np.zeros(3, dtype=np.float64)
+        self._pending_scale = 0.0
+        self._translation_rate = np.zeros(3, dtype=np.float64)
+        self._scale_rate = 0.0
+        self._spin_active = False
+        self._previous = floating_object.pose()
+        self._version = 0
+        self.snapshot = self._publish(time.perf_counter())
+
+    def push(self, output: GestureOutput, paused: bool = False) -> None:
+        if paused:
+            self.clear_inputs()
+            return
+        self._pending_translation += output.translation
+        self._pending_rotation += output.rotation
+        self._pending_scale += output.scale_delta
+        self._translation_rate = np.asarray(output.translation_rate, dtype=np.float64)
+        self._scale_rate = float(output.scale_rate)
+        self._spin_active = output.spin_active
+
+    def clear_inputs(self) -> None:
+        self._pending_translation[:] = 0.0
+        self._pending_rotation[:] = 0.0
+        self._pending_scale = 0.0
+        self._translation_rate = np.zeros(3, dtype=np.float64)
+        self._scale_rate = 0.0
+        self._spin_active = False
+
+    def snap(self) -> None:
+        """Drop interpolation history after a discontinuous change such as reset."""
+        self._previous = self.floating_object.pose()
+        self.snapshot = self._publish(time.perf_counter())
+
+    def advance(self, now: Optional[float] = None) -> int:
+        now = time.perf_counter() if now is None else float(now)
+        steps = self.clock.advance(now)
+        step = self.clock.step
+        obj = self.floating_object
+        for remaining in range(steps, 0, -1):
+            self._previous = obj.pose()
+            share = 1.0 / remaining
+            translation = self._pending_translation * share
+            rotation = self._pending_rotation * share
+            scale = self._pending_scale * share
+            self._pending_translation -= translation
+            self._pending_rotation -= rotation
+            self._pending_scale -= scale
+
+            obj.apply_translation(translation + self._translation_rate * step)
+            if self._spin_active:
+                rotation = rotation + np.array([0.0, self.spin_speed * step, 0.0])
+            obj.apply_rotation(rotation)
+            obj.apply_scale(scale + self._scale_rate * step)
+        self.steps_run += steps
+        if self.scene is not None:
+            self.scene.store_active()
+        self.snapshot = self._publish(now - self.clock.alpha * step)
+        return steps
+
+    def render_pose(self) -> ObjectPose:
+        return self._previous.lerp(self.floating_object.pose(), self.clock.alpha)
+
+    def _publish(self, timestamp: float) -> PoseSnapshot:
+        self._version += 1
+        return PoseSnapshot(
+            previous=self._previous,
+            current=self.floating_object.pose(),
+            timestamp=timestamp,
+            step=self.clock.step,
+            object_type=self.floating_object.object_type,
+            color=tuple(self.floating_object.color),
+            version=self._version,
+            scene=self.scene.snapshot() if self.scene is not None else None,
+            object_version=self.floating_object.version,
+        )
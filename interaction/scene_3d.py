@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.constants import CAMERA_FOV_DEG
+from interaction.bvh import SphereBVH
+from interaction.floating_object import FloatingObject
+from utils.math_utils import quat_from_euler_deg, quat_identity, quat_to_matrix
+
+
+OBJECT_TYPES = ("cube", "pyramid", "sphere")
+# Per-instance row layout uploaded to the GPU: column-major model matrix, then RGB.
+INSTANCE_FLOATS = 16 + 3
+# Rotation-invariant bounding radius of each mesh in ui/meshes.py at scale 1.
+BOUNDING_RADIUS = {"cube": 0.6 * 3 ** 0.5, "pyramid": 0.6 * 3 ** 0.5, "sphere": 0.7}
+
+
+def model_matrices(positions: np.ndarray, orientations: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """``(n, 4, 4)`` row-major translate * rotate * scale matrices from ``(n, 4)`` quaternions."""
+    orientations = np.asarray(orientations, dtype=np.float64).reshape(-1, 4)
+    matrices = np.zeros((len(orientations), 4, 4), dtype=np.float32)
+    matrices[:, :3, :3] = quat_to_matrix(orientations) * np.asarray(scales, dtype=np.float64)[:, None, None]
+    matrices[:, :3, 3] = positions
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def camera_ray(
+    u: float,
+    v: float,
+    aspect: float,
+    fov_deg: float = CAMERA_FOV_DEG,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Eye-space ray through the normalised image point ``(u, v)`` (y down) of the 3D camera."""
+    half_height = np.tan(np.radians(fov_deg) / 2.0)
+    direction = np.array([(2.0 * u - 1.0) * half_height * aspect, (1.0 - 2.0 * v) * half_height, -1.0])
+    return np.zeros(3), direction / np.linalg.norm(direction)
+
+
+@dataclass(frozen=True)
+class SceneSnapshot:
+    """Read-only instance batches of every object except the active one."""
+
+    version: int
+    batches: Dict[str, np.ndarray]
+
+    @property
+    def instance_count(self) -> int:
+        return sum(len(batch) for batch in self.batches.values())
+
+
+class Scene3D:
+    """Objects of the 3D mode stored as parallel NumPy arrays.
+
+    The active object is edited through a ``FloatingObject`` (the one the
+    simulation drives); ``store_active`` writes it back into its row and
+    ``select`` swaps which row it mirrors. ``matrices`` keeps every model
+    matrix, so snapshots slice it instead of rebuilding them.
+    """
+
+    def __init__(self, active: FloatingObject) -> None:
+        self.active = active
+        self.positions = np.zeros((0, 3), dtype=np.float32)
+        self.orientations = np.zeros((0, 4), dtype=np.float64)
+        self.matrices = np.zeros((0, 4, 4), dtype=np.float32)
+        self.scales = np.zeros(0, dtype=np.float32)
+        self.colors = np.zeros((0, 3), dtype=np.float64)
+        self.types = np.zeros(0, dtype=np.int8)
+        self.active_index = 0
+        self._version = 0
+        self._snapshot: Optional[SceneSnapshot] = None
+        self._bvh: Optional[SphereBVH] = None
+        self.object_types = list(OBJECT_TYPES)
+        self.bounding_radius = dict(BOUNDING_RADIUS)
+        self.add_object(active.object_type, active.color, active.position, active.orientation, active.scale)
+
+    def __len__(self) -> int:
+        return len(self.scales)
+
+    def add_type(self, object_type: str, bounding_radius: float) -> None:
+        """Allow objects of an imported mesh type (see ``ui.meshes.register_mesh``)."""
+        if object_type not in self.object_types:
+            self.object_types.append(object_type)
+            self._touch()
+        self.bounding_radius[object_type] = float(bounding_radius)
+        self._bvh = None
+
+    def add_object(
+        self,
+        object_type: str = "cube",
+        color: Tuple[float, float, float] = (0.2, 0.85, 1.0),
+        position: Sequence[float] = (0.0, 0.0, -3.0),
+        orientation: Optional[Sequence[float]] = None,
+        scale: float = 1.0,
+    ) -> int:
+        if object_type not in self.object_types:
+            raise ValueError(f"Tipo de objeto nao suportado: {object_type}")
+        self.positions = np.vstack([self.positions, np.asarray(position, dtype=np.float32)])
+        orientation = quat_identity() if orientation is None else np.asarray(orientation, dtype=np.float64)
+        self.orientations = np.vstack([self.orientations, orientation])
+        self.matrices = np.concatenate([self.matrices, model_matrices(position, orientation, [scale])])
+        self.scales = np.append(self.scales, np.float32(scale))
+        self.colors = np.vstack([self.colors, np.asarray(color, dtype=np.float64)])
+        self.types = np.append(self.types, np.int8(self.object_types.index(object_type)))
+        self._bvh = None
+        self._touch()
+        return len(self) - 1
+
+    def populate_grid(self, count: int, spacing: float = 0.9, depth: float = -6.0, seed: int = 0) -> None:
+        """Add ``count`` objects on a jittered grid behind the active one."""
+        if count <= 0:
+            return
+        rng = np.random.default_rng(seed)
+        side = int(np.ceil(np.sqrt(count)))
+        cells = np.stack(np.divmod(np.arange(count), side), axis=1).astype(np.float32)
+        xy = (cells - (side - 1) / 2.0) * spacing
+        palette = self.active._colors
+        for idx in range(count):
+            self.add_object(
+                object_type=OBJECT_TYPES[idx % len(OBJECT_TYPES)],
+                color=palette[idx % len(palette)],
+                position=(xy[idx, 1], xy[idx, 0], depth + rng.uniform(-0.5, 0.5)),
+                orientation=quat_from_euler_deg(rng.uniform(0.0, 360.0, 3)),
+                scale=0.35,
+            )
+
+    def store_active(self) -> None:
+        obj = self.active
+        idx = self.active_index
+        moved = self._bvh is not None and (
+            not np.array_equal(self.positions[idx], np.asarray(obj.position, dtype=np.float32))
+            or self.scales[idx] != np.float32(obj.scale)
+            or self.object_types[int(self.types[idx])] != obj.object_type
+        )
+        self.positions[idx] = obj.position
+        self.orientations[idx] = obj.orientation
+        self.matrices[idx] = obj.model_matrix
+        self.scales[idx] = obj.scale
+        self.colors[idx] = obj.color
+        types = self.object_types
+        self.types[idx] = types.index(obj.object_type) if obj.object_type in types else 0
+        if moved:
+            self._bvh.refit(idx, self.positions[idx], self._radius(idx))
+
+    def select(self, index: int) -> None:
+        if not 0 <= index < len(self):
+            raise ValueError(f"Objeto inexistente: {index}")
+        if index == self.active_index:
+            return
+        self.store_active()
+        self.active_index = index
+        obj = self.active
+        obj.position = self.positions[index].copy()
+        obj.orientation = self.orientations[index].copy()
+        obj.scale = float(self.scales[index])
+        obj.color = tuple(float(v) for v in self.colors[index])
+        obj.object_type = self.object_types[int(self.types[index])]
+        self._touch()
+
+    def select_next(self) -> int:
+        self.select((self.active_index + 1) % len(self))
+        return self.active_index
+
+    def pick_ray(self, origin: Sequence[float], direction: Sequence[float]) -> Optional[int]:
+        """Index of the nearest object whose bounding sphere the ray hits."""
+        if self._bvh is None:
+            radii = self.scales * np.array([self.bounding_radius[name] for name in self.object_types])[self.types]
+            self._bvh = SphereBVH(self.positions, radii)
+        hit = self._bvh.intersect(origin, direction)
+        return None if hit is None else hit[0]
+
+    def pick(self, u: float, v: float, aspect: float) -> Optional[int]:
+        """Object under the normalised image point ``(u, v)`` as seen by the 3D camera."""
+        return self.pick_ray(*camera_ray(u, v, aspect))
+
+    def _radius(self, index: int) -> float:
+        return float(self.scales[index]) * self.bounding_radius[self.object_types[int(self.types[index])]]
+
+    def snapshot(self) -> SceneSnapshot:
+        """Instance batches per type, rebuilt only when the inactive objects changed."""
+        if self._snapshot is not None and self._snapshot.version == self._version:
+            return self._snapshot
+        keep = np.arange(len(self)) != self.active_index
+        rows = np.empty((int(keep.sum()), INSTANCE_FLOATS), dtype=np.float32)
+        rows[:, :16] = self.matrices[keep].transpose(0, 2, 1).reshape(-1, 16)
+        rows[:, 16:] = self.colors[keep]
+        types = self.types[keep]
+        batches = {}
+        for type_idx, name in enumerate(self.object_types):
+            batch = rows[types == type_idx]
+            batch.setflags(write=False)
+            batches[name] = batch
+        self._snapshot = SceneSnapshot(version=self._version, batches=batches)
+        return self._snapshot
+
+    def _touch(self) -> None:
+        self._version += 1
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+Cell = Tuple[int, int]
+
+
+class UniformGrid:
+    """Bucket grid over object centers for nearest and radius queries.
+
+    Ties on distance resolve to the lowest id, which matches creation order.
+    """
+
+    def __init__(self, cell_size: float = 128.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size deve ser positivo.")
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._points: Dict[int, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._points
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def insert(self, item_id: int, x: float, y: float) -> None:
+        if item_id in self._points:
+            self.move(item_id, x, y)
+            return
+        self._points[item_id] = (float(x), float(y))
+        self._cells.setdefault(self._cell(x, y), set()).add(item_id)
+
+    def move(self, item_id: int, x: float, y: float) -> None:
+        old = self._points.get(item_id)
+        if old is None:
+            self.insert(item_id, x, y)
+            return
+        self._points[item_id] = (float(x), float(y))
+        old_cell, new_cell = self._cell(*old), self._cell(x, y)
+        if old_cell != new_cell:
+            self._discard(old_cell, item_id)
+            self._cells.setdefault(new_cell, set()).add(item_id)
+
+    def remove(self, item_id: int) -> None:
+        old = self._points.pop(item_id, None)
+        if old is not None:
+            self._discard(self._cell(*old), item_id)
+
+    def rebuild(self, ids, points) -> None:
+        """Replace the whole index from an id array and an ``(n, 2)`` point array."""
+        ids = np.asarray(ids, dtype=np.int64)
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.clear()
+        if ids.size == 0:
+            return
+        self._points = dict(zip(ids.tolist(), map(tuple, points.tolist())))
+        cells = np.floor(points / self.cell_size).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        cells, ids = cells[order], ids[order]
+        starts = np.flatnonzero(np.r_[True, (cells[1:] != cells[:-1]).any(axis=1)])
+        for cell, bucket in zip(cells[starts].tolist(), np.split(ids, starts[1:])):
+            self._cells[(cell[0], cell[1])] = set(bucket.tolist())
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._points.clear()
+
+    def nearest(self, point: Tuple[float, float], max_distance: float = math.inf) -> Optional[Tuple[int, float]]:
+        if not self._points:
+            return None
+        px, py = float(point[0]), float(point[1])
+        cx, cy = self._cell(px, py)
+        best: Optional[Tuple[float, int]] = None
+        seen = 0
+        ring = 0
+        while seen < len(self._points):
+            for cell in self._ring(cx, cy, ring):
+                bucket = self._cells.get(cell)
+                if not bucket:
+                    continue
+                seen += len(bucket)
+                for item_id in bucket:
+                    x, y = self._points[item_id]
+                    candidate = (math.hypot(x - px, y - py), item_id)
+                    if best is None or candidate < best:
+                        best = candidate
+            # Anything outside the rings visited so far is at least this far away.
+            bound = ring * self.cell_size
+            if (best is not None and best[0] < bound) or bound > max_distance:
+                break
+            ring += 1
+
+        if best is None or best[0] > max_distance:
+            return None
+        return best[1], best[0]
+
+    def within(self, point: Tuple[float, float], radius: float) -> List[Tuple[int, float]]:
+        px, py = float(point[0]), float(point[1])
+        x0, y0 = self._cell(px - radius, py - radius)
+        x1, y1 = self._cell(px + radius, py + radius)
+        found: List[Tuple[int, float]] = []
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            cells = [cell for cell in self._cells if x0 <= cell[0] <= x1 and y0 <= cell[1] <= y1]
+        else:
+            cells = [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+        for cell in cells:
+            for item_id in self._cells.get(cell, ()):
+                x, y = self._points[item_id]
+                distance = math.hypot(x - px, y - py)
+                if distance <= radius:
+                    found.append((item_id, distance))
+        found.sort(key=lambda item: (item[1], item[0]))
+        return found
+
+    def _discard(self, cell: Cell, item_id: int) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            return
+        bucket.discard(item_id)
+        if not bucket:
+            del self._cells[cell]
+
+    @staticmethod
+    def _ring(cx: int, cy: int, ring: int) -> Iterator[Cell]:
+        if ring == 0:
+            yield cx, cy
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
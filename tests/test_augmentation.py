@@ -0,0 +1,109 @@
+"""
+Unit tests for gestures/augmentation.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import logging
+
+import joblib
+import numpy as np
+import pytest
+
+from core.config import AppConfig
+from gestures.augmentation import LandmarkAugmenter, augmented_batches
+from gestures.gesture_dataset import GestureDataset
+from gestures.gesture_trainer import GestureTrainer
+from vision.landmark_processor import LandmarkProcessor
+
+
+def _hands(rng, count):
+    return LandmarkProcessor.normalize_batch(rng.random((count, 21, 3)).astype(np.float32))
+
+
+class TestBatchedFeatures:
+    def setup_method(self):
+        self.processor = LandmarkProcessor()
+        self.rng = np.random.default_rng(5)
+
+    def test_normalize_batch_matches_single(self):
+        raw = self.rng.random((16, 21, 3)).astype(np.float32)
+        expected = np.stack([self.processor._normalize(points) for points in raw])
+        np.testing.assert_allclose(LandmarkProcessor.normalize_batch(raw), expected, atol=1e-7)
+
+    def test_feature_batch_matches_single(self):
+        hands = _hands(self.rng, 64)
+        hands[0, 6] = hands[0, 5]
+        expected = np.stack([self.processor._build_feature_vector(points) for points in hands])
+        batch = self.processor.build_feature_batch(hands)
+        assert batch.dtype == np.float32
+        assert batch.shape == expected.shape
+        np.testing.assert_allclose(batch, expected, atol=1e-5)
+
+
+class TestLandmarkAugmenter:
+    def test_output_is_normalized(self):
+        hands = _hands(np.random.default_rng(0), 10)
+        out = LandmarkAugmenter(seed=1).augment(hands, copies=3)
+        assert out.shape == (30, 21, 3)
+        np.testing.assert_allclose(out[:, 0], 0.0, atol=1e-6)
+        np.testing.assert_allclose(np.linalg.norm(out[..., :2], axis=2).max(axis=1), 1.0, atol=1e-5)
+
+    def test_mirror_negates_x(self):
+        hands = _hands(np.random.default_rng(0), 4)
+        augmenter = LandmarkAugmenter(max_rotation_deg=0.0, scale_range=(1.0, 1.0), mirror_prob=1.0, jitter_std=0.0)
+        out = augmenter.augment(hands)
+        np.testing.assert_allclose(out[..., 0], -hands[..., 0], atol=1e-6)
+        np.testing.assert_allclose(out[..., 1:], hands[..., 1:], atol=1e-6)
+
+    def test_batches_repeat_labels(self):
+        hands = _hands(np.random.default_rng(0), 5)
+        labels = np.array(["a", "a", "b", "b", "c"])
+        batches = list(augmented_batches(hands, labels, copies=2, batch_rows=2))
+        assert [len(y) for _, y in batches] == [4, 4, 2]
+        assert np.concatenate([y for _, y in batches]).tolist() == np.repeat(labels, 2).tolist()
+        assert all(x.shape[1] == 102 for x, _ in batches)
+
+
+class TestAugmentedTraining:
+    def _fill(self, dataset, rng, count):
+        processor = LandmarkProcessor()
+        for label, offset in (("a", 0.0), ("b", 0.5)):
+            base = rng.random((21, 3)).astype(np.float32) + offset
+            for _ in range(count):
+                points = processor._normalize(base + rng.normal(0.0, 0.01, size=(21, 3)).astype(np.float32))
+                dataset.append_sample(processor._build_feature_vector(points), label, landmarks=points)
+
+    def test_landmarks_round_trip(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        self._fill(dataset, np.random.default_rng(0), 3)
+        x, y, landmarks = dataset.load_arrays(landmarks=True)
+        assert x.shape == (6, 102)
+        assert landmarks.shape == (6, 63)
+        np.testing.assert_allclose(LandmarkProcessor().build_feature_batch(landmarks.reshape(-1, 21, 3)), x, atol=1e-5)
+
+    def test_legacy_dataset_has_no_landmarks(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        dataset.append_sample(np.zeros(4), "a", landmarks=None)
+        assert dataset.index().landmark_count == 0
+        with pytest.raises(ValueError):
+            dataset.load_arrays(landmarks=True)
+
+    def test_train_adds_synthetic_samples(self, tmp_path):
+        config = AppConfig(
+            dataset_path=tmp_path / "data.csv",
+            model_path=tmp_path / "model.pkl",
+            log_path=tmp_path / "app.log",
+            feature_cache_dir=tmp_path / "features",
+            classifier_type="prototype",
+            augment_copies=2,
+            test_size=0.25,
+        )
+        trainer = GestureTrainer(config, logger=logging.getLogger("test"))
+        self._fill(trainer.dataset, np.random.default_rng(1), 20)
+        report = trainer.train()
+
+        bundle = joblib.load(config.model_path)
+        assert bundle["augment_copies"] == 2
+        assert sum(bundle["model"].class_counts.values()) == 30 * 3 + 10
+        assert report.accuracy == 1.0
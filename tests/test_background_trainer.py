@@ -0,0 +1,134 @@
+"""
+Unit tests for gestures/background_trainer.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from core.config import AppConfig
+from gestures.background_trainer import STAGE_CANCELLED, STAGE_DONE, BackgroundTrainer
+from gestures.gesture_dataset import GestureDataset
+from gestures.gesture_predictor import GesturePredictor
+
+
+def _config(tmp_path, classifier="random_forest"):
+    return AppConfig(
+        dataset_path=tmp_path / "dataset.csv",
+        model_path=tmp_path / "model.pkl",
+        log_path=tmp_path / "app.log",
+        feature_cache_dir=tmp_path / "features",
+        classifier_type=classifier,
+    )
+
+
+def _fill_dataset(config, per_label=30, features=8):
+    rng = np.random.default_rng(0)
+    dataset = GestureDataset(config.dataset_path)
+    for offset, label in ((0.0, "open_palm"), (3.0, "fist")):
+        for _ in range(per_label):
+            dataset.append_sample(rng.normal(offset, 0.3, size=features), label)
+
+
+def _wait(trainer, timeout=60.0):
+    deadline = time.perf_counter() + timeout
+    while trainer.is_running and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    assert not trainer.is_running
+
+
+class TestBackgroundTrainer:
+    def test_swaps_validated_model_into_predictor(self, tmp_path):
+        config = _config(tmp_path)
+        _fill_dataset(config)
+        predictor = GesturePredictor(config.model_path, threshold=0.0, smoothing_window=1)
+        assert not predictor.has_model
+
+        trainer = BackgroundTrainer(config, predictor, logger=logging.getLogger("test"))
+        assert trainer.start()
+        _wait(trainer)
+
+        assert trainer.status.stage == STAGE_DONE
+        assert config.model_path.exists()
+        assert not trainer.candidate_path.exists()
+        assert predictor.feature_count == 8
+        result = predictor.predict(np.full(8, 3.0))
+        assert result is not None and result.raw_label == "fist"
+
+    def test_cancel_keeps_previous_model(self, tmp_path):
+        config = _config(tmp_path, classifier="mlp")
+        _fill_dataset(config, per_label=400)
+        predictor = GesturePredictor(config.model_path)
+
+        trainer = BackgroundTrainer(config, predictor, cancel_grace_sec=0.2)
+        trainer.start()
+        trainer.cancel()
+        _wait(trainer)
+
+        assert trainer.status.stage == STAGE_CANCELLED
+        assert not config.model_path.exists()
+        assert not predictor.has_model
+
+    def test_start_is_rejected_while_running(self, tmp_path):
+        config = _config(tmp_path)
+        _fill_dataset(config)
+        trainer = BackgroundTrainer(config, GesturePredictor(config.model_path))
+        assert trainer.start()
+        assert not trainer.start()
+        _wait(trainer)
+
+
+class TestPredictorSwap:
+    def test_swap_replaces_model_and_feature_count(self, tmp_path):
+        from sklearn.dummy import DummyClassifier
+
+        predictor = GesturePredictor(tmp_path / "missing.pkl", threshold=0.0, smoothing_window=1)
+        model = DummyClassifier(strategy="most_frequent").fit(np.zeros((4, 3)), ["a", "a", "b", "a"])
+        predictor.swap_model({"model": model, "labels": ["a", "b"], "feature_count": 3})
+
+        assert predictor.feature_count == 3
+        assert predictor.predict(np.zeros(3)).raw_label == "a"
+        assert predictor.predict(np.zeros(5)) is None
+
+    def test_swap_from_other_thread_resets_smoother_on_predict_thread(self, tmp_path):
+        from sklearn.dummy import DummyClassifier
+
+        predictor = GesturePredictor(tmp_path / "missing.pkl", threshold=0.0, smoothing_window=5)
+        first = DummyClassifier(strategy="constant", constant="a").fit(np.zeros((2, 3)), ["a", "b"])
+        second = DummyClassifier(strategy="constant", constant="b").fit(np.zeros((2, 3)), ["a", "b"])
+        predictor.swap_model({"model": first, "labels": ["a", "b"], "feature_count": 3})
+        for _ in range(4):
+            predictor.predict(np.zeros(3))
+
+        reset_threads = []
+        reset = predictor.smoother.reset
+        predictor.smoother.reset = lambda: (reset_threads.append(threading.current_thread()), reset())
+        swapper = threading.Thread(
+            target=predictor.swap_model,
+            args=({"model": second, "labels": ["a", "b"], "feature_count": 3},),
+        )
+        swapper.start()
+        swapper.join()
+
+        assert reset_threads == []
+        assert predictor.predict(np.zeros(3)).label == "b"
+        assert reset_threads == [threading.current_thread()]
+
+    @pytest.mark.parametrize("paused", [True, False])
+    def test_paused_auto_reload_ignores_new_file(self, tmp_path, paused):
+        import joblib
+        from sklearn.dummy import DummyClassifier
+
+        path = tmp_path / "model.pkl"
+        predictor = GesturePredictor(path, auto_reload_sec=0.0)
+        predictor.pause_auto_reload(paused)
+        model = DummyClassifier().fit(np.zeros((2, 2)), ["a", "b"])
+        joblib.dump({"model": model, "labels": ["a", "b"], "feature_count": 2}, path)
+
+        predictor.reload_model()
+        assert predictor.has_model is (not paused)
@@ -0,0 +1,72 @@
+"""
+Unit tests for interaction/bvh.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from interaction.bvh import SphereBVH, ray_sphere_brute_force
+
+
+def _random_scene(count, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform([-4, -3, -12], [4, 3, -2], (count, 3))
+    radii = rng.uniform(0.05, 0.4, count)
+    return centers, radii
+
+
+def _random_rays(count, seed=1):
+    rng = np.random.default_rng(seed)
+    directions = rng.normal(size=(count, 3)) * [0.3, 0.3, 0.0] + [0.0, 0.0, -1.0]
+    return directions / np.linalg.norm(directions, axis=1, keepdims=True)
+
+
+def _same_hit(actual, expected):
+    if expected is None:
+        return actual is None
+    return actual is not None and actual[0] == expected[0] and actual[1] == pytest.approx(expected[1])
+
+
+class TestSphereBVH:
+    def test_matches_brute_force(self):
+        centers, radii = _random_scene(2000)
+        bvh = SphereBVH(centers, radii)
+        hits = 0
+        for direction in _random_rays(300):
+            expected = ray_sphere_brute_force((0, 0, 0), direction, centers, radii)
+            assert _same_hit(bvh.intersect((0, 0, 0), direction), expected)
+            hits += expected is not None
+        assert hits > 50
+
+    def test_refit_follows_moved_items(self):
+        centers, radii = _random_scene(500)
+        bvh = SphereBVH(centers, radii)
+        rng = np.random.default_rng(3)
+        for index in rng.choice(len(radii), 60, replace=False):
+            centers[index] = rng.uniform([-4, -3, -12], [4, 3, -2])
+            radii[index] = rng.uniform(0.05, 0.8)
+            bvh.refit(index, centers[index], radii[index])
+
+        for direction in _random_rays(200, seed=4):
+            expected = ray_sphere_brute_force((0, 0, 0), direction, centers, radii)
+            assert _same_hit(bvh.intersect((0, 0, 0), direction), expected)
+        lo, hi = bvh.bounds()
+        assert (lo <= (centers - radii[:, None]).min(axis=0) + 1e-9).all()
+        assert (hi >= (centers + radii[:, None]).max(axis=0) - 1e-9).all()
+
+    def test_nearest_of_overlapping_hits(self):
+        bvh = SphereBVH([[0, 0, -8], [0, 0, -4], [3, 0, -2]], [0.5, 0.5, 0.5])
+        index, distance = bvh.intersect((0, 0, 0), (0, 0, -1))
+        assert index == 1 and distance == pytest.approx(3.5)
+        assert bvh.intersect((0, 0, 0), (0, 0, 1)) is None
+
+    def test_origin_inside_sphere(self):
+        bvh = SphereBVH([[0, 0, 0]], [1.0])
+        assert bvh.intersect((0, 0, 0), (1, 0, 0))[1] == pytest.approx(1.0)
+
+    def test_empty_and_mismatched(self):
+        assert SphereBVH(np.zeros((0, 3)), np.zeros(0)).intersect((0, 0, 0), (0, 0, -1)) is None
+        with pytest.raises(ValueError):
+            SphereBVH(np.zeros((2, 3)), np.zeros(3))
@@ -0,0 +1,112 @@
+"""
+Unit tests for gestures/dataset_compaction.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gestures.dataset_compaction import NearDuplicateFilter, compact_dataset
+from gestures.gesture_dataset import GestureDataset
+from vision.landmark_processor import LandmarkProcessor
+
+
+def _held_poses(rng, labels=("a", "b"), poses=5, frames=20, dims=12):
+    rows, ys = [], []
+    for label in labels:
+        for _ in range(poses):
+            center = rng.normal(0.0, 1.0, size=dims)
+            for _ in range(frames):
+                rows.append(center + rng.normal(0.0, 0.002, size=dims))
+                ys.append(label)
+    return np.array(rows, dtype=np.float32), np.array(ys)
+
+
+def _brute_force(x, y, radius):
+    kept = []
+    for row in range(len(y)):
+        if all(y[k] != y[row] or np.linalg.norm(x[k] - x[row]) > radius for k in kept):
+            kept.append(row)
+    return np.isin(np.arange(len(y)), kept)
+
+
+class TestNearDuplicateFilter:
+    def setup_method(self):
+        self.rng = np.random.default_rng(1)
+
+    def test_keeps_one_sample_per_held_pose(self):
+        x, y = _held_poses(self.rng)
+        keep = NearDuplicateFilter(radius=0.1).filter_batch(x, y)
+        assert keep.sum() == 10
+        assert NearDuplicateFilter(radius=0.1).filter_batch(x, y).tolist() == keep.tolist()
+
+    def test_matches_brute_force_greedy(self):
+        x = self.rng.normal(0.0, 0.2, size=(300, 6)).astype(np.float32)
+        y = self.rng.choice(["a", "b", "c"], size=300)
+        keep = NearDuplicateFilter(radius=0.25).filter_batch(x, y)
+        np.testing.assert_array_equal(keep, _brute_force(x, y, 0.25))
+
+    def test_same_vector_with_other_label_is_kept(self):
+        dup = NearDuplicateFilter(radius=0.5)
+        assert dup.accept(np.zeros(4), "a")
+        assert not dup.accept(np.full(4, 0.1), "a")
+        assert dup.accept(np.zeros(4), "b")
+        assert dup.kept_counts == {"a": 1, "b": 1}
+
+    def test_rejects_non_positive_radius(self):
+        with pytest.raises(ValueError):
+            NearDuplicateFilter(radius=0.0)
+
+
+class TestCompactDataset:
+    def test_rewrites_dataset_and_keeps_backup(self, tmp_path):
+        x, y = _held_poses(np.random.default_rng(2), poses=3, frames=10, dims=4)
+        dataset = GestureDataset(tmp_path / "dataset.csv")
+        for features, label in zip(x, y):
+            dataset.append_sample(features, label)
+
+        report = compact_dataset(dataset.csv_path, radius=0.1)
+
+        assert (report.rows_before, report.rows_after) == (60, 6)
+        assert report.labels_after == {"a": 3, "b": 3}
+        assert len(pd.read_csv(dataset.csv_path)) == 6
+        assert len(pd.read_csv(tmp_path / "dataset.csv.bak")) == 60
+
+    def test_dry_run_leaves_dataset_untouched(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "dataset.csv")
+        for _ in range(5):
+            dataset.append_sample(np.zeros(3), "a")
+        report = compact_dataset(dataset.csv_path, radius=0.1, dry_run=True)
+        assert report.rows_after == 1
+        assert len(pd.read_csv(dataset.csv_path)) == 5
+
+    def test_compares_features_not_raw_landmarks(self, tmp_path):
+        processor = LandmarkProcessor()
+        rng = np.random.default_rng(3)
+        dataset = GestureDataset(tmp_path / "dataset.csv")
+        for label in ("a", "b"):
+            hand = LandmarkProcessor.normalize_batch(rng.random((1, 21, 3)).astype(np.float32))[0]
+            for _ in range(25):
+                points = hand + rng.normal(0.0, 1e-4, size=hand.shape).astype(np.float32)
+                dataset.append_sample(processor._build_feature_vector(points), label, landmarks=points)
+
+        report = compact_dataset(dataset.csv_path, radius=0.1)
+
+        assert report.labels_after == {"a": 1, "b": 1}
+        kept = pd.read_csv(dataset.csv_path)
+        assert len(kept) == 2 and kept.filter(like="lm_").shape[1] == 63
+
+    def test_stale_feature_columns_are_rebuilt(self, tmp_path):
+        processor = LandmarkProcessor()
+        hand = LandmarkProcessor.normalize_batch(np.random.default_rng(4).random((1, 21, 3)).astype(np.float32))[0]
+        dataset = GestureDataset(tmp_path / "dataset.csv")
+        dataset.append_sample(processor._build_feature_vector(hand), "a", landmarks=hand)
+        # A different feature layout only leaves the stored feature columns empty (NaN).
+        for _ in range(9):
+            dataset.append_sample(np.zeros(5), "a", landmarks=hand)
+
+        report = compact_dataset(dataset.csv_path, radius=0.1, dry_run=True)
+
+        assert (report.rows_before, report.rows_after) == (10, 1)
@@ -0,0 +1,92 @@
+"""
+Unit tests for ui/debug_presenter.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from core.constants import KEY_ESC
+from ui.debug_presenter import DebugPresenter
+from ui.display import NO_KEY
+from ui.renderer_debug import DebugRenderer
+
+
+def _state(value: int) -> dict:
+    return dict(
+        frame=np.full((60, 80, 3), value, dtype=np.uint8),
+        fps=30.0,
+        gesture_label="idle",
+        scale=1.0,
+        rotation=(0.0, 0.0, 0.0),
+        paused=False,
+        calibration_active=False,
+        status="ok",
+    )
+
+
+def _presenter(fps: float, threaded: bool) -> DebugPresenter:
+    presenter = DebugPresenter(lambda: DebugRenderer("debug", backend="offscreen"), fps=fps, threaded=threaded)
+    presenter.start()
+    return presenter
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestDebugPresenter:
+    def test_thread_shows_only_the_latest_state_at_its_rate(self):
+        presenter = _presenter(fps=20.0, threaded=True)
+        try:
+            start = time.perf_counter()
+            while time.perf_counter() - start < 0.3:
+                presenter.submit(**_state(10))
+                time.sleep(0.002)
+            presenter.submit(**_state(250))
+            assert _wait_for(lambda: presenter.renderer.display.last_frame[5, 5, 0] > 100)
+            assert presenter.frames_submitted > 50
+            assert 2 <= presenter.frames_presented <= 10
+        finally:
+            presenter.close()
+        assert presenter.renderer is None
+
+    def test_keys_reach_the_controller_queue(self):
+        presenter = _presenter(fps=50.0, threaded=True)
+        try:
+            assert presenter.poll_key() == NO_KEY
+            presenter.renderer.display.press(KEY_ESC)
+            presenter.renderer.display.press(ord("n"))
+            assert _wait_for(lambda: presenter._keys.qsize() == 2)
+            assert [presenter.poll_key(), presenter.poll_key(), presenter.poll_key()] == [KEY_ESC, ord("n"), NO_KEY]
+        finally:
+            presenter.close()
+
+    def test_inline_mode_is_throttled(self):
+        presenter = _presenter(fps=2.0, threaded=False)
+        for value in range(10):
+            presenter.submit(**_state(value))
+        assert presenter.frames_presented == 1
+        presenter.renderer.display.press(KEY_ESC)
+        assert presenter.poll_key() == KEY_ESC
+        presenter.close()
+
+    def test_invalid_rate_and_failed_start(self):
+        with pytest.raises(ValueError):
+            DebugPresenter(lambda: DebugRenderer("debug", backend="null"), fps=0.0)
+
+        def broken():
+            raise OSError("sem display")
+
+        presenter = DebugPresenter(broken, fps=10.0)
+        with pytest.raises(RuntimeError):
+            presenter.start()
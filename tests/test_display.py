@@ -0,0 +1,157 @@
+"""
+Unit tests for ui/display.py and the headless Renderer3D backends
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import os
+
+# Renderer3D imports OpenGL, which binds its platform on first import.
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from core.config import AppConfig  # noqa: E402
+from ui.display import NO_KEY, NullDisplay, OffscreenDisplay, create_display  # noqa: E402
+from ui.renderer_debug import DebugRenderer  # noqa: E402
+
+
+def _debug_frame(renderer):
+    frame = np.full((120, 160, 3), 200, dtype=np.uint8)
+    renderer.render(
+        frame=frame,
+        fps=30.0,
+        gesture_label="pinch",
+        scale=1.0,
+        rotation=(0.0, 0.0, 0.0),
+        paused=False,
+        calibration_active=False,
+        status="ok",
+    )
+
+
+class TestDisplays:
+    def test_offscreen_keeps_last_canvas_and_keys(self):
+        renderer = DebugRenderer("debug", backend="offscreen")
+        assert renderer.display.last_frame is None
+        _debug_frame(renderer)
+        frame = renderer.display.last_frame
+        assert frame.shape == (120, 160, 3) and frame.dtype == np.uint8
+        assert frame.max() > 110  # overlay text on the dimmed frame
+
+        assert renderer.poll_key() == NO_KEY
+        renderer.display.press(27)
+        renderer.display.press(ord("n"))
+        assert [renderer.poll_key(), renderer.poll_key(), renderer.poll_key()] == [27, ord("n"), NO_KEY]
+        renderer.close()
+
+    def test_null_drops_frames(self):
+        display = create_display("null", "x")
+        assert isinstance(display, NullDisplay) and isinstance(display, OffscreenDisplay)
+        display.show(np.zeros((2, 2, 3), dtype=np.uint8))
+        assert display.frames_shown == 1 and display.last_frame is None
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_display("vnc", "x")
+        with pytest.raises(ValueError):
+            from ui.renderer_3d import Renderer3D
+
+            Renderer3D(AppConfig(display_backend="vnc"), "x")
+
+
+class TestRenderer3DBackends:
+    def test_null_backend_counts_frames(self):
+        from interaction.floating_object import FloatingObject
+        from ui.renderer_3d import Renderer3D
+
+        renderer = Renderer3D(AppConfig(display_backend="null"), "null")
+        obj = FloatingObject()
+        renderer.render(obj)
+        obj.apply_scale(0.1)
+        renderer.render(obj)
+        assert renderer.frames_drawn == 2 and renderer.read_frame() is None
+        assert renderer.poll_quit() is False
+        renderer.close()
+
+    def test_unchanged_frames_are_skipped_until_keepalive(self, monkeypatch):
+        import ui.renderer_3d as renderer_module
+        from interaction.floating_object import FloatingObject
+        from ui.renderer_3d import Renderer3D
+
+        clock = [100.0]
+        monkeypatch.setattr(renderer_module.time, "perf_counter", lambda: clock[0])
+        renderer = Renderer3D(AppConfig(display_backend="null", render_keepalive_sec=1.0), "null")
+        obj = FloatingObject()
+        for _ in range(5):
+            renderer.render(obj)
+            clock[0] += 0.1
+        assert (renderer.frames_drawn, renderer.frames_skipped) == (1, 4)
+
+        obj.toggle_color()
+        renderer.render(obj)
+        renderer.render(obj, pose=obj.pose())
+        assert (renderer.frames_drawn, renderer.frames_skipped) == (2, 5)
+
+        clock[0] += 1.0
+        renderer.render(obj)
+        assert renderer.frames_drawn == 3
+
+        renderer.config.render_keepalive_sec = 0.0
+        renderer.render(obj)
+        assert renderer.frames_drawn == 4
+        renderer.close()
+
+    def test_offscreen_backend_returns_frames(self):
+        pytest.importorskip("OpenGL")
+        pytest.importorskip("pygame")
+        from interaction.floating_object import FloatingObject
+        from ui.renderer_3d import Renderer3D
+
+        renderer = Renderer3D(AppConfig(display_backend="offscreen", render_width=160, render_height=120), "3d")
+        try:
+            renderer.start()
+        except Exception as exc:  # pragma: no cover - depends on the host GL stack
+            pytest.skip(f"Contexto OpenGL offscreen indisponivel: {exc}")
+        try:
+            obj = FloatingObject()
+            renderer.render(obj)
+            first = renderer.read_frame()
+            obj.apply_translation(np.array([1.0, 0.0, 0.0]))
+            renderer.render(obj)
+            second = renderer.read_frame()
+        finally:
+            renderer.close()
+
+        assert first.shape == (120, 160, 3)
+        background = first[0, 0].astype(int)
+        cols_first = np.flatnonzero((np.abs(first.astype(int) - background).sum(axis=2) > 10).any(axis=0))
+        cols_second = np.flatnonzero((np.abs(second.astype(int) - background).sum(axis=2) > 10).any(axis=0))
+        assert cols_second.mean() > cols_first.mean() + 10
+
+    def test_failing_frame_sink_does_not_stop_rendering(self):
+        pytest.importorskip("OpenGL")
+        pytest.importorskip("pygame")
+        from interaction.floating_object import FloatingObject
+        from ui.renderer_3d import Renderer3D
+
+        def broken(frame):
+            raise OSError("disco cheio")
+
+        renderer = Renderer3D(AppConfig(display_backend="offscreen", render_width=160, render_height=120), "3d")
+        try:
+            renderer.start()
+        except Exception as exc:  # pragma: no cover - depends on the host GL stack
+            pytest.skip(f"Contexto OpenGL offscreen indisponivel: {exc}")
+        try:
+            obj = FloatingObject()
+            renderer.frame_sink = broken
+            renderer.render(obj)
+            obj.apply_scale(0.1)
+            renderer.render(obj)
+        finally:
+            renderer.close()
+
+        assert renderer.frame_sink is None
+        assert renderer.frames_drawn == 2
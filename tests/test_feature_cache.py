@@ -0,0 +1,119 @@
+"""
+Unit tests for gestures/feature_cache.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import joblib
+import numpy as np
+from gestures.feature_cache import FeatureCache
+from gestures.gesture_dataset import GestureDataset
+from gestures.gesture_predictor import GesturePredictor
+from gestures.prototype_classifier import PrototypeClassifier
+from vision.landmark_processor import LandmarkProcessor
+
+
+class _ShortProcessor(LandmarkProcessor):
+    FEATURE_SCHEMA_VERSION = 2
+    DISTANCE_PAIRS = LandmarkProcessor.DISTANCE_PAIRS[:5]
+
+
+def _fill(dataset, rows, seed=0, processor=None):
+    processor = processor or LandmarkProcessor()
+    rng = np.random.default_rng(seed)
+    hands = LandmarkProcessor.normalize_batch(rng.random((rows, 21, 3)).astype(np.float32))
+    for row, points in enumerate(hands):
+        dataset.append_sample(processor._build_feature_vector(points), f"g{row % 3}", landmarks=points)
+    return hands
+
+
+class TestFeatureCache:
+    def test_cached_features_match_live_features(self, tmp_path):
+        processor = LandmarkProcessor()
+        dataset = GestureDataset(tmp_path / "data.csv")
+        rng = np.random.default_rng(7)
+        live = []
+        for row in range(6):
+            hand = SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in rng.random((21, 3))])
+            analysis = processor.process(hand, (480, 640, 3))
+            dataset.append_sample(analysis.features, f"g{row % 2}", landmarks=analysis.points_norm)
+            live.append(analysis.features)
+        x, _ = FeatureCache(tmp_path / "cache", processor=processor).take(dataset)
+        np.testing.assert_array_equal(x, np.stack(live))
+
+    def test_take_recomputes_from_landmarks(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        hands = _fill(dataset, 25)
+        cache = FeatureCache(tmp_path / "cache", chunk_rows=10)
+        x, y = cache.take(dataset)
+        np.testing.assert_allclose(x, LandmarkProcessor().build_feature_batch(hands))
+        assert y.tolist() == [f"g{row % 3}" for row in range(25)]
+        assert len(list(cache.directory(dataset, dataset.index()).glob(f"*.{cache.schema_hash}.features.npy"))) == 3
+
+    def test_schema_change_reuses_cached_landmarks(self, tmp_path, monkeypatch):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        hands = _fill(dataset, 12)
+        FeatureCache(tmp_path / "cache", chunk_rows=8).take(dataset)
+
+        def _no_csv(*args, **kwargs):
+            raise AssertionError("CSV relido")
+
+        monkeypatch.setattr(dataset, "load_arrays", _no_csv)
+        short = FeatureCache(tmp_path / "cache", processor=_ShortProcessor(), chunk_rows=8)
+        x, _ = short.take(dataset)
+        assert short.schema_hash != LandmarkProcessor.feature_schema()["hash"]
+        assert x.shape == (12, _ShortProcessor.feature_count())
+        np.testing.assert_allclose(x, _ShortProcessor().build_feature_batch(hands))
+
+    def test_layout_change_keeps_collecting(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        _fill(dataset, 6)
+        hands = _fill(dataset, 4, seed=1, processor=_ShortProcessor())
+        x, _ = FeatureCache(tmp_path / "cache", processor=_ShortProcessor()).take(dataset, rows=np.arange(6, 10))
+        np.testing.assert_allclose(x, _ShortProcessor().build_feature_batch(hands))
+
+    def test_legacy_dataset_uses_stored_features(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        features = np.arange(20, dtype=np.float32).reshape(5, 4)
+        for row in features:
+            dataset.append_sample(row, "a")
+        x, y = FeatureCache(tmp_path / "cache").take(dataset)
+        np.testing.assert_array_equal(x, features)
+        assert y.tolist() == ["a"] * 5
+
+    def test_growing_chunk_replaces_partial_files(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        _fill(dataset, 5)
+        cache = FeatureCache(tmp_path / "cache", chunk_rows=8)
+        cache.take(dataset)
+        _fill(dataset, 2, seed=3)
+        x, _ = cache.take(dataset)
+        assert x.shape[0] == 7
+        names = sorted(p.name for p in cache.directory(dataset, dataset.index()).glob("*.labels.npy"))
+        assert names == ["0000000000_7.labels.npy"]
+
+    def test_iter_chunks_slices_row_range(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        hands = _fill(dataset, 20)
+        chunks = list(FeatureCache(tmp_path / "cache", chunk_rows=8).iter_chunks(dataset, 5, 18))
+        x = np.concatenate([chunk_x for chunk_x, _ in chunks])
+        np.testing.assert_allclose(x, LandmarkProcessor().build_feature_batch(hands[5:18]))
+
+
+class TestSchemaCheck:
+    def test_predictor_ignores_model_with_other_schema(self, tmp_path):
+        model = PrototypeClassifier().fit(np.eye(3), ["a", "b", "c"])
+        path = tmp_path / "model.pkl"
+        joblib.dump({"model": model, "labels": ["a", "b", "c"], "feature_count": 3, "feature_schema": {"hash": "old"}}, path)
+
+        assert not GesturePredictor(path, feature_schema="new").has_model
+        assert GesturePredictor(path, feature_schema="old").has_model
+        assert GesturePredictor(path).has_model
+
+    def test_schema_hash_tracks_layout(self):
+        schema = LandmarkProcessor.feature_schema()
+        assert schema["feature_count"] == 102
+        assert _ShortProcessor.feature_schema()["hash"] != schema["hash"]
+        assert LandmarkProcessor.feature_schema() == schema
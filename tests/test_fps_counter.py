@@ -0,0 +1,30 @@
+"""
+Unit tests for utils/fps_counter.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+
+from __future__ import annotations
+
+import utils.fps_counter as fps_module
+from utils.fps_counter import FPSCounter
+
+
+class TestDisplayFps:
+    def test_display_value_refreshes_at_the_interval(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(fps_module.time, "perf_counter", lambda: clock[0])
+        counter = FPSCounter(window_size=10, display_interval=0.5)
+        for _ in range(5):
+            counter.tick()
+            clock[0] += 0.1
+        shown = counter.get_display_fps()
+        assert shown == counter.get_fps() == 10.0
+
+        for _ in range(3):
+            counter.tick()
+            clock[0] += 0.05
+        assert counter.get_fps() != shown
+        assert counter.get_display_fps() == shown
+
+        clock[0] += 0.5
+        assert counter.get_display_fps() == counter.get_fps()
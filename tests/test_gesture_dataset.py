@@ -0,0 +1,120 @@
+"""
+Unit tests for gestures/gesture_dataset.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import csv
+
+import numpy as np
+import pytest
+
+from gestures.gesture_dataset import GestureDataset
+
+
+def _fill(dataset, rows):
+    rng = np.random.default_rng(0)
+    features, labels = [], []
+    for row in range(rows):
+        label = "open" if (row // 10) % 2 == 0 else "fist"
+        vector = rng.normal(size=4).astype(np.float32)
+        dataset.append_sample(vector, label)
+        features.append(vector)
+        labels.append(label)
+    return np.array(features, dtype=np.float32), np.array(labels)
+
+
+class TestDatasetIndex:
+    def test_counts_and_label_runs(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv", checkpoint_rows=8)
+        _fill(dataset, 30)
+        index = dataset.index()
+        assert index.rows == 30
+        assert index.feature_count == 4
+        assert index.label_counts == {"open": 20, "fist": 10}
+        assert index.label_runs["fist"] == [[10, 20]]
+        assert [cp[0] for cp in index.checkpoints] == [0, 8, 16, 24]
+
+    def test_quoted_labels(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        for label in ["ok,sign", 'say "hi"', "open", "ok,sign"]:
+            dataset.append_sample([0.1, 0.2, 0.3, 0.4], label)
+        index = dataset.index()
+        assert index.label_counts == {"ok,sign": 2, 'say "hi"': 1, "open": 1}
+        assert index.label_runs["ok,sign"] == [[0, 1], [3, 4]]
+        assert dataset.labels_distribution() == index.label_counts
+        with pytest.raises(ValueError):
+            dataset.append_sample([0.1, 0.2, 0.3, 0.4], "two\nlines")
+
+    def test_index_persisted_and_reused(self, tmp_path):
+        path = tmp_path / "data.csv"
+        dataset = GestureDataset(path, checkpoint_rows=8)
+        _fill(dataset, 12)
+        dataset.flush_index()
+        reopened = GestureDataset(path, checkpoint_rows=8)
+        assert reopened.index().generation == dataset.index().generation
+        assert reopened.count_rows() == 12
+
+    def test_external_append_scans_only_tail(self, tmp_path):
+        path = tmp_path / "data.csv"
+        dataset = GestureDataset(path, checkpoint_rows=8)
+        _fill(dataset, 12)
+        generation = dataset.index().generation
+        with open(path, "a", newline="", encoding="utf-8") as fp:
+            csv.writer(fp).writerow([0.5, 0.5, 0.5, 0.5, "peace"])
+        index = GestureDataset(path, checkpoint_rows=8).index()
+        assert index.generation == generation
+        assert index.rows == 13
+        assert index.label_counts["peace"] == 1
+
+    def test_rewrite_rebuilds_index(self, tmp_path):
+        path = tmp_path / "data.csv"
+        dataset = GestureDataset(path, checkpoint_rows=8)
+        _fill(dataset, 12)
+        generation = dataset.index().generation
+        path.write_text("feature_1,feature_2,label\n1.0,2.0,a\n", encoding="utf-8")
+        index = GestureDataset(path, checkpoint_rows=8).index()
+        assert index.generation != generation
+        assert index.rows == 1
+
+    def test_missing_label_column_rejected(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n1,2\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            GestureDataset(path).index()
+
+
+class TestChunkedLoading:
+    def test_iter_chunks_float32_from_checkpoint(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv", checkpoint_rows=8)
+        x, y = _fill(dataset, 30)
+        chunks = list(dataset.iter_chunks(chunk_rows=5, start_row=11, stop_row=27))
+        assert all(chunk_x.dtype == np.float32 for chunk_x, _ in chunks)
+        assert max(len(chunk_y) for _, chunk_y in chunks) == 5
+        got_x = np.concatenate([chunk_x for chunk_x, _ in chunks])
+        got_y = np.concatenate([chunk_y for _, chunk_y in chunks])
+        np.testing.assert_allclose(got_x, x[11:27], rtol=1e-6)
+        assert got_y.tolist() == y[11:27].tolist()
+
+    def test_load_arrays_matches_written_rows(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv", checkpoint_rows=8)
+        x, y = _fill(dataset, 30)
+        got_x, got_y = dataset.load_arrays(chunk_rows=7)
+        assert got_x.shape == (30, 4)
+        np.testing.assert_allclose(got_x, x, rtol=1e-6)
+        assert got_y.tolist() == y.tolist()
+
+    def test_stratified_sample_caps_each_label(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv", checkpoint_rows=8)
+        x, y = _fill(dataset, 40)
+        got_x, got_y = dataset.stratified_sample(per_label=6, seed=1)
+        labels, counts = np.unique(got_y, return_counts=True)
+        assert dict(zip(labels.tolist(), counts.tolist())) == {"fist": 6, "open": 6}
+        for row, label in zip(got_x, got_y):
+            match = np.where(np.all(np.isclose(x, row, rtol=1e-6), axis=1))[0]
+            assert match.size == 1 and y[match[0]] == label
+
+    def test_labels_distribution_uses_index(self, tmp_path):
+        dataset = GestureDataset(tmp_path / "data.csv")
+        _fill(dataset, 20)
+        assert dataset.labels_distribution() == {"open": 10, "fist": 10}
@@ -61,3 +61,46 @@ class TestGestureRecognizer:
         lms1[0].x = 0.2; lms2[0].x = 0.8
         scale = self.r.compute_two_hand_scale(lms1, lms2)
         assert scale > 0
+
+
+class TestPointingSelect:
+    @staticmethod
+    def _hand(index_only=True):
+        import numpy as np
+
+        from gestures.gesture_recognizer import FingerState, HandState
+        from vision.landmark_processor import HandAnalysis
+
+        points_px = np.zeros((21, 2), dtype=np.int32)
+        points_px[8] = (412, 230)
+        analysis = HandAnalysis(
+            features=np.zeros(1, dtype=np.float32),
+            points_norm=np.zeros((21, 3), dtype=np.float32),
+            points_px=points_px,
+            centroid_px=(400, 300),
+            pinch_distance=0.5,
+            openness=0.2,
+            builtin_gesture="unknown",
+        )
+        fingers = FingerState(thumb=False, index=index_only, middle=False, ring=False, pinky=False)
+        return HandState("Right", analysis, fingers, (400, 300), 0.0, 0.0)
+
+    def test_held_point_emits_fingertip_once(self):
+        from core.config import AppConfig
+        from gestures.gesture_recognizer import GestureRecognizer
+
+        recognizer = GestureRecognizer(AppConfig(select_hold_sec=0.5))
+        outputs = [recognizer.update([self._hand()], now=1.0 + 0.1 * step) for step in range(8)]
+        picks = [out.select_point_px for out in outputs if out.select_point_px is not None]
+        assert picks == [(412, 230)]
+        assert outputs[0].gesture_name == "point"
+        assert not any(out.reset for out in outputs)
+
+    def test_fist_is_not_a_point(self):
+        from core.config import AppConfig
+        from gestures.gesture_recognizer import GestureRecognizer
+
+        recognizer = GestureRecognizer(AppConfig(select_hold_sec=0.2))
+        outputs = [recognizer.update([self._hand(index_only=False)], now=1.0 + 0.1 * step) for step in range(5)]
+        assert all(out.select_point_px is None for out in outputs)
+        assert outputs[0].gesture_name == "fist"
@@ -0,0 +1,110 @@
+"""
+Unit tests for gestures/gesture_trainer.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import logging
+
+import joblib
+import numpy as np
+import pytest
+
+from core.config import AppConfig
+from gestures.dataset_compaction import compact_dataset
+from gestures.gesture_trainer import GestureTrainer
+
+
+def _append(dataset, rng, label, center, count):
+    for _ in range(count):
+        dataset.append_sample(rng.normal(center, 0.2, size=6), label)
+
+
+class TestIncrementalTraining:
+    def setup_method(self):
+        self.rng = np.random.default_rng(11)
+
+    def _trainer(self, tmp_path, classifier="prototype"):
+        config = AppConfig(
+            dataset_path=tmp_path / "dataset.csv",
+            model_path=tmp_path / "model.pkl",
+            log_path=tmp_path / "app.log",
+            feature_cache_dir=tmp_path / "features",
+            classifier_type=classifier,
+        )
+        return GestureTrainer(config, logger=logging.getLogger("test"))
+
+    def test_full_train_records_dataset_offset(self, tmp_path):
+        trainer = self._trainer(tmp_path)
+        _append(trainer.dataset, self.rng, "a", 0.0, 20)
+        _append(trainer.dataset, self.rng, "b", 2.0, 20)
+        trainer.train()
+
+        bundle = joblib.load(trainer.config.model_path)
+        assert bundle["dataset_offset"] == 40
+        assert bundle["model"].class_counts == {"a": 20, "b": 20}
+
+    def test_update_consumes_only_new_rows_and_adds_class(self, tmp_path):
+        trainer = self._trainer(tmp_path)
+        _append(trainer.dataset, self.rng, "a", 0.0, 20)
+        _append(trainer.dataset, self.rng, "b", 2.0, 20)
+        trainer.train()
+        _append(trainer.dataset, self.rng, "c", -2.0, 15)
+
+        report = trainer.update_incremental()
+        bundle = joblib.load(trainer.config.model_path)
+
+        assert report.samples == 15
+        assert bundle["dataset_offset"] == 55
+        assert bundle["labels"] == ["a", "b", "c"]
+        assert bundle["model"].predict(np.full((1, 6), -2.0))[0] == "c"
+
+    def test_update_measures_latency_when_last_chunk_is_empty(self, tmp_path):
+        trainer = self._trainer(tmp_path)
+        trainer.feature_cache.chunk_rows = 10
+        _append(trainer.dataset, self.rng, "a", 0.0, 20)
+        _append(trainer.dataset, self.rng, "b", 2.0, 20)
+        trainer.train()
+        _append(trainer.dataset, self.rng, "c", -2.0, 10)
+        # Rows without usable features are skipped, leaving the last chunk empty.
+        for _ in range(5):
+            trainer.dataset.append_sample(np.full(6, np.nan), "c")
+
+        report = trainer.update_incremental()
+
+        assert report.samples == 10
+        assert joblib.load(trainer.config.model_path)["latency"]["single_p50_ms"] > 0
+
+    def test_update_without_new_rows_fails(self, tmp_path):
+        trainer = self._trainer(tmp_path)
+        _append(trainer.dataset, self.rng, "a", 0.0, 20)
+        _append(trainer.dataset, self.rng, "b", 2.0, 20)
+        trainer.train()
+        with pytest.raises(ValueError):
+            trainer.update_incremental()
+
+    def test_update_requires_incremental_model(self, tmp_path):
+        trainer = self._trainer(tmp_path, classifier="svm")
+        _append(trainer.dataset, self.rng, "a", 0.0, 20)
+        _append(trainer.dataset, self.rng, "b", 2.0, 20)
+        trainer.train()
+        _append(trainer.dataset, self.rng, "a", 0.0, 5)
+        with pytest.raises(ValueError):
+            trainer.update_incremental()
+
+    def test_update_after_compaction_requires_full_train(self, tmp_path):
+        trainer = self._trainer(tmp_path)
+        _append(trainer.dataset, self.rng, "a", 0.0, 30)
+        _append(trainer.dataset, self.rng, "b", 2.0, 30)
+        for _ in range(10):
+            trainer.dataset.append_sample(np.zeros(6), "a")
+        trainer.train()
+        _append(trainer.dataset, self.rng, "c", -2.0, 30)
+        # Dropping the duplicates shifts the new rows below the stored offset.
+        compact_dataset(trainer.config.dataset_path, radius=0.01)
+
+        with pytest.raises(ValueError, match="treino completo"):
+            trainer.update_incremental()
+        assert joblib.load(trainer.config.model_path)["dataset_offset"] == 70
+        trainer.train()
+        assert joblib.load(trainer.config.model_path)["model"].class_counts["c"] == 30
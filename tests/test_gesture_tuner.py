@@ -0,0 +1,78 @@
+"""
+Unit tests for gestures/gesture_tuner.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+from core.config import AppConfig
+from gestures.gesture_dataset import GestureDataset
+from gestures.gesture_tuner import Candidate, GestureTuner, expand_grid, mark_pareto_front
+
+
+SPACES = {
+    "prototype": {"temperature": [0.05, 0.1, 0.2, 0.4]},
+    "random_forest": {"n_estimators": [5, 10]},
+}
+
+
+def _tuner(tmp_path, **kwargs):
+    config = AppConfig(
+        dataset_path=tmp_path / "dataset.csv",
+        model_path=tmp_path / "model.pkl",
+        log_path=tmp_path / "app.log",
+        feature_cache_dir=tmp_path / "features",
+        tuning_cache_dir=tmp_path / "cache",
+    )
+    dataset = GestureDataset(config.dataset_path)
+    if not config.dataset_path.exists():
+        rng = np.random.default_rng(5)
+        for label, center in (("a", 0.0), ("b", 1.5), ("c", -1.5)):
+            for _ in range(24):
+                dataset.append_sample(rng.normal(center, 0.4, size=5), label)
+    return GestureTuner(config, logging.getLogger("test"), folds=3, eta=2, workers=1, spaces=SPACES, **kwargs)
+
+
+class TestGestureTuner:
+    def test_expand_grid_is_cartesian(self):
+        grid = expand_grid({"a": [1, 2], "b": ["x", "y", "z"]})
+        assert len(grid) == 6
+        assert {"a": 2, "b": "z"} in grid
+
+    def test_pareto_front_is_non_dominated(self):
+        candidates = [
+            Candidate("x", {"i": 0}, {0: 0.90}, {0: 1.0}),
+            Candidate("x", {"i": 1}, {0: 0.95}, {0: 2.0}),
+            Candidate("x", {"i": 2}, {0: 0.93}, {0: 3.0}),
+            Candidate("x", {"i": 3}, {0: 0.99}, {0: 9.0}),
+        ]
+        mark_pareto_front(candidates)
+        assert [c.pareto for c in candidates] == [True, True, False, True]
+
+    def test_pareto_front_skips_partially_evaluated(self):
+        lucky = Candidate("x", {"i": 0}, {0: 0.99}, {0: 1.0})
+        full = Candidate("x", {"i": 1}, {0: 0.94, 1: 0.92, 2: 0.93}, {0: 2.0, 1: 2.0, 2: 2.0})
+        mark_pareto_front([lucky, full], folds=3)
+        assert not lucky.pareto and full.pareto
+
+    def test_successive_halving_promotes_survivors_to_all_folds(self, tmp_path):
+        report = _tuner(tmp_path).run(["prototype", "random_forest"])
+
+        folds = sorted(len(c.fold_scores) for c in report.candidates if c.classifier_type == "prototype")
+        assert folds == [1, 1, 2, 3]
+        assert all(c.latency_ms > 0 for c in report.candidates)
+        assert report.pareto_front
+        assert all(len(c.fold_scores) == 3 for c in report.pareto_front)
+        assert len(report.best("prototype").fold_scores) == 3
+
+    def test_fold_cache_is_reused(self, tmp_path):
+        first = _tuner(tmp_path, halving=False).run(["prototype"])
+        second = _tuner(tmp_path, halving=False).run(["prototype"])
+
+        assert not first.cache_hit
+        assert second.cache_hit
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+        assert [c.mean_accuracy for c in first.candidates] == [c.mean_accuracy for c in second.candidates]
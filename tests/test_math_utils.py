@@ -5,6 +5,8 @@ Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
 from __future__ import annotations
 
 import math
+
+import numpy as np
 import pytest
 
 from utils.math_utils import (
@@ -15,6 +17,12 @@ from utils.math_utils import (
     rotation_matrix_x,
     rotation_matrix_y,
     rotation_matrix_z,
+    quat_from_axis_angle,
+    quat_from_euler_deg,
+    quat_multiply,
+    quat_slerp,
+    quat_to_euler_deg,
+    quat_to_matrix,
 )
 
 
@@ -87,3 +95,36 @@ class TestRotationMatrices:
     def test_determinant_one(self, factory):
         import numpy as np
         assert np.linalg.det(factory(math.pi / 3)) == pytest.approx(1.0, abs=1e-9)
+
+
+class TestQuaternions:
+    def test_euler_matches_rotation_matrices(self):
+        rng = np.random.default_rng(0)
+        for angles in rng.uniform(0, 360, (50, 3)):
+            ax, ay, az = np.radians(angles)
+            expected = rotation_matrix_x(ax) @ rotation_matrix_y(ay) @ rotation_matrix_z(az)
+            np.testing.assert_allclose(quat_to_matrix(quat_from_euler_deg(angles)), expected, atol=1e-5)
+
+    @pytest.mark.parametrize("angles", [(10, 20, 30), (200, 300, 5), (10, 90, 20), (5, 270, 40), (0, 0, 0)])
+    def test_euler_readout_round_trips(self, angles):
+        q = quat_from_euler_deg(angles)
+        back = quat_to_euler_deg(q)
+        assert np.all((back >= 0.0) & (back < 360.0))
+        np.testing.assert_allclose(quat_to_matrix(quat_from_euler_deg(back)), quat_to_matrix(q), atol=1e-9)
+
+    def test_product_composes_rotations(self):
+        a = quat_from_axis_angle([0, 1, 0], 0.7)
+        b = quat_from_axis_angle([1, 0, 0], -0.4)
+        np.testing.assert_allclose(quat_to_matrix(quat_multiply(a, b)), quat_to_matrix(a) @ quat_to_matrix(b), atol=1e-12)
+
+    def test_batched_matrices(self):
+        qs = np.stack([quat_from_euler_deg(angles) for angles in [(0, 0, 0), (30, 60, 90), (90, 0, 0)]])
+        matrices = quat_to_matrix(qs)
+        assert matrices.shape == (3, 3, 3)
+        np.testing.assert_allclose(matrices[1], quat_to_matrix(qs[1]))
+
+    def test_slerp_takes_shorter_arc_and_extrapolates(self):
+        a = quat_from_axis_angle([0, 0, 1], math.radians(350))
+        b = quat_from_axis_angle([0, 0, 1], math.radians(10))
+        np.testing.assert_allclose(quat_to_euler_deg(quat_slerp(a, b, 0.5)), [0, 0, 0], atol=1e-9)
+        np.testing.assert_allclose(quat_to_euler_deg(quat_slerp(a, b, 1.5)), [0, 0, 20], atol=1e-9)
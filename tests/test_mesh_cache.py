@@ -0,0 +1,107 @@
+"""
+Unit tests for ui/meshes.py and ui/mesh_cache.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from ui.meshes import MESH_BUILDERS, build_mesh, clamp_lod, select_lod
+
+
+def _offscreen(width=160, height=120):
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    pytest.importorskip("OpenGL")
+    pytest.importorskip("pygame")
+    try:
+        from ui.offscreen_gl import OffscreenContext
+
+        return OffscreenContext(width, height)
+    except Exception as exc:  # pragma: no cover - depends on the host GL stack
+        pytest.skip(f"Contexto OpenGL offscreen indisponivel: {exc}")
+
+
+class TestMeshBuilders:
+    @pytest.mark.parametrize("object_type", sorted(MESH_BUILDERS))
+    def test_triangles_face_outwards(self, object_type):
+        mesh = build_mesh(object_type)
+        triangles = mesh.vertices[mesh.indices.reshape(-1, 3)]
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        assert (np.linalg.norm(normals, axis=1) > 1e-9).all()
+        assert (np.einsum("ij,ij->i", normals, triangles.mean(axis=1)) > 0).all()
+        np.testing.assert_allclose(np.linalg.norm(mesh.normals, axis=1), 1.0, atol=1e-5)
+        assert mesh.indices.max() < len(mesh.vertices)
+
+    def test_counts(self):
+        assert build_mesh("cube").triangle_count == 12
+        assert build_mesh("pyramid").triangle_count == 6
+        assert build_mesh("sphere", 0).triangle_count == 2 * 28 * 27
+        assert build_mesh("sphere", 2).triangle_count < build_mesh("sphere", 1).triangle_count
+
+    def test_interleaved_layout(self):
+        mesh = build_mesh("cube")
+        rows = mesh.interleaved()
+        assert rows.dtype == np.float32 and rows.shape == (24, 6)
+        np.testing.assert_array_equal(rows[:, 3:], mesh.normals)
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            build_mesh("torus")
+
+    def test_lod_selection(self):
+        assert clamp_lod("cube", 2) == 0
+        assert clamp_lod("sphere", 9) == 2
+        assert select_lod((0.0, 0.0, -1.5), 1.0) == 0
+        assert select_lod((0.0, 0.0, -8.0), 0.25) == 2
+
+
+class TestMeshCacheGL:
+    def test_cache_reuses_buffers(self):
+        context = _offscreen()
+        from ui.mesh_cache import MeshCache
+
+        cache = MeshCache()
+        try:
+            assert cache.get("sphere", 0) is cache.get("sphere", 0)
+            assert cache.get("sphere", 1) is not cache.get("sphere", 0)
+            assert cache.get("cube", 2) is cache.get("cube", 0)
+            assert len(cache) == 3
+        finally:
+            cache.release()
+            context.release()
+
+    def test_vbo_cube_matches_immediate_mode(self):
+        context = _offscreen()
+        from OpenGL import GL
+
+        from core.config import AppConfig
+        from interaction.floating_object import ObjectPose
+        from ui.renderer_3d import Renderer3D
+
+        renderer = Renderer3D(AppConfig(render_width=160, render_height=120), "test")
+        pose = ObjectPose.from_euler([0.2, -0.1, -3.0], [25.0, 40.0, 10.0], 1.3)
+        try:
+            renderer._setup_gl()
+            renderer._draw_scene(pose, "cube", (0.2, 0.85, 1.0))
+            retained = context.read_pixels()
+
+            # Keep the renderer's matrices and state, then redraw vertex by vertex.
+            GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+            mesh = build_mesh("cube")
+            GL.glBegin(GL.GL_TRIANGLES)
+            for idx in mesh.indices:
+                GL.glNormal3f(*mesh.normals[idx])
+                GL.glVertex3f(*mesh.vertices[idx])
+            GL.glEnd()
+            immediate = context.read_pixels()
+        finally:
+            renderer._meshes.release()
+            context.release()
+
+        background = retained[0, 0]
+        covered = (np.abs(retained.astype(int) - background).sum(axis=2) > 10).mean()
+        assert 0.05 < covered < 0.9
+        assert np.abs(retained.astype(int) - immediate).max() <= 2
@@ -0,0 +1,120 @@
+"""
+Unit tests for gestures/model_bundle.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import logging
+import os
+
+import numpy as np
+import pytest
+
+from core.config import AppConfig
+from gestures import gesture_predictor
+from gestures.gesture_predictor import GesturePredictor
+from gestures.gesture_trainer import GestureTrainer
+from gestures.model_bundle import (
+    file_checksum,
+    load_bundle,
+    manifest_path,
+    promote_bundle,
+    read_manifest,
+    save_bundle,
+)
+from gestures.prototype_classifier import PrototypeClassifier
+
+
+def _bundle():
+    model = PrototypeClassifier().fit(np.eye(4, dtype=np.float32), ["a", "b", "c", "d"])
+    return {
+        "model": model,
+        "labels": ["a", "b", "c", "d"],
+        "feature_count": 4,
+        "weights": np.arange(4096, dtype=np.float32),
+        "metrics": {"accuracy": 0.9},
+    }
+
+
+class TestModelBundle:
+    def test_manifest_describes_saved_file(self, tmp_path):
+        path = tmp_path / "model.pkl"
+        manifest = save_bundle(_bundle(), path)
+        assert read_manifest(path) == manifest
+        assert manifest["checksum"] == file_checksum(path)
+        assert manifest["size_bytes"] == path.stat().st_size
+        assert manifest["labels"] == ["a", "b", "c", "d"]
+        assert manifest["metrics"] == {"accuracy": 0.9}
+        assert not path.with_name("model.pkl.tmp").exists()
+
+    def test_load_memory_maps_arrays(self, tmp_path):
+        path = tmp_path / "model.pkl"
+        save_bundle(_bundle(), path)
+        payload = load_bundle(path, mmap_min_bytes=0)
+        assert isinstance(payload["weights"], np.memmap)
+        assert not payload["weights"].flags.writeable
+        assert payload["model"].predict(np.eye(4, dtype=np.float32)[:1])[0] == "a"
+        assert not isinstance(load_bundle(path, mmap=False, mmap_min_bytes=0)["weights"], np.memmap)
+        assert not isinstance(load_bundle(path)["weights"], np.memmap)
+
+    def test_verify_rejects_modified_file(self, tmp_path):
+        path = tmp_path / "model.pkl"
+        save_bundle(_bundle(), path)
+        with open(path, "ab") as fp:
+            fp.write(b"\0")
+        with pytest.raises(ValueError):
+            load_bundle(path, verify=True)
+
+    def test_promote_moves_manifest_with_model(self, tmp_path):
+        candidate = tmp_path / "model.candidate.pkl"
+        target = tmp_path / "model.pkl"
+        checksum = save_bundle(_bundle(), candidate)["checksum"]
+        promote_bundle(candidate, target)
+        assert not candidate.exists() and not manifest_path(candidate).exists()
+        assert read_manifest(target)["checksum"] == checksum == file_checksum(target)
+
+
+class TestPredictorReload:
+    def test_unchanged_checksum_skips_reload(self, tmp_path, monkeypatch):
+        path = tmp_path / "model.pkl"
+        save_bundle(_bundle(), path)
+        predictor = GesturePredictor(path, auto_reload_sec=0.0)
+        assert predictor.manifest["checksum"] == file_checksum(path)
+
+        loads = []
+        original = gesture_predictor.load_bundle
+        monkeypatch.setattr(gesture_predictor, "load_bundle", lambda *a, **k: loads.append(1) or original(*a, **k))
+
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        predictor.reload_model()
+        assert loads == []
+
+        bundle = _bundle()
+        bundle["labels"] = ["d", "c", "b", "a"]
+        save_bundle(bundle, path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        predictor.reload_model()
+        assert loads == [1]
+        assert predictor.manifest["labels"] == ["d", "c", "b", "a"]
+
+    def test_trainer_records_metrics_and_latency(self, tmp_path):
+        config = AppConfig(
+            dataset_path=tmp_path / "dataset.csv",
+            model_path=tmp_path / "model.pkl",
+            log_path=tmp_path / "app.log",
+            feature_cache_dir=tmp_path / "features",
+            classifier_type="prototype",
+        )
+        trainer = GestureTrainer(config, logger=logging.getLogger("test"))
+        rng = np.random.default_rng(0)
+        for label, center in (("a", 0.0), ("b", 3.0)):
+            for _ in range(20):
+                trainer.dataset.append_sample(rng.normal(center, 0.2, size=5), label)
+        report = trainer.train()
+
+        manifest = read_manifest(config.model_path)
+        assert manifest["metrics"]["accuracy"] == pytest.approx(report.accuracy)
+        assert manifest["dataset_offset"] == 40
+        assert manifest["latency"]["single_p50_ms"] > 0
+        assert manifest["checksum"] == file_checksum(config.model_path)
@@ -0,0 +1,200 @@
+"""
+Unit tests for ui/model_loader.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import base64
+import os
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from ui import model_loader
+from ui.meshes import MESH_BUILDERS, MESH_LOD_COUNT, build_mesh, build_sphere, clamp_lod, register_mesh
+from ui.model_loader import MODEL_RADIUS, MeshStore, load_gltf, load_obj, simplify_mesh
+
+_CUBE_OBJ = """# cube with quads, shared normals and negative indices
+v -1 -1 1
+v 1 -1 1
+v 1 1 1
+v -1 1 1
+v -1 -1 -1
+v 1 -1 -1
+v 1 1 -1
+v -1 1 -1
+vn 0 0 1
+vn 0 0 -1
+f 1//1 2//1 3//1 4//1
+f -4//2 -1//2 -2//2 -3//2
+f 4 3 7 8
+f 1 5 6 2
+f 2 6 7 3
+f 1 4 8 5
+"""
+
+
+def _write_sphere_obj(path, segments=24):
+    mesh = build_sphere(slices=segments, stacks=segments)
+    lines = [f"v {x} {y} {z}" for x, y, z in mesh.vertices]
+    lines += [f"f {a + 1} {b + 1} {c + 1}" for a, b, c in mesh.indices.reshape(-1, 3)]
+    path.write_text("\n".join(lines))
+    return mesh
+
+
+def _gltf_triangle(binary=False):
+    positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+    indices = np.array([0, 1, 2], dtype=np.uint16)
+    blob = positions.tobytes() + indices.tobytes() + b"\0\0"
+    document = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "translation": [0, 0, 2], "scale": [2, 2, 2]}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+        "buffers": [{"byteLength": len(blob)}],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": 36},
+            {"buffer": 0, "byteOffset": 36, "byteLength": 6},
+        ],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"},
+            {"bufferView": 1, "componentType": 5123, "count": 3, "type": "SCALAR"},
+        ],
+    }
+    if not binary:
+        document["buffers"][0]["uri"] = "data:application/octet-stream;base64," + base64.b64encode(blob).decode()
+        return json.dumps(document).encode()
+    text = json.dumps(document).encode()
+    text += b" " * (-len(text) % 4)
+    chunks = struct.pack("<II", len(text), 0x4E4F534A) + text + struct.pack("<II", len(blob), 0x004E4942) + blob
+    return struct.pack("<III", 0x46546C67, 2, 12 + len(chunks)) + chunks
+
+
+class TestModelLoader:
+    def test_obj_quads_and_normals(self, tmp_path):
+        path = tmp_path / "cube.obj"
+        path.write_text(_CUBE_OBJ)
+        mesh = load_obj(path)
+        assert mesh.triangle_count == 12
+        # Some faces have no normals, so the mesh gets smooth normals over its 8 corners.
+        assert len(mesh.vertices) == 8
+        np.testing.assert_allclose(np.linalg.norm(mesh.normals, axis=1), 1.0, atol=1e-5)
+
+    def test_obj_split_normals_and_triangles(self, tmp_path):
+        path = tmp_path / "corner.obj"
+        path.write_text(
+            "v 0 0 0\nv 1 0 0\nv 0 1 0\nv 0 0 1\nvn 0 0 1\nvn 0 -1 0\n"
+            "f 1/1/1 2/2/1 3/3/1\nf 1/1/2 4/2/2 2/3/2\n"
+        )
+        mesh = load_obj(path)
+        # Vertices 1 and 2 appear with two normals each.
+        assert len(mesh.vertices) == 6 and mesh.triangle_count == 2
+        triangles = mesh.vertices[mesh.indices.reshape(-1, 3)]
+        np.testing.assert_allclose(triangles[0], [[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+        np.testing.assert_allclose(mesh.normals[mesh.indices[3:]], [[0, -1, 0]] * 3)
+
+    def test_obj_round_trip(self, tmp_path):
+        source = _write_sphere_obj(tmp_path / "ball.obj", segments=10)
+        mesh = load_obj(tmp_path / "ball.obj")
+        np.testing.assert_allclose(
+            mesh.vertices[mesh.indices.reshape(-1, 3)],
+            source.vertices[source.indices.reshape(-1, 3)],
+            atol=1e-6,
+        )
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_gltf_applies_node_transform(self, tmp_path, binary):
+        path = tmp_path / ("tri.glb" if binary else "tri.gltf")
+        path.write_bytes(_gltf_triangle(binary))
+        mesh = load_gltf(path)
+        np.testing.assert_allclose(mesh.vertices, [[0, 0, 2], [2, 0, 2], [0, 2, 2]])
+        np.testing.assert_allclose(mesh.normals, [[0, 0, 1]] * 3, atol=1e-6)
+
+    def test_simplify_reduces_and_keeps_shape(self):
+        sphere = build_mesh("sphere", 0)
+        coarse = simplify_mesh(sphere, 6)
+        assert coarse.triangle_count < sphere.triangle_count // 4
+        radii = np.linalg.norm(coarse.vertices, axis=1)
+        assert radii.max() <= 0.7 + 1e-5 and radii.mean() > 0.5
+        assert coarse.indices.max() < len(coarse.vertices)
+
+    def test_store_caches_by_content(self, tmp_path, monkeypatch):
+        source = tmp_path / "ball.obj"
+        _write_sphere_obj(source)
+        store = MeshStore(tmp_path / "cache")
+        lods = store.load(source)
+        assert len(lods) == 3
+        assert lods[0].triangle_count > lods[1].triangle_count > lods[2].triangle_count
+        assert np.linalg.norm(lods[0].vertices, axis=1).max() == pytest.approx(MODEL_RADIUS, abs=1e-5)
+
+        def _no_parse(path):
+            raise AssertionError("modelo reprocessado")
+
+        monkeypatch.setattr(model_loader, "load_source", _no_parse)
+        cached = store.load(source)
+        assert isinstance(cached[0].vertices, np.memmap)
+        for fresh, again in zip(lods, cached):
+            np.testing.assert_array_equal(fresh.indices, again.indices)
+
+        monkeypatch.undo()
+        _write_sphere_obj(source, segments=12)
+        assert store.load(source)[0].triangle_count < lods[0].triangle_count
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_register_mesh(self, tmp_path):
+        source = tmp_path / "ball.obj"
+        _write_sphere_obj(source)
+        lods = MeshStore(tmp_path / "cache").load(source)
+        register_mesh("test_ball", lods)
+        try:
+            assert MESH_LOD_COUNT["test_ball"] == 3 and clamp_lod("test_ball", 5) == 2
+            assert build_mesh("test_ball", 1) is lods[1]
+        finally:
+            MESH_BUILDERS.pop("test_ball")
+            MESH_LOD_COUNT.pop("test_ball")
+
+    def test_unsupported_and_empty(self, tmp_path):
+        with pytest.raises(ValueError):
+            model_loader.load_source(tmp_path / "model.stl")
+        empty = tmp_path / "empty.obj"
+        empty.write_text("# nada\n")
+        with pytest.raises(ValueError):
+            load_obj(empty)
+
+
+class TestModelRenderingGL:
+    def test_renderer_draws_loaded_model(self, tmp_path):
+        os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+        pytest.importorskip("OpenGL")
+        pytest.importorskip("pygame")
+        try:
+            from ui.offscreen_gl import OffscreenContext
+
+            context = OffscreenContext(160, 120)
+        except Exception as exc:  # pragma: no cover - depends on the host GL stack
+            pytest.skip(f"Contexto OpenGL offscreen indisponivel: {exc}")
+
+        from core.config import AppConfig
+        from interaction.floating_object import ObjectPose
+        from ui.renderer_3d import Renderer3D
+
+        _write_sphere_obj(tmp_path / "sphere.obj")
+        renderer = Renderer3D(AppConfig(render_width=160, render_height=120, mesh_cache_dir=tmp_path / "cache"), "test")
+        object_type = renderer.load_model(tmp_path / "sphere.obj")
+        pose = ObjectPose.from_euler([0.0, 0.0, -3.0], np.zeros(3), 1.0)
+        try:
+            assert object_type == "sphere_model"
+            renderer._setup_gl()
+            renderer._draw_scene(pose, object_type, (1.0, 0.55, 0.25))
+            pixels = context.read_pixels()
+        finally:
+            renderer._release_gl()
+            context.release()
+            MESH_BUILDERS.pop(object_type)
+            MESH_LOD_COUNT.pop(object_type)
+
+        covered = (np.abs(pixels.astype(int) - pixels[0, 0]).sum(axis=2) > 10).mean()
+        assert 0.05 < covered < 0.5
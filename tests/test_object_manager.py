@@ -0,0 +1,181 @@
+"""
+Unit tests for interaction/object_manager.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from interaction.object_manager import ObjectArrays, ObjectManager
+from interaction.spatial_index import UniformGrid
+from ui.renderer import Renderer
+
+
+def _brute_nearest(manager, point, max_distance):
+    best = None
+    for obj in manager.objects():
+        distance = math.hypot(obj.x - point[0], obj.y - point[1])
+        if best is None or distance < best[0]:
+            best = (distance, obj.object_id)
+    if best is None or best[0] > max_distance:
+        return None
+    return best[1]
+
+
+def _populate(count, seed=0, size=(1280, 720)):
+    rng = np.random.default_rng(seed)
+    manager = ObjectManager(cell_size=64)
+    for x, y in zip(rng.integers(0, size[0], count), rng.integers(0, size[1], count)):
+        manager.create_object((int(x), int(y)))
+    return manager, rng
+
+
+class TestObjectManager:
+    def test_select_nearest_matches_linear_scan(self):
+        manager, rng = _populate(400)
+        for _ in range(200):
+            point = (int(rng.integers(-100, 1400)), int(rng.integers(-100, 800)))
+            max_distance = float(rng.choice([30.0, 220.0, math.inf]))
+            selected = manager.select_nearest(point, max_distance=max_distance)
+            expected = _brute_nearest(manager, point, max_distance)
+            assert (selected.object_id if selected else None) == expected
+
+    def test_ties_resolve_to_oldest_object(self):
+        manager = ObjectManager(cell_size=10)
+        first = manager.create_object((100, 100))
+        manager.create_object((120, 100))
+        assert manager.select_nearest((110, 100)).object_id == first.object_id
+
+    def test_radius_query_matches_linear_scan(self):
+        manager, rng = _populate(300, seed=1)
+        point, radius = (640, 360), 150.0
+        expected = sorted(
+            obj.object_id for obj in manager.objects() if math.hypot(obj.x - point[0], obj.y - point[1]) <= radius
+        )
+        assert sorted(obj.object_id for obj in manager.objects_in_radius(point, radius)) == expected
+
+    def test_move_and_delete_keep_index_in_step(self):
+        manager = ObjectManager(cell_size=50)
+        a = manager.create_object((10, 10))
+        b = manager.create_object((500, 500))
+        manager.selected_id = a.object_id
+        manager.move_selected((900, 40))
+        assert manager.select_nearest((890, 40), max_distance=30).object_id == a.object_id
+        assert manager.select_nearest((10, 10), max_distance=30) is None
+
+        manager.selected_id = b.object_id
+        assert manager.delete_selected()
+        assert manager.get(b.object_id) is None
+        assert manager.select_nearest((500, 500), max_distance=1000).object_id == a.object_id
+        assert len(manager) == 1
+
+    def test_selection_flag_follows_selected_id(self):
+        manager, _ = _populate(20, seed=2)
+        objects = manager.objects()
+        manager.selected_id = objects[3].object_id
+        manager.selected_id = objects[7].object_id
+        assert [obj.object_id for obj in objects if obj.is_selected] == [objects[7].object_id]
+        assert manager.get_selected() is objects[7]
+        manager.selected_id = 10_000
+        assert manager.selected_id is None
+        assert not any(obj.is_selected for obj in objects)
+
+    def test_objects_keep_creation_order(self):
+        manager, _ = _populate(10, seed=3)
+        ids = [obj.object_id for obj in manager.objects()]
+        assert ids == sorted(ids)
+
+
+    def test_views_write_through_to_arrays(self):
+        manager, _ = _populate(100, seed=4)
+        obj = manager.objects()[42]
+        obj.x, obj.width, obj.color = 5, 60, (1, 2, 3)
+        arrays = manager.arrays()
+        row = int(np.flatnonzero(arrays.ids == obj.object_id)[0])
+        assert arrays.centers[row, 0] == 5
+        assert arrays.sizes[row, 0] == 60
+        assert tuple(arrays.colors[row]) == (1, 2, 3)
+        assert manager.select_nearest((5, obj.y), max_distance=1).object_id == obj.object_id
+
+    def test_delete_compacts_arrays_and_detaches_view(self):
+        manager, _ = _populate(200, seed=5)
+        victim = manager.objects()[50]
+        x, y = victim.x, victim.y
+        manager.selected_id = victim.object_id
+        assert manager.delete_selected()
+        assert (victim.x, victim.y, victim.is_selected) == (x, y, False)
+        assert victim.object_id not in manager.arrays().ids
+        for row, obj in enumerate(manager.objects()):
+            assert manager.arrays().ids[row] == obj.object_id
+            assert (manager.arrays().centers[row] == (obj.x, obj.y)).all()
+        with pytest.raises(ValueError):
+            victim.x = 0
+
+    def test_bulk_transforms_match_per_object(self):
+        manager, _ = _populate(300, seed=6)
+        ids = [obj.object_id for obj in manager.objects()[::3]]
+        before = {obj.object_id: (obj.x, obj.y, obj.width) for obj in manager.objects()}
+        manager.translate((15, -7), ids=ids)
+        manager.scale(3.7, ids=ids)
+        for obj in manager.objects():
+            x, y, width = before[obj.object_id]
+            if obj.object_id in ids:
+                assert (obj.x, obj.y, obj.width) == (x + 15, y - 7, min(420, int(width * 3.7)))
+            else:
+                assert (obj.x, obj.y, obj.width) == (x, y, width)
+        moved = manager.objects()[0]
+        assert manager.select_nearest((moved.x, moved.y), max_distance=0).object_id == moved.object_id
+
+    def test_clamp_to_frame_keeps_rectangles_inside(self):
+        manager, _ = _populate(500, seed=7, size=(2000, 1500))
+        manager.clamp_to_frame((720, 1280, 3))
+        top_left, bottom_right = manager.arrays().corners()
+        assert (top_left >= 0).all()
+        assert (bottom_right[:, 0] <= 1280).all() and (bottom_right[:, 1] <= 720).all()
+
+    def test_hit_test_returns_topmost_first(self):
+        manager = ObjectManager()
+        a = manager.create_object((100, 100))
+        b = manager.create_object((130, 100))
+        manager.create_object((600, 600))
+        assert [obj.object_id for obj in manager.hit_test((120, 100))] == [b.object_id, a.object_id]
+        assert manager.hit_test((0, 0)) == []
+
+    def test_renderer_draws_arrays_like_views(self):
+        manager, _ = _populate(60, seed=8, size=(640, 480))
+        manager.selected_id = manager.objects()[20].object_id
+        from_arrays = np.zeros((480, 640, 3), dtype=np.uint8)
+        from_views = np.zeros_like(from_arrays)
+        Renderer._draw_objects(from_arrays, manager.arrays())
+        Renderer._draw_objects(from_views, manager.objects())
+        assert np.array_equal(from_arrays, from_views)
+        assert ObjectArrays.from_objects(manager.objects()).selected == 20
+
+
+class TestUniformGrid:
+    def test_invalid_cell_size(self):
+        with pytest.raises(ValueError):
+            UniformGrid(0)
+
+    def test_empty_grid(self):
+        grid = UniformGrid()
+        assert grid.nearest((0, 0)) is None
+        assert grid.within((0, 0), 100) == []
+
+    def test_far_point_still_found(self):
+        grid = UniformGrid(cell_size=10)
+        grid.insert(1, 5000, 5000)
+        assert grid.nearest((0, 0))[0] == 1
+
+    def test_rebuild_matches_incremental_inserts(self):
+        rng = np.random.default_rng(9)
+        points = rng.uniform(-500, 500, size=(300, 2))
+        incremental, rebuilt = UniformGrid(cell_size=40), UniformGrid(cell_size=40)
+        for item_id, (x, y) in enumerate(points.tolist()):
+            incremental.insert(item_id, x, y)
+        rebuilt.rebuild(np.arange(len(points)), points)
+        assert rebuilt._cells == incremental._cells
+        assert rebuilt.nearest((3, 4)) == incremental.nearest((3, 4))
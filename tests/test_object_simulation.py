@@ -0,0 +1,254 @@
+"""
+Unit tests for interaction/object_simulation.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from gestures.gesture_recognizer import GestureOutput
+from interaction.floating_object import FloatingObject, ObjectPose
+from interaction.object_simulation import ObjectSimulation
+from utils.fixed_step import FixedStepClock
+
+
+def _output(translation=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 0.0), scale_delta=0.0, **kwargs):
+    return GestureOutput(
+        gesture_name="test",
+        translation=np.asarray(translation, dtype=np.float32),
+        rotation=np.asarray(rotation, dtype=np.float32),
+        scale_delta=scale_delta,
+        reset=False,
+        toggle_object=False,
+        toggle_color=False,
+        toggle_pause=False,
+        spin_active=kwargs.pop("spin_active", False),
+        calibration_active=False,
+        **kwargs,
+    )
+
+
+def _run(fps, seconds, output_fn, rate_hz=120.0, clock=None):
+    sim = ObjectSimulation(FloatingObject(), clock=clock or FixedStepClock(rate_hz, max_catchup_sec=0.5))
+    sim.advance(0.0)
+    frames = int(round(seconds * fps))
+    for frame in range(1, frames + 1):
+        sim.push(output_fn(fps))
+        sim.advance(frame / fps)
+    # Flush queued displacement with one more step.
+    sim.push(_output())
+    sim.advance(seconds + 1.0 / rate_hz)
+    return sim
+
+
+class TestFixedStepClock:
+    def test_steps_and_alpha(self):
+        clock = FixedStepClock(rate_hz=100.0)
+        assert clock.advance(0.0) == 0
+        assert clock.advance(0.025) == 2
+        assert clock.alpha == pytest.approx(0.5)
+        assert clock.advance(0.03) == 1
+
+    def test_long_stall_is_capped(self):
+        clock = FixedStepClock(rate_hz=100.0, max_catchup_sec=0.04)
+        clock.advance(0.0)
+        assert clock.advance(1.0) == 4
+        assert clock.dropped_time > 0.9
+        assert clock.advance(1.01) == 1
+
+    def test_slow_frames_keep_all_time(self):
+        clock = FixedStepClock()
+        clock.advance(0.0)
+        steps = sum(clock.advance(frame / 10.0) for frame in range(1, 31))
+        assert steps == 360
+        assert clock.dropped_time == 0.0
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            FixedStepClock(rate_hz=0)
+        with pytest.raises(ValueError):
+            FixedStepClock(max_catchup_sec=0)
+
+
+class TestObjectSimulation:
+    def test_displacement_independent_of_frame_rate(self):
+        per_second = np.array([0.6, -0.3, 0.0])
+        slow = _run(15, 1.0, lambda fps: _output(translation=per_second / fps, scale_delta=0.3 / fps))
+        fast = _run(60, 1.0, lambda fps: _output(translation=per_second / fps, scale_delta=0.3 / fps))
+        np.testing.assert_allclose(slow.floating_object.position, fast.floating_object.position, atol=1e-5)
+        assert slow.floating_object.scale == pytest.approx(fast.floating_object.scale, abs=1e-6)
+        np.testing.assert_allclose(fast.floating_object.position[:2], per_second[:2], atol=1e-5)
+
+    def test_rate_terms_independent_of_frame_rate(self):
+        def spin(fps):
+            return _output(translation_rate=np.array([0.0, 0.0, 0.5], dtype=np.float32), spin_active=True)
+
+        slow = _run(12, 1.0, spin)
+        fast = _run(90, 1.0, spin)
+        assert slow.floating_object.position[2] == pytest.approx(fast.floating_object.position[2], abs=0.01)
+        assert slow.floating_object.rotation_deg[1] == pytest.approx(fast.floating_object.rotation_deg[1], abs=1.0)
+        assert fast.floating_object.rotation_deg[1] == pytest.approx(60.0, abs=1.0)
+
+    def test_default_clock_keeps_speed_at_10_fps(self):
+        def spin(fps):
+            return _output(translation_rate=np.array([0.0, 0.0, 0.5], dtype=np.float32), spin_active=True)
+
+        # 12 steps per camera frame at the default 120 Hz.
+        sim = _run(10, 1.0, spin, clock=FixedStepClock())
+        assert sim.clock.dropped_time == 0.0
+        assert sim.floating_object.rotation_deg[1] == pytest.approx(60.0, abs=1.0)
+        assert sim.floating_object.position[2] == pytest.approx(-2.5, abs=0.01)
+
+    def test_pause_drops_queued_inputs(self):
+        sim = ObjectSimulation(FloatingObject(), clock=FixedStepClock(100.0))
+        sim.advance(0.0)
+        sim.push(_output(translation=(1.0, 0.0, 0.0)))
+        sim.push(_output(), paused=True)
+        sim.advance(0.1)
+        np.testing.assert_allclose(sim.floating_object.position, [0.0, 0.0, -3.0])
+
+    def test_render_pose_interpolates_last_step(self):
+        sim = ObjectSimulation(FloatingObject(), clock=FixedStepClock(100.0))
+        sim.advance(0.0)
+        sim.push(_output(translation=(0.2, 0.0, 0.0)))
+        sim.advance(0.015)
+        assert sim.render_pose().position[0] == pytest.approx(0.1)
+
+
+class TestPoseSnapshot:
+    def _moving_sim(self):
+        sim = ObjectSimulation(FloatingObject(), clock=FixedStepClock(100.0))
+        sim.advance(0.0)
+        sim.push(_output(translation_rate=np.array([1.0, 0.0, 0.0], dtype=np.float32)))
+        sim.advance(0.025)
+        return sim
+
+    def test_pose_at_publish_time_matches_render_pose(self):
+        sim = self._moving_sim()
+        np.testing.assert_allclose(sim.snapshot.pose_at(0.025).position, sim.render_pose().position, atol=1e-6)
+
+    def test_extrapolation_is_capped(self):
+        snapshot = self._moving_sim().snapshot
+        x_now = snapshot.current.position[0]
+        assert snapshot.pose_at(snapshot.timestamp + 0.01 + 0.02, max_extrapolation=0.05).position[0] == pytest.approx(
+            x_now + 0.02, abs=1e-6
+        )
+        held = snapshot.pose_at(snapshot.timestamp + 5.0, max_extrapolation=0.05).position[0]
+        assert held == pytest.approx(x_now + 0.05, abs=1e-6)
+        assert snapshot.pose_at(snapshot.timestamp + 5.0, max_extrapolation=0.0).position[0] == pytest.approx(x_now)
+
+    def test_extrapolation_stays_in_bounds(self):
+        previous = ObjectPose.from_euler([2.0, 0.0, -3.0], np.zeros(3), 2.9)
+        current = ObjectPose.from_euler([2.4, 0.0, -3.0], np.zeros(3), 2.99)
+        pose = previous.extrapolate(current, 10.0)
+        assert pose.position[0] == pytest.approx(2.5)
+        assert pose.scale == pytest.approx(3.0)
+
+    def test_snapshots_are_replaced_not_mutated(self):
+        sim = self._moving_sim()
+        first = sim.snapshot
+        x_before = float(first.current.position[0])
+        sim.advance(0.05)
+        assert sim.snapshot is not first
+        assert sim.snapshot.version > first.version
+        assert float(first.current.position[0]) == x_before
+
+    def test_reader_thread_sees_consistent_snapshots(self):
+        sim = self._moving_sim()
+        seen = []
+        done = threading.Event()
+
+        def reader():
+            while not done.is_set():
+                snapshot = sim.snapshot
+                seen.append((snapshot.version, float(snapshot.current.position[0] - snapshot.previous.position[0])))
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for frame in range(1, 200):
+            sim.advance(0.025 + frame * 0.01)
+        done.set()
+        thread.join()
+        versions = [version for version, _ in seen]
+        assert versions == sorted(versions)
+        assert all(step == pytest.approx(0.01, abs=1e-6) or step == 0.0 for _, step in seen)
+
+
+class TestObjectPose:
+    def test_lerp_takes_shortest_arc(self):
+        a = ObjectPose.from_euler(np.zeros(3), [0.0, 350.0, 0.0], 1.0)
+        b = ObjectPose.from_euler(np.ones(3), [0.0, 10.0, 0.0], 2.0)
+        mid = a.lerp(b, 0.5)
+        np.testing.assert_allclose(mid.rotation_deg, [0.0, 0.0, 0.0], atol=1e-9)
+        np.testing.assert_allclose(mid.position, [0.5, 0.5, 0.5])
+        assert mid.scale == pytest.approx(1.5)
+
+
+class TestOrientation:
+    def test_view_axis_rotations_never_lock(self):
+        obj = FloatingObject()
+        obj.apply_rotation(np.array([0.0, 90.0, 0.0]))
+        about_x, about_z = FloatingObject(), FloatingObject()
+        about_x.orientation = obj.orientation.copy()
+        about_z.orientation = obj.orientation.copy()
+        about_x.apply_rotation(np.array([10.0, 0.0, 0.0]))
+        about_z.apply_rotation(np.array([0.0, 0.0, 10.0]))
+        # With Euler angles at y=90 both deltas would turn the object about the same axis.
+        assert not np.allclose(about_x.model_matrix[:3, :3], about_z.model_matrix[:3, :3], atol=1e-3)
+
+        ten = np.radians(10.0)
+        turn_x = np.array([[1, 0, 0], [0, np.cos(ten), -np.sin(ten)], [0, np.sin(ten), np.cos(ten)]])
+        np.testing.assert_allclose(about_x.model_matrix[:3, :3], turn_x @ obj.model_matrix[:3, :3], atol=1e-6)
+
+    def test_model_matrix_is_cached_until_the_object_changes(self):
+        obj = FloatingObject()
+        matrix = obj.model_matrix
+        assert obj.model_matrix is matrix
+        obj.apply_translation(np.array([0.5, 0.0, 0.0]))
+        moved = obj.model_matrix
+        assert moved is not matrix and moved[0, 3] == pytest.approx(0.5)
+        np.testing.assert_allclose(moved, obj.pose().model_matrix)
+
+    def test_euler_view_round_trips(self):
+        obj = FloatingObject()
+        obj.rotation_deg = [30.0, 45.0, 60.0]
+        np.testing.assert_allclose(obj.rotation_deg, [30.0, 45.0, 60.0], atol=1e-9)
+
+
+class TestObjectVersion:
+    def test_version_tracks_visible_changes_only(self):
+        obj = FloatingObject()
+        version = obj.version
+        obj.apply_translation(np.zeros(3))
+        obj.apply_scale(0.0)
+        obj.color = obj.color
+        assert obj.version == version
+
+        obj.apply_rotation(np.array([0.0, 5.0, 0.0]))
+        obj.toggle_color()
+        obj.toggle_type()
+        assert obj.version == version + 3
+
+    def test_idle_simulation_keeps_the_version(self):
+        sim = ObjectSimulation(FloatingObject(), clock=FixedStepClock(120.0))
+        sim.push(_output(translation=(0.1, 0.0, 0.0)))
+        sim.advance(0.0)
+        sim.advance(0.1)
+        moved = sim.snapshot.object_version
+        sim.push(_output())
+        sim.advance(0.2)
+        sim.advance(0.3)
+        assert sim.snapshot.object_version == moved == sim.floating_object.version
+
+    def test_added_type_joins_the_cycle_once(self):
+        obj = FloatingObject()
+        obj.add_type("model_ab12")
+        obj.add_type("model_ab12")
+        seen = []
+        for _ in range(4):
+            obj.toggle_type()
+            seen.append(obj.object_type)
+        assert seen == ["pyramid", "sphere", "model_ab12", "cube"]
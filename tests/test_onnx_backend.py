@@ -0,0 +1,81 @@
+"""
+Unit tests for gestures/onnx_backend.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pytest
+
+from core.config import AppConfig
+from gestures.gesture_classifier import build_classifier
+from gestures.gesture_predictor import GesturePredictor
+from gestures.gesture_trainer import GestureTrainer
+from gestures.model_bundle import onnx_path, read_manifest
+
+pytest.importorskip("skl2onnx")
+pytest.importorskip("onnxruntime")
+
+from gestures.onnx_backend import OnnxClassifier, export_onnx  # noqa: E402
+
+
+def _blobs(rng, per_label=80, features=12):
+    x = np.concatenate([rng.normal(center, 0.5, size=(per_label, features)) for center in (-1.0, 0.0, 1.0)])
+    y = np.repeat(["fist", "open_palm", "pinch"], per_label)
+    return x.astype(np.float32), y
+
+
+class TestOnnxParity:
+    @pytest.mark.parametrize("classifier", ["random_forest", "svm"])
+    def test_probabilities_match_sklearn(self, tmp_path, classifier):
+        x, y = _blobs(np.random.default_rng(0))
+        model = build_classifier(classifier, params={"n_jobs": 1} if classifier == "random_forest" else None)
+        model.fit(x, y)
+        path = export_onnx(model, x.shape[1], tmp_path / "model.onnx")
+
+        onnx_model = OnnxClassifier(path, model.classes_, threads=2)
+        np.testing.assert_allclose(onnx_model.predict_proba(x), model.predict_proba(x), atol=1e-4)
+        assert onnx_model.predict(x).tolist() == model.predict(x).tolist()
+        assert onnx_model.predict_proba(x[0]).shape == (1, 3)
+
+
+class TestOnnxPredictor:
+    def _config(self, tmp_path, classifier):
+        return AppConfig(
+            dataset_path=tmp_path / "dataset.csv",
+            model_path=tmp_path / "model.pkl",
+            log_path=tmp_path / "app.log",
+            feature_cache_dir=tmp_path / "features",
+            classifier_type=classifier,
+            classifier_params={"n_estimators": 20, "n_jobs": 1} if classifier == "random_forest" else {},
+            inference_backend="onnx",
+        )
+
+    def _train(self, config):
+        trainer = GestureTrainer(config, logger=logging.getLogger("test"))
+        x, y = _blobs(np.random.default_rng(1), per_label=20)
+        for row, label in zip(x, y):
+            trainer.dataset.append_sample(row, label)
+        trainer.train()
+
+    def test_trainer_exports_and_predictor_uses_onnx(self, tmp_path):
+        config = self._config(tmp_path, "random_forest")
+        self._train(config)
+        assert onnx_path(config.model_path).exists()
+        assert read_manifest(config.model_path)["onnx"]["file"] == "model.onnx"
+
+        predictor = GesturePredictor(config.model_path, threshold=0.0, smoothing_window=1, backend="onnx")
+        assert predictor.active_backend == "onnx"
+        result = predictor.predict(np.full(12, 1.0, dtype=np.float32))
+        assert result is not None and result.raw_label == "pinch"
+
+    def test_unsupported_model_falls_back_to_sklearn(self, tmp_path):
+        config = self._config(tmp_path, "prototype")
+        self._train(config)
+        assert not onnx_path(config.model_path).exists()
+
+        predictor = GesturePredictor(config.model_path, threshold=0.0, smoothing_window=1, backend="onnx")
+        assert predictor.active_backend == "sklearn"
+        assert predictor.predict(np.full(12, -1.0, dtype=np.float32)).raw_label == "fist"
@@ -0,0 +1,122 @@
+"""
+Unit tests for the 2D overlay helpers
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from ui.overlay import DIM_FACTOR, _fill_tile, blend_rect, dim_frame, draw_panel
+from ui.renderer import Renderer
+from ui.renderer_debug import DebugRenderer
+
+
+def _frame(height: int = 240, width: int = 320) -> np.ndarray:
+    return np.random.default_rng(1).integers(0, 255, (height, width, 3), dtype=np.uint8)
+
+
+class TestBlendRect:
+    def test_matches_full_frame_blend_inside_rect(self):
+        frame = _frame()
+        expected = frame.copy()
+        overlay = expected.copy()
+        cv2.rectangle(overlay, (20, 30), (120, 90), (20, 20, 25), -1)
+        cv2.addWeighted(overlay, 0.65, expected, 0.35, 0, expected)
+
+        blend_rect(frame, (20, 30, 120, 90), (20, 20, 25), 0.65)
+
+        assert np.abs(frame.astype(int) - expected).max() <= 1
+
+    def test_leaves_pixels_outside_rect_untouched(self):
+        frame = _frame()
+        before = frame.copy()
+        blend_rect(frame, (20, 30, 120, 90), (0, 0, 0), 0.5)
+        mask = np.ones(frame.shape[:2], dtype=bool)
+        mask[30:91, 20:121] = False
+        assert np.array_equal(frame[mask], before[mask])
+
+    def test_clips_to_frame_edges(self):
+        frame = _frame(60, 80)
+        blend_rect(frame, (-10, -10, 200, 200), (0, 0, 0), 1.0)
+        assert not frame.any()
+        blend_rect(frame, (100, 100, 120, 120), (255, 255, 255), 1.0)
+        assert not frame.any()
+
+    def test_fill_tile_is_cached_and_read_only(self):
+        tile = _fill_tile(10, 20, (1, 2, 3))
+        assert _fill_tile(10, 20, (1, 2, 3)) is tile
+        assert not tile.flags.writeable
+
+
+class TestDrawPanel:
+    def test_matches_legacy_panel_away_from_the_border(self):
+        frame = _frame()
+        legacy = frame.copy()
+        overlay = legacy.copy()
+        cv2.rectangle(overlay, (18, 18), (218, 118), (18, 18, 22), -1, cv2.LINE_AA)
+        cv2.addWeighted(overlay, 0.72, legacy, 0.28, 0, legacy)
+        cv2.rectangle(legacy, (18, 18), (218, 118), (80, 80, 90), 1, cv2.LINE_AA)
+
+        draw_panel(frame, (18, 18), (200, 100))
+
+        diff = np.abs(frame.astype(int) - legacy).max(axis=2)
+        interior = np.zeros_like(diff, dtype=bool)
+        interior[21:116, 21:216] = True
+        assert diff[interior].max() <= 1
+        outside = np.ones_like(interior)
+        outside[15:122, 15:222] = False
+        assert diff[outside].max() == 0
+
+
+def _peak_bytes(render, repeats: int = 5) -> int:
+    render()
+    tracemalloc.start()
+    try:
+        for _ in range(repeats):
+            render()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestCanvasReuse:
+    def test_dim_frame_matches_scaled_frame(self):
+        frame = _frame()
+        dimmed = dim_frame(frame)
+        assert dimmed.dtype == np.uint8
+        assert np.abs(dimmed.astype(int) - (frame * DIM_FACTOR)).max() <= 0.5 + 1e-9
+
+    def test_dim_frame_writes_into_matching_buffer(self):
+        frame = _frame()
+        out = np.zeros_like(frame)
+        assert dim_frame(frame, out) is out
+        assert dim_frame(_frame(10, 10), out) is not out
+
+    def test_renderers_do_not_allocate_frame_sized_buffers(self):
+        frame = _frame(720, 1280)
+        renderer = Renderer("r", backend="null")
+        debug = DebugRenderer("d", backend="null")
+
+        def draw():
+            renderer.render(frame, [], 30.0, "pinch", 0.9, "MOVING", "ok", True, "pinch", 3, 40)
+
+        def draw_debug():
+            debug.render(frame, 30.0, "pinch", 1.0, (0.0, 0.0, 0.0), False, False, "ok")
+
+        assert _peak_bytes(draw) < frame.nbytes // 20
+        assert _peak_bytes(draw_debug) < frame.nbytes // 20
+
+    def test_offscreen_display_copies_the_reused_canvas(self):
+        renderer = DebugRenderer("d", backend="offscreen")
+        frame = np.full((60, 80, 3), 200, dtype=np.uint8)
+        renderer.render(frame, 30.0, "idle", 1.0, (0.0, 0.0, 0.0), False, False, "ok")
+        shown = renderer.display.last_frame
+        assert shown is not renderer._canvas and np.array_equal(shown, renderer._canvas)
+        renderer._canvas[:] = 0
+        assert shown.any()
@@ -0,0 +1,53 @@
+"""
+Unit tests for gestures/prototype_classifier.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from gestures.prototype_classifier import PrototypeClassifier
+
+
+def _blobs(rng, centers, per_class=50):
+    xs, ys = [], []
+    for label, center in centers.items():
+        xs.append(rng.normal(center, 0.2, size=(per_class, len(center))))
+        ys += [label] * per_class
+    return np.vstack(xs), np.array(ys)
+
+
+class TestPrototypeClassifier:
+    def setup_method(self):
+        self.rng = np.random.default_rng(3)
+        self.x, self.y = _blobs(self.rng, {"a": [0.0, 0.0, 0.0], "b": [2.0, 2.0, 0.0]})
+
+    def test_partial_fit_matches_full_fit(self):
+        full = PrototypeClassifier().fit(self.x, self.y)
+        streamed = PrototypeClassifier()
+        for start in range(0, len(self.y), 17):
+            streamed.partial_fit(self.x[start:start + 17], self.y[start:start + 17])
+
+        np.testing.assert_allclose(streamed.centroids_, full.centroids_, atol=1e-9)
+        np.testing.assert_allclose(streamed.scale_, full.scale_, atol=1e-9)
+
+    def test_new_class_is_learned_incrementally(self):
+        model = PrototypeClassifier().fit(self.x, self.y)
+        x_new, y_new = _blobs(self.rng, {"c": [-2.0, 2.0, 1.0]}, per_class=20)
+        model.partial_fit(x_new, y_new)
+
+        assert list(model.classes_) == ["a", "b", "c"]
+        assert model.class_counts == {"a": 50, "b": 50, "c": 20}
+        assert model.predict([[-2.0, 2.0, 1.0]])[0] == "c"
+
+    def test_probabilities_are_normalized_and_confident(self):
+        model = PrototypeClassifier().fit(self.x, self.y)
+        proba = model.predict_proba(self.x[:5])
+        np.testing.assert_allclose(proba.sum(axis=1), 1.0)
+        assert (proba[:, 0] > 0.8).all()
+
+    def test_rejects_feature_count_change(self):
+        model = PrototypeClassifier().fit(self.x, self.y)
+        with pytest.raises(ValueError):
+            model.partial_fit(np.zeros((2, 4)), ["a", "b"])
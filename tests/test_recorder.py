@@ -0,0 +1,184 @@
+"""
+Unit tests for ui/recorder.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+
+from __future__ import annotations
+
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from ui.debug_presenter import DebugPresenter
+from ui.recorder import MAX_GAP_SEC, FrameRecorder, RecordingSession
+from ui.renderer_debug import DebugRenderer
+
+
+class _FakeWriter:
+    """Keeps the value of the first pixel of every written frame."""
+
+    def __init__(self, gate: threading.Event = None) -> None:
+        self.gate = gate
+        self.values = []
+        self.released = False
+
+    def isOpened(self) -> bool:
+        return True
+
+    def write(self, frame) -> None:
+        if self.gate is not None:
+            self.gate.wait(2.0)
+        self.values.append(int(frame[0, 0, 0]))
+
+    def release(self) -> None:
+        self.released = True
+
+
+def _fake_recorder(tmp_path, writer, fps=10.0, ring_size=4) -> FrameRecorder:
+    return FrameRecorder(tmp_path / "out.mp4", fps=fps, ring_size=ring_size, writer_factory=lambda *_: writer)
+
+
+def _frame(value: int, shape=(48, 64, 3)) -> np.ndarray:
+    return np.full(shape, value, dtype=np.uint8)
+
+
+class TestFrameRecorder:
+    def test_writes_readable_video(self, tmp_path):
+        recorder = FrameRecorder(tmp_path / "clip" / "out.mp4", fps=10.0, ring_size=8)
+        for index in range(5):
+            assert recorder.offer(_frame(40 * index), timestamp=index / 10.0)
+        stats = recorder.stop()
+
+        assert stats.error is None
+        assert stats.frames_encoded == 5 and stats.frames_dropped == 0
+        capture = cv2.VideoCapture(str(stats.path))
+        frames = []
+        ok, frame = capture.read()
+        while ok:
+            frames.append(frame)
+            ok, frame = capture.read()
+        capture.release()
+        assert len(frames) == 5
+        assert frames[0].shape == (48, 64, 3)
+        assert abs(int(frames[-1].mean()) - 160) < 8
+
+    def test_full_ring_drops_instead_of_blocking(self, tmp_path):
+        gate = threading.Event()
+        writer = _FakeWriter(gate)
+        recorder = _fake_recorder(tmp_path, writer, ring_size=3)
+        accepted = [recorder.offer(_frame(index), timestamp=index / 10.0) for index in range(10)]
+        gate.set()
+        stats = recorder.stop()
+
+        # Slots return to the ring only after they are encoded, so the blocked writer frees none.
+        assert accepted == [True] * 3 + [False] * 7
+        assert stats.frames_offered == 10
+        assert stats.frames_dropped == 7
+        assert writer.values == [0, 1, 2]
+        assert writer.released
+
+    def test_paces_output_to_timestamps(self, tmp_path):
+        writer = _FakeWriter()
+        recorder = _fake_recorder(tmp_path, writer, fps=10.0)
+        recorder.offer(_frame(1), timestamp=0.0)
+        recorder.offer(_frame(2), timestamp=0.3)  # gap: frame 1 held for three slots
+        recorder.offer(_frame(3), timestamp=0.32)  # same slot as frame 2: skipped
+        recorder.offer(_frame(4), timestamp=0.4)
+        recorder.stop()
+
+        assert writer.values == [1, 1, 1, 2, 4]
+
+    def test_long_gap_is_capped(self, tmp_path):
+        writer = _FakeWriter()
+        recorder = _fake_recorder(tmp_path, writer, fps=10.0)
+        recorder.offer(_frame(1), timestamp=0.0)
+        recorder.offer(_frame(2), timestamp=60.0)
+        recorder.offer(_frame(3), timestamp=60.1)
+        recorder.stop()
+
+        repeats = int(MAX_GAP_SEC * 10)
+        assert writer.values == [1] * (repeats + 1) + [2, 3]
+
+    def test_resizes_mismatched_frames(self, tmp_path):
+        writer = _FakeWriter()
+        recorder = _fake_recorder(tmp_path, writer)
+        recorder.offer(_frame(5), timestamp=0.0)
+        recorder.offer(_frame(9, shape=(96, 128, 3)), timestamp=0.1)
+        recorder.stop()
+
+        assert writer.values == [5, 9]
+
+    def test_offer_after_stop_is_ignored(self, tmp_path):
+        recorder = _fake_recorder(tmp_path, _FakeWriter())
+        stats = recorder.stop()
+        assert not recorder.offer(_frame(1))
+        assert stats.frames_offered == 0
+
+    def test_invalid_settings(self, tmp_path):
+        with pytest.raises(ValueError):
+            FrameRecorder(tmp_path / "out.mp4", fps=0)
+        with pytest.raises(ValueError):
+            FrameRecorder(tmp_path / "out.mp4", ring_size=1)
+
+
+class TestRecordingSession:
+    def test_sinks_and_names(self, tmp_path):
+        session = RecordingSession(tmp_path, fps=10.0)
+        with pytest.raises(ValueError):
+            session.sink("camera")
+        sink = session.sink("debug")
+        for index in range(3):
+            sink(_frame(index), timestamp=index / 10.0)
+        stats = session.stop()
+
+        assert list(stats) == ["debug"]
+        assert stats["debug"].path.name.endswith("_debug.mp4")
+        assert stats["debug"].path.exists()
+        assert stats["debug"].frames_encoded == 3
+
+    def test_debug_presenter_feeds_sink(self):
+        received = []
+        presenter = DebugPresenter(lambda: DebugRenderer("debug", backend="offscreen"), fps=1000.0, threaded=False)
+        presenter.start()
+        presenter.frame_sink = received.append
+        presenter.submit(
+            frame=_frame(120),
+            fps=30.0,
+            gesture_label="idle",
+            scale=1.0,
+            rotation=(0.0, 0.0, 0.0),
+            paused=False,
+            calibration_active=False,
+            status="ok",
+        )
+        shown = presenter.renderer.display.last_frame
+        presenter.close()
+
+        assert len(received) == 1
+        assert received[0].shape == (48, 64, 3)
+        assert np.array_equal(received[0], shown)
+
+    def test_failing_sink_is_detached(self):
+        def broken(frame):
+            raise OSError("disco cheio")
+
+        presenter = DebugPresenter(lambda: DebugRenderer("debug", backend="offscreen"), fps=1000.0, threaded=False)
+        presenter.start()
+        presenter.frame_sink = broken
+        presenter.submit(
+            frame=_frame(120),
+            fps=30.0,
+            gesture_label="idle",
+            scale=1.0,
+            rotation=(0.0, 0.0, 0.0),
+            paused=False,
+            calibration_active=False,
+            status="ok",
+        )
+        shown = presenter.renderer.display.last_frame
+        presenter.close()
+
+        assert shown is not None
+        assert presenter.frame_sink is None
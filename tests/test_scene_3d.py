@@ -0,0 +1,156 @@
+"""
+Unit tests for interaction/scene_3d.py and ui/instanced_draw.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from interaction.floating_object import FloatingObject
+from interaction.scene_3d import BOUNDING_RADIUS, OBJECT_TYPES, Scene3D, camera_ray, model_matrices
+from utils.math_utils import quat_from_euler_deg
+
+
+def _rotation(axis, degrees):
+    c, s = np.cos(np.radians(degrees)), np.sin(np.radians(degrees))
+    i, j = [(1, 2), (2, 0), (0, 1)][axis]
+    matrix = np.eye(4)
+    matrix[i, i], matrix[i, j], matrix[j, i], matrix[j, j] = c, -s, s, c
+    return matrix
+
+
+def _offscreen(width=160, height=120):
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    pytest.importorskip("OpenGL")
+    pytest.importorskip("pygame")
+    try:
+        from ui.offscreen_gl import OffscreenContext
+
+        return OffscreenContext(width, height)
+    except Exception as exc:  # pragma: no cover - depends on the host GL stack
+        pytest.skip(f"Contexto OpenGL offscreen indisponivel: {exc}")
+
+
+class TestScene3D:
+    def test_model_matrices_match_gl_composition(self):
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(-2, 2, (20, 3))
+        rotations = rng.uniform(0, 360, (20, 3))
+        scales = rng.uniform(0.3, 2.0, 20)
+        orientations = np.stack([quat_from_euler_deg(r) for r in rotations])
+        for matrix, t, r, s in zip(model_matrices(positions, orientations, scales), positions, rotations, scales):
+            expected = np.eye(4)
+            expected[:3, 3] = t
+            expected = expected @ _rotation(0, r[0]) @ _rotation(1, r[1]) @ _rotation(2, r[2]) @ np.diag([s, s, s, 1])
+            np.testing.assert_allclose(matrix, expected, atol=1e-5)
+
+    def test_snapshot_excludes_active_and_is_cached(self):
+        scene = Scene3D(FloatingObject())
+        scene.populate_grid(30)
+        snapshot = scene.snapshot()
+        assert len(scene) == 31
+        assert snapshot.instance_count == 30
+        assert set(snapshot.batches) == set(OBJECT_TYPES)
+        assert scene.snapshot() is snapshot
+        with pytest.raises(ValueError):
+            snapshot.batches["cube"][0, 0] = 1.0
+
+        scene.active.apply_translation(np.array([0.5, 0.0, 0.0]))
+        scene.store_active()
+        assert scene.snapshot() is snapshot
+
+    def test_select_swaps_active_state(self):
+        active = FloatingObject()
+        scene = Scene3D(active)
+        other = scene.add_object("sphere", (1.0, 0.55, 0.25), position=(1.0, 1.0, -5.0), scale=0.5)
+        active.apply_translation(np.array([0.3, 0.0, 0.0]))
+        active.toggle_color()
+
+        scene.select(other)
+        assert active.object_type == "sphere" and active.scale == pytest.approx(0.5)
+        np.testing.assert_allclose(active.position, [1.0, 1.0, -5.0])
+        first = scene.snapshot().batches["cube"]
+        assert len(first) == 1
+        np.testing.assert_allclose(first[0, 12:15], [0.3, 0.0, -3.0], atol=1e-6)
+
+        scene.select_next()
+        assert scene.active_index == 0
+        np.testing.assert_allclose(active.position, [0.3, 0.0, -3.0], atol=1e-6)
+        assert active.color == (1.0, 0.55, 0.25)
+        active.toggle_color()
+        assert active.color == (0.7, 0.9, 0.3)
+
+    def test_bounding_radius_covers_meshes(self):
+        from ui.meshes import build_mesh
+
+        for name in OBJECT_TYPES:
+            extent = np.linalg.norm(build_mesh(name).vertices, axis=1).max()
+            assert extent == pytest.approx(BOUNDING_RADIUS[name], abs=1e-5)
+
+    def test_camera_ray_hits_projected_point(self):
+        aspect = 4.0 / 3.0
+        point = np.array([0.8, -0.5, -5.0])
+        # Project with the same perspective as gluPerspective(45, aspect, ...).
+        focal = 1.0 / np.tan(np.radians(45.0) / 2.0)
+        ndc = np.array([focal / aspect * point[0], focal * point[1]]) / -point[2]
+        origin, direction = camera_ray((ndc[0] + 1.0) / 2.0, (1.0 - ndc[1]) / 2.0, aspect)
+        np.testing.assert_allclose(origin + direction * np.linalg.norm(point), point, atol=1e-9)
+
+    def test_pick_follows_transforms(self):
+        scene = Scene3D(FloatingObject())
+        far = scene.add_object("sphere", position=(1.5, 0.0, -6.0), scale=0.5)
+        origin, direction = camera_ray(0.5, 0.5, 4.0 / 3.0)
+        assert scene.pick_ray(origin, direction) == 0
+
+        scene.active.apply_translation(np.array([-2.0, 0.0, 0.0]))
+        scene.store_active()
+        assert scene.pick_ray(origin, direction) is None
+        assert scene.pick_ray(origin, (1.5, 0.0, -6.0) / np.linalg.norm((1.5, 0.0, -6.0))) == far
+
+        scene.active.apply_scale(1.0)
+        scene.store_active()
+        assert scene.pick_ray(origin, direction) == 0
+
+        added = scene.add_object("cube", position=(0.0, 0.0, -1.5), scale=0.3)
+        assert scene.pick_ray(origin, direction) == added
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            Scene3D(FloatingObject()).add_object("torus")
+
+
+class TestInstancedDrawGL:
+    def _render(self, context, scene, instanced):
+        from core.config import AppConfig
+        from ui.renderer_3d import Renderer3D
+
+        renderer = Renderer3D(AppConfig(render_width=context.width, render_height=context.height), "test")
+        renderer._setup_gl()
+        if not instanced:
+            renderer._instances._instanced = False
+        elif not renderer._instances.instanced:
+            pytest.skip("Contexto sem suporte a instancing.")
+        try:
+            renderer._draw_scene(scene.active.pose(), scene.active.object_type, scene.active.color, scene.snapshot())
+            return context.read_pixels(), renderer._instances.draw_calls
+        finally:
+            renderer._release_gl()
+
+    def test_instanced_matches_per_object_drawing(self):
+        context = _offscreen()
+        scene = Scene3D(FloatingObject())
+        scene.populate_grid(60)
+        try:
+            instanced, instanced_calls = self._render(context, scene, instanced=True)
+            fallback, fallback_calls = self._render(context, scene, instanced=False)
+        finally:
+            context.release()
+
+        # One call per type, plus one per extra sphere LOD in use.
+        assert len(OBJECT_TYPES) <= instanced_calls <= len(OBJECT_TYPES) + 2
+        assert fallback_calls == 60
+        diff = np.abs(instanced.astype(int) - fallback.astype(int))
+        assert diff.max() <= 2
@@ -0,0 +1,70 @@
+"""
+Unit tests for ui/text_sprites.py
+Author: Matheus Siqueira <https://www.matheussiqueira.dev/>
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from ui.overlay import draw_status_block  # noqa: E402
+from ui.overlay_3d import draw_3d_status  # noqa: E402
+from ui.text_sprites import TEXT_FONT, draw_text, text_sprite  # noqa: E402
+
+
+def _frame(height: int = 120, width: int = 320) -> np.ndarray:
+    return np.random.default_rng(2).integers(0, 255, (height, width, 3), dtype=np.uint8)
+
+
+class TestTextSprites:
+    @pytest.mark.parametrize("text", ["Gesto: idle", "Rot: X=-12.0 Y= 45.0", "gy|pq_"])
+    @pytest.mark.parametrize("thickness", [1, 2])
+    def test_matches_put_text(self, text, thickness):
+        frame = _frame()
+        expected = frame.copy()
+        cv2.putText(expected, text, (20, 60), TEXT_FONT, 0.6, (255, 220, 120), thickness, cv2.LINE_AA)
+
+        draw_text(frame, text, (20, 60), 0.6, (255, 220, 120), thickness=thickness)
+
+        diff = np.abs(frame.astype(int) - expected)
+        assert diff.max() <= 6
+        assert (diff > 2).mean() < 0.001
+
+    def test_sprite_margin_holds_the_whole_stroke(self):
+        sprite = text_sprite("gy|pq_ Wj", 0.6, (255, 255, 255), thickness=2)
+        keep = sprite.keep[..., 0]
+        for edge in (keep[0], keep[-1], keep[:, 0], keep[:, -1]):
+            assert edge.min() == 255
+
+    def test_sprites_are_cached_per_text_and_color(self):
+        sprite = text_sprite("FPS:  30.0", 0.56, (225, 230, 240))
+        assert text_sprite("FPS:  30.0", 0.56, (225, 230, 240)) is sprite
+        assert text_sprite("FPS:  30.0", 0.56, (0, 0, 255)) is not sprite
+        assert not sprite.keep.flags.writeable and not sprite.ink.flags.writeable
+
+    def test_falls_back_to_put_text_at_frame_edges(self):
+        frame = _frame(40, 60)
+        expected = frame.copy()
+        cv2.putText(expected, "Status: ok", (30, 10), TEXT_FONT, 0.6, (0, 255, 0), 1, cv2.LINE_AA)
+        draw_text(frame, "Status: ok", (30, 10), 0.6, (0, 255, 0))
+        assert np.array_equal(frame, expected)
+
+    def test_uncached_text_matches_put_text(self):
+        frame = _frame()
+        expected = frame.copy()
+        cv2.putText(expected, "Escala: 1.23", (20, 40), TEXT_FONT, 0.56, (225, 230, 240), 1, cv2.LINE_AA)
+        draw_text(frame, "Escala: 1.23", (20, 40), 0.56, (225, 230, 240), cached=False)
+        assert np.array_equal(frame, expected)
+
+    def test_live_hud_values_do_not_miss_the_cache(self):
+        frame = _frame(260, 480)
+        draw_3d_status(frame, 30.0, "pinch", 1.0, (0.0, 0.0, 0.0), False, False, "ok")
+        draw_status_block(frame, 30.0, "pinch", 0.5, "MOVING", "ok")
+        misses = text_sprite.cache_info().misses
+        for step in range(1, 40):
+            draw_3d_status(frame, 30.0, "pinch", 1.0 + step * 0.01, (step, 2.0 * step, 3.0 * step), False, False, "ok")
+            draw_status_block(frame, 30.0, "pinch", 0.5 + step * 0.01, "MOVING", "ok")
+        assert text_sprite.cache_info().misses == misses
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ui.display import NO_KEY
+from ui.recorder import FrameSink
+from ui.renderer_debug import DebugRenderer
+
+
+class DebugPresenter:
+    """Composes and shows the debug window at ``fps``, off the vision loop.
+
+    ``submit`` only keeps the newest state (older unshown states are dropped).
+    The presenter thread creates the renderer itself, so the HighGUI window
+    is created, painted and polled on one thread. Keys are forwarded to a
+    queue drained by ``poll_key``. With ``threaded=False`` (HighGUI on macOS
+    must stay on the main thread) ``submit`` presents inline, still
+    throttled to ``fps``.
+    """
+
+    def __init__(
+        self,
+        renderer_factory: Callable[[], DebugRenderer],
+        fps: float,
+        threaded: bool = True,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError("fps do painel de debug deve ser positivo.")
+        self._factory = renderer_factory
+        self.interval = 1.0 / fps
+        self.threaded = threaded
+        self.renderer: Optional[DebugRenderer] = None
+        self.frames_submitted = 0
+        self.frames_presented = 0
+        # Handed to the renderer before each frame (see ``DebugRenderer.frame_sink``).
+        self.frame_sink: Optional[FrameSink] = None
+
+        self._keys: "queue.Queue[int]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._latest: Optional[Dict[str, Any]] = None
+        self._next_present = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._ready_event = threading.Event()
+        self._start_error: Optional[BaseException] = None
+
+    def start(self, timeout: float = 5.0) -> None:
+        if not self.threaded:
+            if self.renderer is None:
+                self.renderer = self._factory()
+            return
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._ready_event.clear()
+        self._thread = threading.Thread(target=self._present_loop, name="debug-presenter", daemon=True)
+        self._thread.start()
+        self._ready_event.wait(timeout)
+        if self._start_error is not None:
+            self._thread = None
+            raise RuntimeError("Falha ao iniciar a janela de debug.") from self._start_error
+
+    def submit(self, **state: Any) -> None:
+        """Hand over the arguments of ``DebugRenderer.render`` for the next presented frame."""
+        self.frames_submitted += 1
+        if self.threaded:
+            with self._lock:
+                self._latest = state
+            return
+        now = time.perf_counter()
+        if self.renderer is None or now < self._next_present:
+            return
+        self._next_present = now + self.interval
+        self._present(state)
+
+    def poll_key(self) -> int:
+        if not self.threaded and self.renderer is not None:
+            self._forward_keys()
+        try:
+            return self._keys.get_nowait()
+        except queue.Empty:
+            return NO_KEY
+
+    def _present_loop(self) -> None:
+        try:
+            self.renderer = self._factory()
+        except BaseException as exc:
+            self._start_error = exc
+            self._ready_event.set()
+            return
+        self._ready_event.set()
+
+        next_present = time.perf_counter()
+        while not self._stop_event.wait(max(0.0, next_present - time.perf_counter())):
+            next_present = max(next_present + self.interval, time.perf_counter())
+            with self._lock:
+                state, self._latest = self._latest, None
+            if state is not None:
+                self._present(state)
+            self._forward_keys()
+        self.renderer.close()
+
+    def _present(self, state: Dict[str, Any]) -> None:
+        sink = self.frame_sink
+        self.renderer.frame_sink = sink
+        self.renderer.render(**state)
+        if sink is not None and self.renderer.frame_sink is None and self.frame_sink is sink:
+            # The renderer detached a failing sink; keep it detached.
+            self.frame_sink = None
+        self.frames_presented += 1
+
+    def _forward_keys(self) -> None:
+        key = self.renderer.poll_key()
+        while key != NO_KEY:
+            self._keys.put(key)
+            key = self.renderer.poll_key()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        elif self.renderer is not None:
+            self.renderer.close()
+        self.renderer = None
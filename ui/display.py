@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Optional
+
+import cv2
+import numpy as np
+
+
+DISPLAY_BACKENDS = ("window", "offscreen", "null")
+NO_KEY = -1
+
+
+class WindowDisplay:
+    """HighGUI window; ``poll_key`` also lets OpenCV repaint it."""
+
+    def __init__(self, window_name: str) -> None:
+        self.window_name = window_name
+        self.frames_shown = 0
+        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+
+    @property
+    def last_frame(self) -> Optional[np.ndarray]:
+        return None
+
+    def show(self, canvas: np.ndarray) -> None:
+        cv2.imshow(self.window_name, canvas)
+        self.frames_shown += 1
+
+    def poll_key(self) -> int:
+        key = cv2.waitKey(1)
+        return NO_KEY if key < 0 else key & 0xFF
+
+    def close(self) -> None:
+        cv2.destroyAllWindows()
+
+
+class OffscreenDisplay:
+    """Keeps a copy of the last canvas in memory; keys come from ``press``.
+
+    Renderers reuse one canvas buffer, so the copy goes into a buffer owned here.
+    """
+
+    def __init__(self, window_name: str) -> None:
+        self.window_name = window_name
+        self.frames_shown = 0
+        self._last_frame: Optional[np.ndarray] = None
+        self._keys: Deque[int] = deque()
+
+    @property
+    def last_frame(self) -> Optional[np.ndarray]:
+        return self._last_frame
+
+    def show(self, canvas: np.ndarray) -> None:
+        if self._last_frame is None or self._last_frame.shape != canvas.shape:
+            self._last_frame = canvas.copy()
+        else:
+            np.copyto(self._last_frame, canvas)
+        self.frames_shown += 1
+
+    def press(self, key: int) -> None:
+        self._keys.append(int(key) & 0xFF)
+
+    def poll_key(self) -> int:
+        return self._keys.popleft() if self._keys else NO_KEY
+
+    def close(self) -> None:
+        self._last_frame = None
+
+
+class NullDisplay(OffscreenDisplay):
+    """Counts frames and drops them."""
+
+    def show(self, canvas: np.ndarray) -> None:
+        self.frames_shown += 1
+
+
+def create_display(backend: str, window_name: str):
+    if backend == "window":
+        return WindowDisplay(window_name)
+    if backend == "offscreen":
+        return OffscreenDisplay(window_name)
+    if backend == "null":
+        return NullDisplay(window_name)
+    raise ValueError(f"Backend de exibicao invalido: {backend} (use {', '.join(DISPLAY_BACKENDS)})")
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import ctypes
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from OpenGL.GL import (
+    GL_ARRAY_BUFFER,
+    GL_DYNAMIC_DRAW,
+    GL_ELEMENT_ARRAY_BUFFER,
+    GL_FLOAT,
+    GL_FRAGMENT_SHADER,
+    GL_TRIANGLES,
+    GL_UNSIGNED_INT,
+    GL_VERTEX_SHADER,
+    glBindBuffer,
+    glBufferData,
+    glColor3f,
+    glDeleteBuffers,
+    glDeleteProgram,
+    glDisableVertexAttribArray,
+    glDrawElementsInstanced,
+    glEnableVertexAttribArray,
+    glGenBuffers,
+    glMultMatrixf,
+    glPopMatrix,
+    glPushMatrix,
+    glUseProgram,
+    glVertexAttribDivisor,
+    glVertexAttribPointer,
+)
+from OpenGL.GL.shaders import compileProgram, compileShader
+
+from interaction.scene_3d import INSTANCE_FLOATS, SceneSnapshot
+from ui.mesh_cache import MeshCache
+from ui.meshes import clamp_lod, select_lod, select_lods
+
+
+# Reproduces the fixed-function setup of Renderer3D: color material, 0.2 global
+# ambient and one diffuse point light given in eye space.
+_VERTEX_SHADER = """
+#version 330 compatibility
+layout(location = 0) in vec3 a_position;
+layout(location = 1) in vec3 a_normal;
+layout(location = 2) in vec4 a_model0;
+layout(location = 3) in vec4 a_model1;
+layout(location = 4) in vec4 a_model2;
+layout(location = 5) in vec4 a_model3;
+layout(location = 6) in vec3 a_color;
+out vec3 v_color;
+
+void main() {
+    mat4 model_view = gl_ModelViewMatrix * mat4(a_model0, a_model1, a_model2, a_model3);
+    vec4 eye = model_view * vec4(a_position, 1.0);
+    vec3 normal = normalize(mat3(model_view) * a_normal);
+    vec3 light = normalize(gl_LightSource[0].position.xyz - eye.xyz);
+    v_color = min(a_color * (0.2 + max(dot(normal, light), 0.0)), vec3(1.0));
+    gl_Position = gl_ProjectionMatrix * eye;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330 compatibility
+in vec3 v_color;
+out vec4 frag_color;
+
+void main() {
+    frag_color = vec4(v_color, 1.0);
+}
+"""
+
+_ROW_BYTES = INSTANCE_FLOATS * 4
+_VERTEX_BYTES = 6 * 4
+
+
+class InstancedSceneDrawer:
+    """Draws scene snapshots with one instanced call per mesh type.
+
+    Instances are grouped per level of detail, so there is one call per
+    (type, LOD) pair in use. Falls back to a ``glMultMatrixf`` loop when the
+    context has no GLSL 3.30 or instanced arrays (legacy GL 2.1 contexts).
+    Instance buffers are re-uploaded only when the snapshot version changes.
+    """
+
+    def __init__(self, meshes: MeshCache, logger: Optional[logging.Logger] = None) -> None:
+        self.meshes = meshes
+        self.logger = logger or logging.getLogger(__name__)
+        self._program: Optional[int] = None
+        self._instanced: Optional[bool] = None
+        self._buffers: Dict[Tuple[str, int], int] = {}
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._uploaded_version: Optional[int] = None
+        self.draw_calls = 0
+
+    @property
+    def instanced(self) -> bool:
+        if self._instanced is None:
+            self._instanced = self._build_program()
+        return self._instanced
+
+    def draw(self, snapshot: SceneSnapshot) -> None:
+        self.draw_calls = 0
+        if snapshot.instance_count == 0:
+            return
+        if self.instanced:
+            self._draw_instanced(snapshot)
+        else:
+            self._draw_fallback(snapshot)
+
+    def release(self) -> None:
+        if self._buffers:
+            glDeleteBuffers(len(self._buffers), list(self._buffers.values()))
+            self._buffers.clear()
+        self._counts.clear()
+        if self._program:
+            glDeleteProgram(self._program)
+            self._program = None
+        self._instanced = None
+        self._uploaded_version = None
+
+    def _build_program(self) -> bool:
+        try:
+            self._program = compileProgram(
+                compileShader(_VERTEX_SHADER, GL_VERTEX_SHADER),
+                compileShader(_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+            )
+        except Exception:
+            self.logger.warning("Instancing indisponivel; desenhando objeto a objeto.")
+            self._program = None
+            return False
+        return bool(glDrawElementsInstanced) and bool(glVertexAttribDivisor)
+
+    def _upload(self, snapshot: SceneSnapshot) -> None:
+        self._counts.clear()
+        for name, batch in snapshot.batches.items():
+            lods = select_lods(batch[:, 12:15], np.linalg.norm(batch[:, 0:3], axis=1))
+            lods = np.minimum(lods, clamp_lod(name, 99))
+            for lod in np.unique(lods):
+                key = (name, int(lod))
+                if key not in self._buffers:
+                    self._buffers[key] = int(glGenBuffers(1))
+                rows = np.ascontiguousarray(batch[lods == lod])
+                glBindBuffer(GL_ARRAY_BUFFER, self._buffers[key])
+                glBufferData(GL_ARRAY_BUFFER, rows, GL_DYNAMIC_DRAW)
+                self._counts[key] = len(rows)
+        self._uploaded_version = snapshot.version
+
+    def _draw_instanced(self, snapshot: SceneSnapshot) -> None:
+        if self._uploaded_version != snapshot.version:
+            self._upload(snapshot)
+
+        glUseProgram(self._program)
+        for location in range(7):
+            glEnableVertexAttribArray(location)
+        for (name, lod), count in self._counts.items():
+            mesh = self.meshes.get(name, lod)
+            glBindBuffer(GL_ARRAY_BUFFER, mesh.vbo)
+            glVertexAttribPointer(0, 3, GL_FLOAT, False, _VERTEX_BYTES, None)
+            glVertexAttribPointer(1, 3, GL_FLOAT, False, _VERTEX_BYTES, ctypes.c_void_p(12))
+            glBindBuffer(GL_ARRAY_BUFFER, self._buffers[(name, lod)])
+            for column in range(4):
+                glVertexAttribPointer(2 + column, 4, GL_FLOAT, False, _ROW_BYTES, ctypes.c_void_p(16 * column))
+                glVertexAttribDivisor(2 + column, 1)
+            glVertexAttribPointer(6, 3, GL_FLOAT, False, _ROW_BYTES, ctypes.c_void_p(64))
+            glVertexAttribDivisor(6, 1)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mesh.ibo)
+            glDrawElementsInstanced(GL_TRIANGLES, mesh.index_count, GL_UNSIGNED_INT, None, count)
+            self.draw_calls += 1
+        for location in range(7):
+            if location >= 2:
+                glVertexAttribDivisor(location, 0)
+            glDisableVertexAttribArray(location)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    def _draw_fallback(self, snapshot: SceneSnapshot) -> None:
+        for name, batch in snapshot.batches.items():
+            for row in batch:
+                matrix = row[:16]
+                lod = select_lod(matrix[12:15], float(np.linalg.norm(matrix[0:3])))
+                glPushMatrix()
+                glMultMatrixf(matrix)
+                glColor3f(*row[16:19])
+                self.meshes.get(name, lod).draw()
+                glPopMatrix()
+                self.draw_calls += 1
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import ctypes
+from typing import Dict, Optional, Tuple
+
+from OpenGL.GL import (
+    GL_ARRAY_BUFFER,
+    GL_ELEMENT_ARRAY_BUFFER,
+    GL_FLOAT,
+    GL_NORMAL_ARRAY,
+    GL_STATIC_DRAW,
+    GL_TRIANGLES,
+    GL_UNSIGNED_INT,
+    GL_VERTEX_ARRAY,
+    glBindBuffer,
+    glBufferData,
+    glDeleteBuffers,
+    glDisableClientState,
+    glDrawElements,
+    glEnableClientState,
+    glGenBuffers,
+    glNormalPointer,
+    glVertexPointer,
+)
+
+from ui.meshes import Mesh, build_mesh, clamp_lod
+
+
+_STRIDE = 6 * 4
+_NORMAL_OFFSET = ctypes.c_void_p(3 * 4)
+
+
+class GpuMesh:
+    """Interleaved position/normal VBO plus index buffer, drawn with one call.
+
+    Uses client-state vertex pointers so it works with the fixed-function
+    lighting the renderer already relies on. Must be created, drawn and
+    released on the thread that owns the GL context.
+    """
+
+    def __init__(self, mesh: Mesh) -> None:
+        self.index_count = int(mesh.indices.size)
+        self.vbo, self.ibo = (int(buffer) for buffer in glGenBuffers(2))
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, mesh.interleaved(), GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, mesh.indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def draw(self) -> None:
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, _STRIDE, None)
+        glNormalPointer(GL_FLOAT, _STRIDE, _NORMAL_OFFSET)
+        glDrawElements(GL_TRIANGLES, self.index_count, GL_UNSIGNED_INT, None)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def release(self) -> None:
+        if self.vbo or self.ibo:
+            glDeleteBuffers(2, [self.vbo, self.ibo])
+            self.vbo = self.ibo = 0
+
+
+class MeshCache:
+    """GPU meshes keyed by ``(object_type, lod)``, built and uploaded on first use."""
+
+    def __init__(self) -> None:
+        self._meshes: Dict[Tuple[str, int], GpuMesh] = {}
+
+    def __len__(self) -> int:
+        return len(self._meshes)
+
+    def get(self, object_type: str, lod: int = 0) -> GpuMesh:
+        key = (object_type, clamp_lod(object_type, lod))
+        mesh: Optional[GpuMesh] = self._meshes.get(key)
+        if mesh is None:
+            mesh = GpuMesh(build_mesh(*key))
+            self._meshes[key] = mesh
+        return mesh
+
+    def release(self) -> None:
+        for mesh in self._meshes.values():
+            mesh.release()
+        self._meshes.clear()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Sequence, Tuple
+
+import numpy as np
+
+
+# Sphere slices/stacks per level of detail; LOD 0 matches the old gluSphere(28, 28).
+SPHERE_LOD_SEGMENTS = (28, 16, 8)
+
+
+@dataclass(frozen=True)
+class Mesh:
+    """Indexed triangle mesh with per-vertex normals."""
+
+    vertices: np.ndarray
+    normals: np.ndarray
+    indices: np.ndarray
+
+    @property
+    def triangle_count(self) -> int:
+        return int(self.indices.size // 3)
+
+    def interleaved(self) -> np.ndarray:
+        """``(n, 6)`` float32 rows of position followed by normal, as uploaded to the GPU."""
+        return np.ascontiguousarray(np.hstack([self.vertices, self.normals]), dtype=np.float32)
+
+
+def _from_faces(faces, normals) -> Mesh:
+    """Build a flat-shaded mesh from convex polygons (fanned into triangles)."""
+    vertices, vertex_normals, indices = [], [], []
+    for face, normal in zip(faces, normals):
+        base = len(vertices)
+        vertices.extend(face)
+        vertex_normals.extend([normal] * len(face))
+        for idx in range(1, len(face) - 1):
+            indices.extend((base, base + idx, base + idx + 1))
+    normals_arr = np.asarray(vertex_normals, dtype=np.float32)
+    normals_arr /= np.linalg.norm(normals_arr, axis=1, keepdims=True)
+    return Mesh(
+        vertices=np.asarray(vertices, dtype=np.float32),
+        normals=normals_arr,
+        indices=np.asarray(indices, dtype=np.uint32),
+    )
+
+
+def build_cube(half: float = 0.6) -> Mesh:
+    h = half
+    faces = [
+        [(-h, -h, h), (h, -h, h), (h, h, h), (-h, h, h)],
+        [(-h, -h, -h), (-h, h, -h), (h, h, -h), (h, -h, -h)],
+        [(-h, h, -h), (-h, h, h), (h, h, h), (h, h, -h)],
+        [(-h, -h, -h), (h, -h, -h), (h, -h, h), (-h, -h, h)],
+        [(h, -h, -h), (h, h, -h), (h, h, h), (h, -h, h)],
+        [(-h, -h, -h), (-h, -h, h), (-h, h, h), (-h, h, -h)],
+    ]
+    normals = [(0, 0, 1), (0, 0, -1), (0, 1, 0), (0, -1, 0), (1, 0, 0), (-1, 0, 0)]
+    return _from_faces(faces, normals)
+
+
+def build_pyramid(half: float = 0.6, apex: float = 0.7) -> Mesh:
+    h = half
+    top = (0.0, apex, 0.0)
+    faces = [
+        [(-h, -h, h), (h, -h, h), top],
+        [(h, -h, h), (h, -h, -h), top],
+        [(h, -h, -h), (-h, -h, -h), top],
+        [(-h, -h, -h), (-h, -h, h), top],
+        [(-h, -h, h), (-h, -h, -h), (h, -h, -h), (h, -h, h)],
+    ]
+    normals = [(0, 0.6, 0.6), (0.6, 0.6, 0), (0, 0.6, -0.6), (-0.6, 0.6, 0), (0, -1, 0)]
+    return _from_faces(faces, normals)
+
+
+def build_sphere(radius: float = 0.7, slices: int = 28, stacks: int = 28) -> Mesh:
+    slices, stacks = max(3, slices), max(2, stacks)
+    theta = np.linspace(0.0, np.pi, stacks + 1)
+    phi = np.linspace(0.0, 2.0 * np.pi, slices + 1)
+    t, p = np.meshgrid(theta, phi, indexing="ij")
+    normals = np.stack([np.sin(t) * np.sin(p), np.cos(t), np.sin(t) * np.cos(p)], axis=-1).reshape(-1, 3)
+
+    row = np.arange(stacks)[:, None] * (slices + 1)
+    col = np.arange(slices)[None, :]
+    a = (row + col).ravel()
+    b = a + slices + 1
+    quads = np.stack([a, b, a + 1, a + 1, b, b + 1], axis=1)
+    # The pole rows collapse to a point; drop their zero-area triangles.
+    keep = np.ones_like(quads, dtype=bool)
+    keep[:slices, :3] = False
+    keep[-slices:, 3:] = False
+    indices = quads[keep].astype(np.uint32)
+    return Mesh(
+        vertices=(normals * radius).astype(np.float32),
+        normals=normals.astype(np.float32),
+        indices=indices,
+    )
+
+
+MESH_BUILDERS: Dict[str, Callable[[int], Mesh]] = {
+    "cube": lambda lod: build_cube(),
+    "pyramid": lambda lod: build_pyramid(),
+    "sphere": lambda lod: build_sphere(
+        slices=SPHERE_LOD_SEGMENTS[lod],
+        stacks=SPHERE_LOD_SEGMENTS[lod],
+    ),
+}
+
+
+MESH_LOD_COUNT: Dict[str, int] = {"cube": 1, "pyramid": 1, "sphere": len(SPHERE_LOD_SEGMENTS)}
+
+
+def register_mesh(object_type: str, lods: Sequence[Mesh]) -> None:
+    """Make an imported mesh (LOD 0 first) drawable under ``object_type``."""
+    levels = tuple(lods)
+    if not levels:
+        raise ValueError(f"Malha sem niveis de detalhe: {object_type}")
+    MESH_BUILDERS[object_type] = lambda lod: levels[lod]
+    MESH_LOD_COUNT[object_type] = len(levels)
+
+
+def clamp_lod(object_type: str, lod: int) -> int:
+    return max(0, min(int(lod), MESH_LOD_COUNT.get(object_type, 1) - 1))
+
+
+def build_mesh(object_type: str, lod: int = 0) -> Mesh:
+    builder = MESH_BUILDERS.get(object_type)
+    if builder is None:
+        raise ValueError(f"Tipo de objeto nao suportado: {object_type}")
+    return builder(clamp_lod(object_type, lod))
+
+
+def select_lod(position: Tuple[float, float, float], scale: float, radius: float = 0.7) -> int:
+    """Pick a level of detail from the object's approximate projected size."""
+    distance = max(1e-3, float(np.linalg.norm(position)))
+    projected = radius * scale / distance
+    if projected > 0.1:
+        return 0
+    if projected > 0.04:
+        return 1
+    return 2
+
+
+def select_lods(positions: np.ndarray, scales: np.ndarray, radius: float = 0.7) -> np.ndarray:
+    """Vectorised ``select_lod`` for ``(n, 3)`` positions and ``(n,)`` scales."""
+    distance = np.maximum(1e-3, np.linalg.norm(np.asarray(positions, dtype=np.float64), axis=1))
+    projected = radius * np.asarray(scales, dtype=np.float64) / distance
+    return np.where(projected > 0.1, 0, np.where(projected > 0.04, 1, 2))
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ui.meshes import Mesh
+from utils.npy_store import load_npy, save_npy_atomic
+
+
+# Bump when parsing or simplification changes, so stale caches are rebuilt.
+MODEL_LOADER_VERSION = 1
+# Models are centered and scaled to this bounding radius, like the built-in sphere.
+MODEL_RADIUS = 0.7
+# Vertex-clustering grid resolution (cells across the longest side) of LOD 1 and 2.
+MODEL_LOD_CELLS = (40, 16)
+
+_GLTF_COMPONENTS = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+_GLTF_WIDTHS = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT4": 16}
+_GLB_MAGIC = 0x46546C67
+
+
+def vertex_normals(vertices: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Area-weighted smooth normals."""
+    triangles = vertices[indices.reshape(-1, 3)]
+    faces = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    normals = np.zeros_like(vertices, dtype=np.float64)
+    for corner in range(3):
+        np.add.at(normals, indices.reshape(-1, 3)[:, corner], faces)
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.where(length > 1e-12, normals / np.maximum(length, 1e-12), (0.0, 1.0, 0.0))
+    return normals.astype(np.float32)
+
+
+def _finish(vertices: np.ndarray, indices: np.ndarray, normals: Optional[np.ndarray] = None) -> Mesh:
+    vertices = np.asarray(vertices, dtype=np.float32)
+    indices = np.asarray(indices, dtype=np.uint32).reshape(-1)
+    if not len(indices) or indices.size % 3 or indices.max() >= len(vertices):
+        raise ValueError("Malha sem triangulos validos.")
+    if normals is None:
+        normals = vertex_normals(vertices, indices)
+    else:
+        normals = np.asarray(normals, dtype=np.float32)
+        length = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.where(length > 1e-12, normals / np.maximum(length, 1e-12), (0.0, 1.0, 0.0)).astype(np.float32)
+    return Mesh(vertices=vertices, normals=normals, indices=indices)
+
+
+def _obj_vectors(lines: List[str]) -> np.ndarray:
+    tokens = " ".join(lines).split()
+    if len(tokens) == 3 * len(lines):
+        return np.array(tokens, dtype=np.float32).reshape(-1, 3)
+    # Optional w or vertex colors after xyz: keep the first three values.
+    return np.array([line.split()[:3] for line in lines], dtype=np.float32)
+
+
+def _obj_corners(faces: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Position index, normal index (0 when absent) and corner count of every face, 1-based."""
+    sizes = np.fromiter((len(face.split()) for face in faces), dtype=np.int64, count=len(faces))
+    joined = " ".join(faces)
+    tokens = joined.split()
+    if "/" not in joined:
+        positions = np.array(tokens, dtype=np.int64)
+        return positions, np.zeros_like(positions), sizes
+    # v/t, v//n or v/t/n; an empty texture slot is filled so every corner has ``width`` fields.
+    width = len(tokens[0].split("/"))
+    fields = joined.replace("//", "/0/").replace("/", " ").split()
+    if len(fields) == width * len(tokens) and width > 1:
+        corners = np.array(fields, dtype=np.int64).reshape(-1, width)
+        normals = corners[:, 2] if width == 3 else np.zeros(len(corners), dtype=np.int64)
+        return corners[:, 0], normals, sizes
+    # Mixed corner formats: parse token by token.
+    parts = [token.split("/") for token in tokens]
+    positions = np.array([part[0] for part in parts], dtype=np.int64)
+    normals = np.array([int(part[2]) if len(part) > 2 and part[2] else 0 for part in parts], dtype=np.int64)
+    return positions, normals, sizes
+
+
+def _resolve(indices: np.ndarray, count: int) -> np.ndarray:
+    # OBJ indices are 1-based; negative ones count back from the last record.
+    return np.where(indices > 0, indices - 1, count + indices)
+
+
+def load_obj(path: Path) -> Mesh:
+    """Wavefront OBJ: ``v``/``vn``/``f`` records; polygons are fanned into triangles.
+
+    Relative (negative) indices are resolved against the whole file, which
+    matches exporters that write all vertices before the faces.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as fp:
+        lines = fp.read().splitlines()
+    positions = [line[2:] for line in lines if line.startswith("v ")]
+    normals = [line[3:] for line in lines if line.startswith("vn ")]
+    faces = [line[2:] for line in lines if line.startswith("f ")]
+    if not positions or not faces:
+        raise ValueError(f"OBJ sem vertices ou faces: {path}")
+
+    position_idx, normal_idx, sizes = _obj_corners(faces)
+    position_idx = _resolve(position_idx, len(positions))
+    # Fan each polygon: corners (0, k, k + 1) for k in 1 .. size - 2.
+    firsts = np.cumsum(sizes) - sizes
+    fans = np.maximum(sizes - 2, 0)
+    owner = np.repeat(np.arange(len(sizes)), fans)
+    step = np.arange(fans.sum()) - np.repeat(np.cumsum(fans) - fans, fans) + 1
+    corner_ids = np.stack([firsts[owner], firsts[owner] + step, firsts[owner] + step + 1], axis=1).reshape(-1)
+
+    position_arr = _obj_vectors(positions)
+    if not normals or (normal_idx == 0).any():
+        return _finish(position_arr, position_idx[corner_ids])
+
+    # One output vertex per distinct (position, normal) pair.
+    normal_idx = _resolve(normal_idx, len(normals))
+    keys = position_idx[corner_ids] * len(normals) + normal_idx[corner_ids]
+    unique, inverse = np.unique(keys, return_inverse=True)
+    vertices = position_arr[unique // len(normals)]
+    vertex_norms = _obj_vectors(normals)[unique % len(normals)]
+    return _finish(vertices, inverse.reshape(-1), vertex_norms)
+
+
+def _gltf_document(path: Path) -> Tuple[Dict, List[bytes]]:
+    data = path.read_bytes()
+    embedded: Optional[bytes] = None
+    if len(data) >= 12 and struct.unpack_from("<I", data, 0)[0] == _GLB_MAGIC:
+        offset, document = 12, None
+        while offset + 8 <= len(data):
+            length, kind = struct.unpack_from("<II", data, offset)
+            chunk = data[offset + 8 : offset + 8 + length]
+            if kind == 0x4E4F534A:
+                document = json.loads(chunk.decode("utf-8"))
+            elif kind == 0x004E4942:
+                embedded = chunk
+            offset += 8 + length
+        if document is None:
+            raise ValueError(f"GLB sem bloco JSON: {path}")
+    else:
+        document = json.loads(data.decode("utf-8"))
+
+    buffers = []
+    for buffer in document.get("buffers", []):
+        uri = buffer.get("uri")
+        if uri is None:
+            if embedded is None:
+                raise ValueError(f"glTF sem buffer binario: {path}")
+            buffers.append(embedded)
+        elif uri.startswith("data:"):
+            buffers.append(base64.b64decode(uri.split(",", 1)[1]))
+        else:
+            buffers.append((path.parent / uri).read_bytes())
+    return document, buffers
+
+
+def _gltf_accessor(document: Dict, buffers: List[bytes], index: int) -> np.ndarray:
+    accessor = document["accessors"][index]
+    dtype = np.dtype(_GLTF_COMPONENTS[accessor["componentType"]])
+    width = _GLTF_WIDTHS[accessor["type"]]
+    count = accessor["count"]
+    view = document["bufferViews"][accessor["bufferView"]]
+    data = buffers[view["buffer"]]
+    start = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+    stride = view.get("byteStride") or dtype.itemsize * width
+    rows = np.ndarray(
+        shape=(count, width),
+        dtype=dtype,
+        buffer=data,
+        offset=start,
+        strides=(stride, dtype.itemsize),
+    )
+    return np.array(rows)
+
+
+def _node_matrix(node: Dict) -> np.ndarray:
+    if "matrix" in node:
+        return np.asarray(node["matrix"], dtype=np.float64).reshape(4, 4).T
+    x, y, z, w = node.get("rotation", (0.0, 0.0, 0.0, 1.0))
+    rotation = np.array(
+        [
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]
+    )
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.asarray(node.get("scale", (1.0, 1.0, 1.0)))
+    matrix[:3, 3] = node.get("translation", (0.0, 0.0, 0.0))
+    return matrix
+
+
+def load_gltf(path: Path) -> Mesh:
+    """glTF 2.0 (``.gltf`` or ``.glb``): triangle primitives of the default scene, node transforms applied."""
+    document, buffers = _gltf_document(path)
+    nodes = document.get("nodes", [])
+    scenes = document.get("scenes", [])
+    if scenes:
+        roots = scenes[document.get("scene", 0)].get("nodes", [])
+    else:
+        roots = [{"mesh": idx} for idx in range(len(document.get("meshes", [])))]
+    stack = [(node if isinstance(node, dict) else nodes[node], np.eye(4)) for node in roots]
+
+    vertices, normals, indices = [], [], []
+    base = 0
+    while stack:
+        node, parent = stack.pop()
+        matrix = parent @ _node_matrix(node)
+        stack.extend((nodes[child], matrix) for child in node.get("children", []))
+        if "mesh" not in node:
+            continue
+        normal_matrix = np.linalg.inv(matrix[:3, :3]).T
+        for primitive in document["meshes"][node["mesh"]]["primitives"]:
+            if primitive.get("mode", 4) != 4 or "POSITION" not in primitive["attributes"]:
+                continue
+            positions = _gltf_accessor(document, buffers, primitive["attributes"]["POSITION"]).astype(np.float64)
+            if "NORMAL" in primitive["attributes"]:
+                normal = _gltf_accessor(document, buffers, primitive["attributes"]["NORMAL"]) @ normal_matrix.T
+            else:
+                normal = None
+            if "indices" in primitive:
+                faces = _gltf_accessor(document, buffers, primitive["indices"]).reshape(-1).astype(np.int64)
+            else:
+                faces = np.arange(len(positions), dtype=np.int64)
+            vertices.append(positions @ matrix[:3, :3].T + matrix[:3, 3])
+            normals.append(normal)
+            indices.append(faces + base)
+            base += len(positions)
+    if not vertices:
+        raise ValueError(f"glTF sem primitivas de triangulos: {path}")
+
+    vertex_arr = np.vstack(vertices)
+    index_arr = np.concatenate(indices)
+    if any(normal is None for normal in normals):
+        return _finish(vertex_arr, index_arr)
+    return _finish(vertex_arr, index_arr, np.vstack(normals))
+
+
+LOADERS = {".obj": load_obj, ".gltf": load_gltf, ".glb": load_gltf}
+
+
+def load_source(path: Path) -> Mesh:
+    loader = LOADERS.get(Path(path).suffix.lower())
+    if loader is None:
+        raise ValueError(f"Formato de modelo nao suportado: {path}")
+    return loader(Path(path))
+
+
+def normalize_mesh(mesh: Mesh, radius: float = MODEL_RADIUS) -> Mesh:
+    """Center the bounding box on the origin and scale to ``radius``."""
+    lo, hi = mesh.vertices.min(axis=0), mesh.vertices.max(axis=0)
+    centered = mesh.vertices - (lo + hi) / 2.0
+    extent = float(np.linalg.norm(centered, axis=1).max())
+    factor = radius / extent if extent > 1e-12 else 1.0
+    return Mesh(vertices=(centered * factor).astype(np.float32), normals=mesh.normals, indices=mesh.indices)
+
+
+def simplify_mesh(mesh: Mesh, cells: int) -> Mesh:
+    """Vertex clustering: merge vertices per grid cell and drop collapsed triangles."""
+    vertices = mesh.vertices.astype(np.float64)
+    lo = vertices.min(axis=0)
+    size = max(float((vertices.max(axis=0) - lo).max()), 1e-12) / max(1, cells)
+    grid = np.minimum(np.floor((vertices - lo) / size).astype(np.int64), cells)
+    keys = (grid[:, 0] * (cells + 1) + grid[:, 1]) * (cells + 1) + grid[:, 2]
+    _, cluster = np.unique(keys, return_inverse=True)
+    counts = np.bincount(cluster).astype(np.float64)
+    sums = np.stack([np.bincount(cluster, weights=vertices[:, axis]) for axis in range(3)], axis=1)
+    centroids = sums / counts[:, None]
+
+    triangles = cluster.reshape(-1)[mesh.indices.reshape(-1, 3)]
+    a, b, c = triangles.T
+    triangles = triangles[(a != b) & (b != c) & (a != c)]
+    # Keep one of each merged triangle, with its original winding.
+    ordered = np.sort(triangles, axis=1)
+    count = int(cluster.max()) + 1
+    _, first = np.unique((ordered[:, 0] * count + ordered[:, 1]) * count + ordered[:, 2], return_index=True)
+    triangles = triangles[np.sort(first)]
+    if not len(triangles):
+        return mesh
+    used, remapped = np.unique(triangles, return_inverse=True)
+    return _finish(centroids[used], remapped.reshape(-1))
+
+
+def build_lods(mesh: Mesh, cells: Sequence[int] = MODEL_LOD_CELLS) -> Tuple[Mesh, ...]:
+    lods = [mesh]
+    for count in cells:
+        simplified = simplify_mesh(lods[-1], count)
+        lods.append(simplified if simplified.triangle_count < lods[-1].triangle_count else lods[-1])
+    return tuple(lods)
+
+
+def source_hash(path: Path) -> str:
+    """Hash of the model file plus external glTF buffers and the loader version."""
+    path = Path(path)
+    digest = hashlib.sha1(f"v{MODEL_LOADER_VERSION}".encode())
+    digest.update(path.read_bytes())
+    if path.suffix.lower() == ".gltf":
+        document = json.loads(path.read_text(encoding="utf-8"))
+        for buffer in document.get("buffers", []):
+            uri = buffer.get("uri", "")
+            if uri and not uri.startswith("data:"):
+                digest.update((path.parent / uri).read_bytes())
+    return digest.hexdigest()
+
+
+class MeshStore:
+    """Imported models converted once into per-LOD ``.npy`` arrays.
+
+    Entries are keyed by ``source_hash``, so an edited file gets a new entry
+    and later loads memory-map the arrays without parsing anything.
+    """
+
+    ARRAYS = ("vertices", "normals", "indices")
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def directory(self, path: Path) -> Path:
+        return self.root / f"{Path(path).stem}_{source_hash(path)[:16]}"
+
+    def load(self, path: Path) -> Tuple[Mesh, ...]:
+        folder = self.directory(path)
+        manifest = folder / "lods.json"
+        if manifest.exists():
+            lod_count = int(json.loads(manifest.read_text(encoding="utf-8"))["lods"])
+            return tuple(
+                Mesh(**{name: load_npy(folder / f"lod{lod}.{name}.npy") for name in self.ARRAYS})
+                for lod in range(lod_count)
+            )
+
+        lods = build_lods(normalize_mesh(load_source(path)))
+        folder.mkdir(parents=True, exist_ok=True)
+        for lod, mesh in enumerate(lods):
+            for name in self.ARRAYS:
+                save_npy_atomic(folder / f"lod{lod}.{name}.npy", getattr(mesh, name))
+        # Written last: its presence marks a complete entry.
+        tmp_path = manifest.with_name(f"{manifest.name}.tmp{os.getpid()}")
+        tmp_path.write_text(json.dumps({"lods": len(lods), "source": Path(path).name}), encoding="utf-8")
+        os.replace(tmp_path, manifest)
+        return lods
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import ctypes
+import os
+
+import numpy as np
+
+# PyOpenGL binds its platform on first import, so this must run before any
+# ``OpenGL`` module is loaded; set PYOPENGL_PLATFORM=egl (or osmesa) yourself
+# if OpenGL may already be imported.
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+
+from OpenGL import EGL  # noqa: E402
+from OpenGL.GL import (  # noqa: E402
+    GL_COLOR_ATTACHMENT0,
+    GL_DEPTH24_STENCIL8,
+    GL_DEPTH_STENCIL_ATTACHMENT,
+    GL_FRAMEBUFFER,
+    GL_FRAMEBUFFER_COMPLETE,
+    GL_PACK_ALIGNMENT,
+    GL_RENDERBUFFER,
+    GL_RGB,
+    GL_RGBA8,
+    GL_UNSIGNED_BYTE,
+    glBindFramebuffer,
+    glBindRenderbuffer,
+    glCheckFramebufferStatus,
+    glDeleteFramebuffers,
+    glDeleteRenderbuffers,
+    glFinish,
+    glFramebufferRenderbuffer,
+    glGenFramebuffers,
+    glGenRenderbuffers,
+    glPixelStorei,
+    glReadPixels,
+    glRenderbufferStorage,
+    glViewport,
+)
+
+
+EGL_PLATFORM_SURFACELESS_MESA = 0x31DD
+
+
+class OffscreenContext:
+    """Headless OpenGL context rendering into a framebuffer object.
+
+    Uses Mesa's surfaceless EGL platform, so it works on GPU-less Linux boxes
+    with llvmpipe. The context is current on the creating thread only.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        if os.environ.get("PYOPENGL_PLATFORM") != "egl":
+            raise RuntimeError("Contexto offscreen requer PYOPENGL_PLATFORM=egl antes de importar OpenGL.")
+        self.width, self.height = int(width), int(height)
+        self._display = self._open_display()
+        if not EGL.eglBindAPI(EGL.EGL_OPENGL_API):
+            raise RuntimeError("EGL sem suporte a OpenGL desktop.")
+        self._context = EGL.eglCreateContext(self._display, EGL.EGLConfig(), EGL.EGL_NO_CONTEXT, None)
+        if not self._context or not EGL.eglMakeCurrent(
+            self._display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, self._context
+        ):
+            raise RuntimeError("Falha ao criar contexto EGL sem superficie.")
+
+        self._fbo = int(glGenFramebuffers(1))
+        self._renderbuffers = [int(rb) for rb in glGenRenderbuffers(2)]
+        glBindFramebuffer(GL_FRAMEBUFFER, self._fbo)
+        for renderbuffer, storage, attachment in zip(
+            self._renderbuffers,
+            (GL_RGBA8, GL_DEPTH24_STENCIL8),
+            (GL_COLOR_ATTACHMENT0, GL_DEPTH_STENCIL_ATTACHMENT),
+        ):
+            glBindRenderbuffer(GL_RENDERBUFFER, renderbuffer)
+            glRenderbufferStorage(GL_RENDERBUFFER, storage, self.width, self.height)
+            glFramebufferRenderbuffer(GL_FRAMEBUFFER, attachment, GL_RENDERBUFFER, renderbuffer)
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            self.release()
+            raise RuntimeError("Framebuffer offscreen incompleto.")
+        glViewport(0, 0, self.width, self.height)
+
+    @staticmethod
+    def _open_display():
+        try:
+            from OpenGL.EGL.EXT.platform_base import eglGetPlatformDisplayEXT
+
+            display = eglGetPlatformDisplayEXT(EGL_PLATFORM_SURFACELESS_MESA, None, None)
+        except Exception:
+            display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        major, minor = EGL.EGLint(), EGL.EGLint()
+        if not display or not EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor)):
+            raise RuntimeError("EGL indisponivel.")
+        return display
+
+    def read_pixels(self) -> np.ndarray:
+        """Framebuffer contents as an ``(h, w, 3)`` BGR array, top row first."""
+        glFinish()
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        data = glReadPixels(0, 0, self.width, self.height, GL_RGB, GL_UNSIGNED_BYTE)
+        rgb = np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 3)
+        return np.ascontiguousarray(rgb[::-1, :, ::-1])
+
+    def release(self) -> None:
+        if self._context is None:
+            return
+        glDeleteFramebuffers(1, [self._fbo])
+        glDeleteRenderbuffers(2, self._renderbuffers)
+        EGL.eglMakeCurrent(self._display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+        EGL.eglDestroyContext(self._display, self._context)
+        self._context = None
@@ -1,8 +1,42 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import cv2
+import numpy as np
+
+from ui.text_sprites import draw_text
+
+DIM_FACTOR = 0.55
+
+
+def dim_frame(frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """``frame * DIM_FACTOR`` as uint8, written into ``out`` when its shape matches (else a new buffer)."""
+    if out is None or out.shape != frame.shape:
+        out = np.empty(frame.shape, dtype=np.uint8)
+    cv2.convertScaleAbs(frame, dst=out, alpha=DIM_FACTOR)
+    return out
+
+
+@lru_cache(maxsize=64)
+def _fill_tile(height: int, width: int, color: Tuple[int, int, int]) -> np.ndarray:
+    tile = np.empty((height, width, 3), dtype=np.uint8)
+    tile[:] = color
+    tile.setflags(write=False)
+    return tile
+
+
+def blend_rect(frame, rect: Tuple[int, int, int, int], color: Tuple[int, int, int], alpha: float) -> None:
+    """Blend ``color`` over the inclusive ``rect`` in place, touching only that slice of ``frame``."""
+    h, w = frame.shape[:2]
+    x1, y1, x2, y2 = rect
+    x1, y1 = max(0, x1), max(0, y1)
+    x2, y2 = min(w - 1, x2), min(h - 1, y2)
+    if x2 < x1 or y2 < y1:
+        return
+    roi = frame[y1 : y2 + 1, x1 : x2 + 1]
+    cv2.addWeighted(_fill_tile(roi.shape[0], roi.shape[1], tuple(color)), alpha, roi, 1.0 - alpha, 0, roi)
 
 
 def draw_panel(
@@ -14,9 +48,7 @@ def draw_panel(
 ) -> None:
     x, y = top_left
     w, h = size
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (x, y), (x + w, y + h), color, -1, cv2.LINE_AA)
-    cv2.addWeighted(overlay, alpha, frame, 1.0 - alpha, 0, frame)
+    blend_rect(frame, (x, y, x + w, y + h), color, alpha)
     cv2.rectangle(frame, (x, y), (x + w, y + h), (80, 80, 90), 1, cv2.LINE_AA)
 
 
@@ -29,37 +61,47 @@ def draw_status_block(
     status: str,
 ) -> None:
     draw_panel(frame, (18, 18), (370, 148))
+    # (text, cached): the confidence changes every frame, so it skips the sprite cache.
     lines = [
-        f"FPS: {fps:5.1f}",
-        f"Gesto: {gesture_label}",
-        f"Confianca: {confidence * 100:5.1f}%",
-        f"Estado: {state}",
-        f"Status: {status}",
+        (f"FPS: {fps:5.1f}", True),
+        (f"Gesto: {gesture_label}", True),
+        (f"Confianca: {confidence * 100:5.1f}%", False),
+        (f"Estado: {state}", True),
+        (f"Status: {status}", True),
     ]
     y = 45
-    for line in lines:
-        cv2.putText(frame, line, (34, y), cv2.FONT_HERSHEY_SIMPLEX, 0.58, (225, 230, 240), 1, cv2.LINE_AA)
+    for line, cached in lines:
+        draw_text(frame, line, (34, y), 0.58, (225, 230, 240), cached=cached)
         y += 25
 
 
 def draw_training_badge(frame, label: str, count: int, target: int) -> None:
     draw_panel(frame, (18, 178), (370, 72), color=(35, 35, 22), alpha=0.78)
     progress = min(1.0, count / max(1, target))
-    cv2.putText(
-        frame,
-        f"TREINO: {label} [{count}/{target}]",
-        (34, 206),
-        cv2.FONT_HERSHEY_SIMPLEX,
-        0.55,
-        (255, 235, 120),
-        1,
-        cv2.LINE_AA,
-    )
+    draw_text(frame, f"TREINO: {label} [{count}/{target}]", (34, 206), 0.55, (255, 235, 120))
     x, y, w, h = 34, 218, 320, 12
     cv2.rectangle(frame, (x, y), (x + w, y + h), (70, 70, 70), 1, cv2.LINE_AA)
     cv2.rectangle(frame, (x + 1, y + 1), (x + int((w - 2) * progress), y + h - 1), (70, 200, 255), -1, cv2.LINE_AA)
 
 
+def draw_training_job(
+    frame,
+    stage: str,
+    progress: float,
+    message: str = "",
+    top_left: Tuple[int, int] = (18, 178),
+) -> None:
+    x0, y0 = top_left
+    draw_panel(frame, (x0, y0), (370, 72), color=(22, 30, 35), alpha=0.78)
+    text = f"MODELO: {stage} {progress * 100:3.0f}%"
+    if message:
+        text = f"{text} | {message}"
+    draw_text(frame, text, (x0 + 16, y0 + 28), 0.55, (160, 235, 255))
+    x, y, w, h = x0 + 16, y0 + 40, 320, 12
+    cv2.rectangle(frame, (x, y), (x + w, y + h), (70, 70, 70), 1, cv2.LINE_AA)
+    cv2.rectangle(frame, (x + 1, y + 1), (x + int((w - 2) * progress), y + h - 1), (120, 230, 140), -1, cv2.LINE_AA)
+
+
 def draw_hand_bbox(frame, bbox: Optional[Tuple[int, int, int, int]]) -> None:
     if not bbox:
         return
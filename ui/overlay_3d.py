@@ -5,6 +5,7 @@ from typing import Optional, Tuple
 import cv2
 
 from ui.overlay import draw_panel
+from ui.text_sprites import draw_text
 
 
 def draw_3d_status(
@@ -18,26 +19,27 @@ def draw_3d_status(
     status: str,
 ) -> None:
     draw_panel(frame, (18, 18), (420, 176))
+    # (text, cached): scale and rotation change every frame, so they skip the sprite cache.
     lines = [
-        f"FPS: {fps:5.1f}",
-        f"Gesto: {gesture_label}",
-        f"Escala: {scale:4.2f}",
-        f"Rot: X={rotation[0]:5.1f} Y={rotation[1]:5.1f} Z={rotation[2]:5.1f}",
-        f"Status: {status}",
-        f"Pausa: {'ON' if paused else 'OFF'}",
+        (f"FPS: {fps:5.1f}", True),
+        (f"Gesto: {gesture_label}", True),
+        (f"Escala: {scale:4.2f}", False),
+        (f"Rot: X={rotation[0]:5.1f} Y={rotation[1]:5.1f} Z={rotation[2]:5.1f}", False),
+        (f"Status: {status}", True),
+        (f"Pausa: {'ON' if paused else 'OFF'}", True),
     ]
     if calibration_active:
-        lines.append("Calibrando profundidade...")
+        lines.append(("Calibrando profundidade...", True))
 
     y = 45
-    for line in lines:
-        cv2.putText(frame, line, (34, y), cv2.FONT_HERSHEY_SIMPLEX, 0.56, (225, 230, 240), 1, cv2.LINE_AA)
+    for line, cached in lines:
+        draw_text(frame, line, (34, y), 0.56, (225, 230, 240), cached=cached)
         y += 24
 
 
 def draw_gesture_badge(frame, label: str, position: Tuple[int, int] = (18, 205)) -> None:
     draw_panel(frame, position, (260, 50), color=(30, 30, 18), alpha=0.78)
-    cv2.putText(frame, f"ATIVO: {label}", (position[0] + 16, position[1] + 32), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 220, 120), 1, cv2.LINE_AA)
+    draw_text(frame, f"ATIVO: {label}", (position[0] + 16, position[1] + 32), 0.6, (255, 220, 120))
 
 
 def draw_hand_bbox(frame, bbox: Optional[Tuple[int, int, int, int]]) -> None:
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+FrameSink = Callable[[np.ndarray], object]
+
+RECORD_SOURCES = ("debug", "3d")
+# Longest gap (e.g. a stall) filled with repeats of the previous frame.
+MAX_GAP_SEC = 2.0
+
+
+@dataclass(frozen=True)
+class RecordingStats:
+    path: Path
+    frames_offered: int
+    frames_dropped: int
+    frames_encoded: int
+    encode_seconds: float
+    error: Optional[str] = None
+
+    @property
+    def encode_fps(self) -> float:
+        return self.frames_encoded / self.encode_seconds if self.encode_seconds > 0 else 0.0
+
+
+def deliver_frame(sink: FrameSink, frame: np.ndarray, logger: logging.Logger) -> bool:
+    """Call ``sink(frame)``; a failing sink is logged and reported as ``False`` instead of raising."""
+    try:
+        sink(frame)
+    except Exception:
+        logger.exception("Falha ao entregar o quadro a gravacao; saida desconectada.")
+        return False
+    return True
+
+
+def _open_video_writer(path: Path, fps: float, size: Tuple[int, int], fourcc: str = "mp4v"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*fourcc), fps, size)
+
+
+class FrameRecorder:
+    """Encodes BGR frames to one video file on a writer thread.
+
+    ``offer`` copies the frame into a free slot of a preallocated ring and
+    returns at once. When every slot is still waiting for the encoder, the
+    frame is dropped instead of blocking the caller. The writer paces the
+    output to ``fps`` from the offer timestamps. It repeats the previous
+    frame across gaps (such as skipped idle redraws) and skips surplus
+    frames, so the video plays in real time. The ring and the thread start with the first
+    frame, whose size fixes the video size.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fps: float = 30.0,
+        ring_size: int = 16,
+        writer_factory: Callable[[Path, float, Tuple[int, int]], object] = _open_video_writer,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError("fps da gravacao deve ser positivo.")
+        if ring_size < 2:
+            raise ValueError("A fila de gravacao precisa de pelo menos 2 quadros.")
+        self.path = Path(path)
+        self.fps = float(fps)
+        self.ring_size = int(ring_size)
+        self._writer_factory = writer_factory
+
+        self.frames_offered = 0
+        self.frames_dropped = 0
+        self.frames_encoded = 0
+        self.encode_seconds = 0.0
+        self.error: Optional[str] = None
+
+        self._ring: Optional[np.ndarray] = None
+        self._stamps = np.zeros(self.ring_size, dtype=np.float64)
+        self._free: "queue.Queue[int]" = queue.Queue()
+        self._filled: "queue.Queue[Optional[int]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def offer(self, frame: np.ndarray, timestamp: Optional[float] = None) -> bool:
+        """Queue a copy of ``frame``; ``False`` if it was dropped (or the recorder is stopped)."""
+        if self._closed:
+            return False
+        if self._ring is None:
+            self._start(frame.shape[:2])
+        self.frames_offered += 1
+        try:
+            slot = self._free.get_nowait()
+        except queue.Empty:
+            self.frames_dropped += 1
+            return False
+        target = self._ring[slot]
+        if frame.shape == target.shape:
+            np.copyto(target, frame)
+        else:
+            cv2.resize(frame, (target.shape[1], target.shape[0]), dst=target)
+        self._stamps[slot] = time.perf_counter() if timestamp is None else timestamp
+        self._filled.put(slot)
+        return True
+
+    def _start(self, size: Sequence[int]) -> None:
+        height, width = int(size[0]), int(size[1])
+        self._ring = np.zeros((self.ring_size, height, width, 3), dtype=np.uint8)
+        for slot in range(self.ring_size):
+            self._free.put(slot)
+        self._thread = threading.Thread(target=self._write_loop, name="recorder", daemon=True)
+        self._thread.start()
+
+    def _write_loop(self) -> None:
+        height, width = self._ring.shape[1:3]
+        writer = self._writer_factory(self.path, self.fps, (width, height))
+        if not writer.isOpened():
+            self.error = f"Falha ao abrir o video: {self.path}"
+        start = 0.0
+        # The last encoded frame keeps its slot: it is repeated until the next one is due.
+        held: Optional[int] = None
+        max_repeats = max(1, int(MAX_GAP_SEC * self.fps))
+        while True:
+            slot = self._filled.get()
+            if slot is None:
+                break
+            if self.error is not None:
+                self._free.put(slot)
+                continue
+            stamp = float(self._stamps[slot])
+            if held is None:
+                start = stamp
+            due = int(round((stamp - start) * self.fps))
+            if held is not None and due < self.frames_encoded:
+                self._free.put(slot)
+                continue
+            repeats = due - self.frames_encoded
+            if repeats > max_repeats:
+                start += (repeats - max_repeats) / self.fps
+                repeats = max_repeats
+            began = time.perf_counter()
+            for _ in range(repeats):
+                writer.write(self._ring[held])
+            writer.write(self._ring[slot])
+            self.encode_seconds += time.perf_counter() - began
+            self.frames_encoded += repeats + 1
+            if held is not None:
+                self._free.put(held)
+            held = slot
+        writer.release()
+
+    def stop(self) -> RecordingStats:
+        """Finish encoding the queued frames, close the file and report."""
+        self._closed = True
+        if self._thread is not None:
+            self._filled.put(None)
+            self._thread.join()
+            self._thread = None
+        return self.stats()
+
+    def stats(self) -> RecordingStats:
+        return RecordingStats(
+            path=self.path,
+            frames_offered=self.frames_offered,
+            frames_dropped=self.frames_dropped,
+            frames_encoded=self.frames_encoded,
+            encode_seconds=self.encode_seconds,
+            error=self.error,
+        )
+
+
+class RecordingSession:
+    """One ``FrameRecorder`` per output (``debug``, ``3d``), named ``<timestamp>_<source>.mp4``."""
+
+    def __init__(self, directory: Path, fps: float = 30.0, ring_size: int = 16) -> None:
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        self.directory = Path(directory)
+        self.recorders: Dict[str, FrameRecorder] = {
+            source: FrameRecorder(self.directory / f"{stamp}_{source}.mp4", fps=fps, ring_size=ring_size)
+            for source in RECORD_SOURCES
+        }
+
+    def sink(self, source: str) -> Callable[[np.ndarray], bool]:
+        if source not in self.recorders:
+            raise ValueError(f"Fonte de gravacao invalida: {source} (use {', '.join(RECORD_SOURCES)})")
+        return self.recorders[source].offer
+
+    def stop(self) -> Dict[str, RecordingStats]:
+        """Stats of every source that received frames."""
+        return {
+            source: recorder.stop() for source, recorder in self.recorders.items() if recorder.frames_offered
+        }
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 
-from interaction.object_manager import SceneObject
-from ui.overlay import draw_hand_bbox, draw_status_block, draw_training_badge
+from interaction.object_manager import ObjectArrays, SceneObject
+from ui.display import create_display
+from ui.overlay import (
+    blend_rect,
+    dim_frame,
+    draw_hand_bbox,
+    draw_status_block,
+    draw_training_badge,
+    draw_training_job,
+)
 
 
 HAND_CONNECTIONS = [
@@ -35,14 +43,15 @@ HAND_CONNECTIONS = [
 
 
 class Renderer:
-    def __init__(self, window_name: str) -> None:
+    def __init__(self, window_name: str, backend: str = "window") -> None:
         self.window_name = window_name
-        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        self.display = create_display(backend, window_name)
+        self._canvas: Optional[np.ndarray] = None
 
     def render(
         self,
         frame,
-        objects: Iterable[SceneObject],
+        objects: Union[ObjectArrays, Iterable[SceneObject]],
         fps: float,
         gesture_label: str,
         confidence: float,
@@ -54,8 +63,11 @@ class Renderer:
         training_target: int,
         hand_bbox: Optional[Tuple[int, int, int, int]] = None,
         hand_points: Optional[np.ndarray] = None,
+        job_stage: Optional[str] = None,
+        job_progress: float = 0.0,
+        job_message: str = "",
     ) -> None:
-        canvas = (frame * 0.55).astype(np.uint8)
+        canvas = self._canvas = dim_frame(frame, self._canvas)
 
         self._draw_objects(canvas, objects)
         self._draw_hand(canvas, hand_points)
@@ -75,24 +87,45 @@ class Renderer:
                 count=training_count,
                 target=training_target,
             )
+        if job_stage:
+            draw_training_job(
+                canvas,
+                stage=job_stage,
+                progress=job_progress,
+                message=job_message,
+                top_left=(18, 260) if training_mode else (18, 178),
+            )
 
-        cv2.imshow(self.window_name, canvas)
+        self.display.show(canvas)
 
     @staticmethod
-    def _draw_objects(frame, objects: Iterable[SceneObject]) -> None:
-        for obj in objects:
-            x1 = int(obj.x - obj.width / 2)
-            y1 = int(obj.y - obj.height / 2)
-            x2 = int(obj.x + obj.width / 2)
-            y2 = int(obj.y + obj.height / 2)
-
-            color = (0, 230, 255) if obj.is_selected else (120, 160, 210)
-            thickness = 3 if obj.is_selected else 2
-            cv2.rectangle(frame, (x1, y1), (x2, y2), color, thickness, cv2.LINE_AA)
-            if obj.is_selected:
-                overlay = frame.copy()
-                cv2.rectangle(overlay, (x1, y1), (x2, y2), (0, 180, 255), -1, cv2.LINE_AA)
-                cv2.addWeighted(overlay, 0.08, frame, 0.92, 0, frame)
+    def _draw_objects(frame, objects: Union[ObjectArrays, Iterable[SceneObject]]) -> None:
+        if not isinstance(objects, ObjectArrays):
+            objects = ObjectArrays.from_objects(objects)
+        if len(objects) == 0:
+            return
+
+        top_left, bottom_right = objects.corners()
+        x1, y1 = top_left[:, 0], top_left[:, 1]
+        x2, y2 = bottom_right[:, 0], bottom_right[:, 1]
+        outlines = np.stack(
+            [np.stack(corner, axis=1) for corner in ((x1, y1), (x2, y1), (x2, y2), (x1, y2))],
+            axis=1,
+        )
+
+        selected = objects.selected
+        if selected < 0:
+            cv2.polylines(frame, list(outlines), True, (120, 160, 210), 2, cv2.LINE_AA)
+            return
+
+        # Objects after the selected one are drawn over its highlight, as before.
+        if selected > 0:
+            cv2.polylines(frame, list(outlines[:selected]), True, (120, 160, 210), 2, cv2.LINE_AA)
+        sx1, sy1, sx2, sy2 = (int(v) for v in (x1[selected], y1[selected], x2[selected], y2[selected]))
+        cv2.rectangle(frame, (sx1, sy1), (sx2, sy2), (0, 230, 255), 3, cv2.LINE_AA)
+        blend_rect(frame, (sx1, sy1, sx2, sy2), (0, 180, 255), 0.08)
+        if selected + 1 < len(objects):
+            cv2.polylines(frame, list(outlines[selected + 1 :]), True, (120, 160, 210), 2, cv2.LINE_AA)
 
     @staticmethod
     def _draw_hand(frame, hand_points: Optional[np.ndarray]) -> None:
@@ -109,5 +142,8 @@ class Renderer:
             color = (0, 220, 255) if idx in (4, 8, 12, 16, 20) else (200, 220, 255)
             cv2.circle(frame, (int(point[0]), int(point[1])), 3, color, -1, cv2.LINE_AA)
 
+    def poll_key(self) -> int:
+        return self.display.poll_key()
+
     def close(self) -> None:
-        cv2.destroyAllWindows()
+        self.display.close()
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from typing import Tuple
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
 
+import numpy as np
 import pygame
 from OpenGL.GL import (
     GL_AMBIENT,
+    GL_BGR,
     GL_COLOR_BUFFER_BIT,
     GL_COLOR_MATERIAL,
     GL_DEPTH_BUFFER_BIT,
@@ -13,164 +19,304 @@ from OpenGL.GL import (
     GL_FRONT_AND_BACK,
     GL_LIGHT0,
     GL_LIGHTING,
+    GL_MODELVIEW,
+    GL_NORMALIZE,
+    GL_PACK_ALIGNMENT,
     GL_POSITION,
-    GL_QUADS,
-    GL_TRIANGLES,
-    glBegin,
+    GL_PROJECTION,
+    GL_UNSIGNED_BYTE,
     glClear,
     glClearColor,
     glColor3f,
     glEnable,
-    glEnd,
     glLightfv,
     glLoadIdentity,
+    glLoadMatrixf,
     glMaterialfv,
-    glNormal3f,
-    glRotatef,
-    glScalef,
-    glTranslatef,
-    glVertex3f,
+    glMatrixMode,
+    glPixelStorei,
+    glReadPixels,
 )
-from OpenGL.GLU import gluNewQuadric, gluPerspective, gluSphere
+from OpenGL.GLU import gluPerspective
 
 from core.config import AppConfig
-from interaction.floating_object import FloatingObject
+from core.constants import CAMERA_FAR, CAMERA_FOV_DEG, CAMERA_NEAR
+from interaction.floating_object import FloatingObject, ObjectPose
+from interaction.object_simulation import PoseSnapshot
+from interaction.scene_3d import SceneSnapshot
+from ui.display import DISPLAY_BACKENDS
+from ui.instanced_draw import InstancedSceneDrawer
+from ui.mesh_cache import MeshCache
+from ui.meshes import MESH_BUILDERS, register_mesh, select_lod
+from ui.model_loader import MeshStore
+from ui.recorder import FrameSink, deliver_frame
+
+
+IDLE_POLL_SEC = 1.0 / 60.0
+REDRAW_EVENTS = frozenset(
+    getattr(pygame, name)
+    for name in ("VIDEOEXPOSE", "VIDEORESIZE", "WINDOWEXPOSED", "WINDOWRESIZED")
+    if hasattr(pygame, name)
+)
 
 
 class Renderer3D:
     def __init__(self, config: AppConfig, window_title: str) -> None:
         self.config = config
         self.window_title = window_title
-        self._quadric = None
+        self._meshes = MeshCache()
+        self._instances = InstancedSceneDrawer(self._meshes)
+        self._store = MeshStore(config.mesh_cache_dir)
+        self.backend = config.display_backend
+        if self.backend not in DISPLAY_BACKENDS:
+            raise ValueError(f"Backend de exibicao invalido: {self.backend}")
+        self._offscreen = None
+        self.last_frame: Optional[np.ndarray] = None
         self._initialized = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._ready_event = threading.Event()
+        self._quit_requested = False
+        self._start_error: Optional[BaseException] = None
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        # Called with each presented frame (BGR), e.g. a recorder's ``offer``. Other threads may
+        # swap it at any time, so it is read once per frame; a sink that raises is detached.
+        self.frame_sink: Optional[FrameSink] = None
+        self.logger = logging.getLogger(__name__)
+        self._last_key: Optional[tuple] = None
+        self._last_draw_at = float("-inf")
 
-    def start(self) -> None:
+    def start(self, vsync: bool = False) -> None:
         if self._initialized:
             return
 
+        if self.backend == "null":
+            self._initialized = True
+            return
+        if self.backend == "offscreen":
+            # Needs PYOPENGL_PLATFORM=egl before OpenGL was first imported.
+            from ui.offscreen_gl import OffscreenContext
+
+            self._offscreen = OffscreenContext(self.config.render_width, self.config.render_height)
+            self._setup_gl()
+            self._initialized = True
+            return
+
         pygame.init()
         pygame.display.set_caption(self.window_title)
-        pygame.display.set_mode(
-            (self.config.render_width, self.config.render_height),
-            pygame.DOUBLEBUF | pygame.OPENGL,
-        )
-        gluPerspective(45, self.config.render_width / self.config.render_height, 0.1, 100.0)
+        size = (self.config.render_width, self.config.render_height)
+        flags = pygame.DOUBLEBUF | pygame.OPENGL
+        try:
+            pygame.display.set_mode(size, flags, vsync=1 if vsync else 0)
+        except pygame.error:
+            pygame.display.set_mode(size, flags)
+        self._setup_gl()
+        self._initialized = True
+
+    def load_model(self, path: Path) -> str:
+        """Import an OBJ/glTF model (cached with its LODs) and return its object type.
+
+        Only touches CPU memory, so it may run before the render thread starts;
+        buffers are uploaded on first draw.
+        """
+        path = Path(path)
+        object_type = path.stem if path.stem not in MESH_BUILDERS else f"{path.stem}_model"
+        register_mesh(object_type, self._store.load(path))
+        return object_type
+
+    def _setup_gl(self) -> None:
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        aspect = self.config.render_width / self.config.render_height
+        gluPerspective(CAMERA_FOV_DEG, aspect, CAMERA_NEAR, CAMERA_FAR)
+        glMatrixMode(GL_MODELVIEW)
+        # The light position is stored in eye space, so place it under an identity view.
+        glLoadIdentity()
         glClearColor(0.05, 0.05, 0.07, 1.0)
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_LIGHTING)
         glEnable(GL_LIGHT0)
         glEnable(GL_COLOR_MATERIAL)
+        glEnable(GL_NORMALIZE)
         glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, (0.2, 0.2, 0.2, 1.0))
         glLightfv(GL_LIGHT0, GL_POSITION, (4.0, 4.0, 6.0, 1.0))
         glLightfv(GL_LIGHT0, GL_DIFFUSE, (1.0, 1.0, 1.0, 1.0))
-        self._quadric = gluNewQuadric()
-        self._initialized = True
 
-    def render(self, floating_object: FloatingObject) -> None:
+    def start_thread(self, source: Callable[[], Optional[PoseSnapshot]], timeout: float = 5.0) -> None:
+        """Own the GL context on a background loop that redraws at display rate.
+
+        ``source`` returns the latest published snapshot; it is read without
+        locking, so it must return an immutable object.
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._ready_event.clear()
+        self._thread = threading.Thread(target=self._render_loop, args=(source,), name="renderer-3d", daemon=True)
+        self._thread.start()
+        self._ready_event.wait(timeout)
+        if self._start_error is not None:
+            self._thread = None
+            raise RuntimeError("Falha ao iniciar a janela 3D.") from self._start_error
+
+    @property
+    def threaded(self) -> bool:
+        return self._thread is not None
+
+    def render(
+        self,
+        floating_object: FloatingObject,
+        pose: Optional[ObjectPose] = None,
+        scene: Optional[SceneSnapshot] = None,
+    ) -> None:
         if not self._initialized:
             self.start()
 
+        self._draw(
+            pose or floating_object.pose(),
+            floating_object.object_type,
+            floating_object.color,
+            scene,
+            version=floating_object.version,
+        )
+
+    def _render_loop(self, source: Callable[[], Optional[PoseSnapshot]]) -> None:
+        try:
+            self.start(vsync=True)
+        except BaseException as exc:
+            self._start_error = exc
+            self._ready_event.set()
+            return
+        self._ready_event.set()
+
+        frame_clock = pygame.time.Clock()
+        while not self._stop_event.is_set():
+            if self.backend == "window" and self._pump_events():
+                self._quit_requested = True
+            snapshot = source()
+            drawn = False
+            if snapshot is not None:
+                pose = snapshot.pose_at(time.perf_counter(), self.config.render_extrapolation_sec)
+                drawn = self._draw(
+                    pose, snapshot.object_type, snapshot.color, snapshot.scene, version=snapshot.object_version
+                )
+            if self.config.render_fps > 0:
+                frame_clock.tick(self.config.render_fps)
+            elif not drawn:
+                # Without a frame cap only vsync paces the loop, and skipped frames do not wait for it.
+                self._stop_event.wait(IDLE_POLL_SEC)
+        self._shutdown_gl()
+
+    def _draw(
+        self,
+        pose: ObjectPose,
+        object_type: str,
+        color: Tuple[float, float, float],
+        scene: Optional[SceneSnapshot] = None,
+        version: int = 0,
+    ) -> bool:
+        """Draw and present one frame; returns ``False`` when it was skipped as unchanged.
+
+        ``version`` (the object's change counter) covers type and color; the pose
+        is compared as well because interpolation keeps moving for a step after
+        the object stops. A frame is redrawn anyway every ``render_keepalive_sec``.
+        """
+        now = time.perf_counter()
+        key = (
+            version,
+            pose.position.tobytes(),
+            pose.orientation.tobytes(),
+            float(pose.scale),
+            scene.version if scene is not None else None,
+        )
+        keepalive = self.config.render_keepalive_sec
+        if key == self._last_key and 0.0 < keepalive and now - self._last_draw_at < keepalive:
+            self.frames_skipped += 1
+            return False
+        self._last_key, self._last_draw_at = key, now
+
+        if self.backend != "null":
+            self._draw_scene(pose, object_type, color, scene)
+            sink = self.frame_sink
+            if self._offscreen is not None:
+                self.last_frame = self._offscreen.read_pixels()
+                if sink is not None:
+                    self._feed_sink(sink, self.last_frame)
+            else:
+                if sink is not None:
+                    self._feed_sink(sink, self._read_back_buffer())
+                pygame.display.flip()
+        self.frames_drawn += 1
+        return True
+
+    def _feed_sink(self, sink: FrameSink, frame: np.ndarray) -> None:
+        if not deliver_frame(sink, frame, self.logger) and self.frame_sink is sink:
+            self.frame_sink = None
+
+    def _read_back_buffer(self) -> np.ndarray:
+        """The frame about to be flipped, as BGR rows top first (a flipped view)."""
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        width, height = self.config.render_width, self.config.render_height
+        data = glReadPixels(0, 0, width, height, GL_BGR, GL_UNSIGNED_BYTE)
+        return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)[::-1]
+
+    def _draw_scene(
+        self,
+        pose: ObjectPose,
+        object_type: str,
+        color: Tuple[float, float, float],
+        scene: Optional[SceneSnapshot] = None,
+    ) -> None:
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
+        if scene is not None:
+            self._instances.draw(scene)
 
-        glTranslatef(floating_object.position[0], floating_object.position[1], floating_object.position[2])
-        glRotatef(floating_object.rotation_deg[0], 1.0, 0.0, 0.0)
-        glRotatef(floating_object.rotation_deg[1], 0.0, 1.0, 0.0)
-        glRotatef(floating_object.rotation_deg[2], 0.0, 0.0, 1.0)
-        glScalef(floating_object.scale, floating_object.scale, floating_object.scale)
-        glColor3f(*floating_object.color)
+        glLoadMatrixf(pose.model_matrix.T)
+        glColor3f(*color)
 
-        if floating_object.object_type == "pyramid":
-            self._draw_pyramid()
-        elif floating_object.object_type == "sphere":
-            self._draw_sphere()
-        else:
-            self._draw_cube()
+        if object_type not in MESH_BUILDERS:
+            object_type = "cube"
+        self._meshes.get(object_type, select_lod(pose.position, pose.scale)).draw()
 
-        pygame.display.flip()
+    def _release_gl(self) -> None:
+        self._instances.release()
+        self._meshes.release()
+
+    def _shutdown_gl(self) -> None:
+        if self._initialized and self.backend != "null":
+            self._release_gl()
+        if self._offscreen is not None:
+            self._offscreen.release()
+            self._offscreen = None
+        elif self.backend == "window":
+            pygame.quit()
+        self._initialized = False
+
+    def read_frame(self) -> Optional[np.ndarray]:
+        """Last frame drawn by the offscreen backend, as BGR pixels (``None`` otherwise)."""
+        return self.last_frame
 
     def poll_quit(self) -> bool:
+        if self._thread is not None:
+            return self._quit_requested or not self._thread.is_alive()
+        return self.backend == "window" and self._pump_events()
+
+    def _pump_events(self) -> bool:
+        """Handle window events; returns ``True`` on quit. Exposed or resized windows force a redraw."""
+        quit_requested = False
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return True
-        return False
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                quit_requested = True
+            elif event.type in REDRAW_EVENTS:
+                self._last_key = None
+        return quit_requested
 
     def close(self) -> None:
-        pygame.quit()
-
-    @staticmethod
-    def _draw_cube() -> None:
-        glBegin(GL_QUADS)
-        glNormal3f(0.0, 0.0, 1.0)
-        glVertex3f(-0.6, -0.6, 0.6)
-        glVertex3f(0.6, -0.6, 0.6)
-        glVertex3f(0.6, 0.6, 0.6)
-        glVertex3f(-0.6, 0.6, 0.6)
-
-        glNormal3f(0.0, 0.0, -1.0)
-        glVertex3f(-0.6, -0.6, -0.6)
-        glVertex3f(-0.6, 0.6, -0.6)
-        glVertex3f(0.6, 0.6, -0.6)
-        glVertex3f(0.6, -0.6, -0.6)
-
-        glNormal3f(0.0, 1.0, 0.0)
-        glVertex3f(-0.6, 0.6, -0.6)
-        glVertex3f(-0.6, 0.6, 0.6)
-        glVertex3f(0.6, 0.6, 0.6)
-        glVertex3f(0.6, 0.6, -0.6)
-
-        glNormal3f(0.0, -1.0, 0.0)
-        glVertex3f(-0.6, -0.6, -0.6)
-        glVertex3f(0.6, -0.6, -0.6)
-        glVertex3f(0.6, -0.6, 0.6)
-        glVertex3f(-0.6, -0.6, 0.6)
-
-        glNormal3f(1.0, 0.0, 0.0)
-        glVertex3f(0.6, -0.6, -0.6)
-        glVertex3f(0.6, 0.6, -0.6)
-        glVertex3f(0.6, 0.6, 0.6)
-        glVertex3f(0.6, -0.6, 0.6)
-
-        glNormal3f(-1.0, 0.0, 0.0)
-        glVertex3f(-0.6, -0.6, -0.6)
-        glVertex3f(-0.6, -0.6, 0.6)
-        glVertex3f(-0.6, 0.6, 0.6)
-        glVertex3f(-0.6, 0.6, -0.6)
-        glEnd()
-
-    @staticmethod
-    def _draw_pyramid() -> None:
-        glBegin(GL_TRIANGLES)
-        glNormal3f(0.0, 0.6, 0.6)
-        glVertex3f(-0.6, -0.6, 0.6)
-        glVertex3f(0.6, -0.6, 0.6)
-        glVertex3f(0.0, 0.7, 0.0)
-
-        glNormal3f(0.6, 0.6, 0.0)
-        glVertex3f(0.6, -0.6, 0.6)
-        glVertex3f(0.6, -0.6, -0.6)
-        glVertex3f(0.0, 0.7, 0.0)
-
-        glNormal3f(0.0, 0.6, -0.6)
-        glVertex3f(0.6, -0.6, -0.6)
-        glVertex3f(-0.6, -0.6, -0.6)
-        glVertex3f(0.0, 0.7, 0.0)
-
-        glNormal3f(-0.6, 0.6, 0.0)
-        glVertex3f(-0.6, -0.6, -0.6)
-        glVertex3f(-0.6, -0.6, 0.6)
-        glVertex3f(0.0, 0.7, 0.0)
-        glEnd()
-
-        glBegin(GL_QUADS)
-        glNormal3f(0.0, -1.0, 0.0)
-        glVertex3f(-0.6, -0.6, 0.6)
-        glVertex3f(-0.6, -0.6, -0.6)
-        glVertex3f(0.6, -0.6, -0.6)
-        glVertex3f(0.6, -0.6, 0.6)
-        glEnd()
-
-    def _draw_sphere(self) -> None:
-        if self._quadric is None:
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join(timeout=2.0)
+            self._thread = None
             return
-        gluSphere(self._quadric, 0.7, 28, 28)
+        self._shutdown_gl()
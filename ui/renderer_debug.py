@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import logging
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
+from ui.display import create_display
+from ui.overlay import dim_frame
 from ui.overlay_3d import draw_3d_status, draw_gesture_badge, draw_hand_bbox
+from ui.recorder import FrameSink, deliver_frame
 
 
 HAND_CONNECTIONS = [
@@ -34,9 +38,13 @@ HAND_CONNECTIONS = [
 
 
 class DebugRenderer:
-    def __init__(self, window_name: str) -> None:
+    def __init__(self, window_name: str, backend: str = "window") -> None:
         self.window_name = window_name
-        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        self.display = create_display(backend, window_name)
+        self._canvas: Optional[np.ndarray] = None
+        # Called with each composed canvas, e.g. a recorder's ``offer``; a sink that raises is detached.
+        self.frame_sink: Optional[FrameSink] = None
+        self.logger = logging.getLogger(__name__)
 
     def render(
         self,
@@ -51,7 +59,7 @@ class DebugRenderer:
         hand_bbox: Optional[Tuple[int, int, int, int]] = None,
         hand_points: Optional[np.ndarray] = None,
     ) -> None:
-        canvas = (frame * 0.55).astype(np.uint8)
+        canvas = self._canvas = dim_frame(frame, self._canvas)
         self._draw_hand(canvas, hand_points)
         draw_hand_bbox(canvas, hand_bbox)
         draw_3d_status(
@@ -67,7 +75,10 @@ class DebugRenderer:
         if gesture_label not in {"idle", "unknown"}:
             draw_gesture_badge(canvas, gesture_label)
 
-        cv2.imshow(self.window_name, canvas)
+        sink = self.frame_sink
+        if sink is not None and not deliver_frame(sink, canvas, self.logger) and self.frame_sink is sink:
+            self.frame_sink = None
+        self.display.show(canvas)
 
     @staticmethod
     def _draw_hand(frame, hand_points: Optional[np.ndarray]) -> None:
@@ -84,5 +95,8 @@ class DebugRenderer:
             color = (0, 220, 255) if idx in (4, 8, 12, 16, 20) else (200, 220, 255)
             cv2.circle(frame, (int(point[0]), int(point[1])), 3, color, -1, cv2.LINE_AA)
 
+    def poll_key(self) -> int:
+        return self.display.poll_key()
+
     def close(self) -> None:
-        cv2.destroyAllWindows()
+        self.display.close()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+
+TEXT_FONT = cv2.FONT_HERSHEY_SIMPLEX
+SPRITE_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class TextSprite:
+    """Anti-aliased text rasterized once, blended as ``frame * keep / 255 + ink``."""
+
+    keep: np.ndarray
+    ink: np.ndarray
+    offset: Tuple[int, int]
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def text_sprite(
+    text: str,
+    scale: float,
+    color: Tuple[int, int, int],
+    font: int = TEXT_FONT,
+    thickness: int = 1,
+) -> TextSprite:
+    (width, height), baseline = cv2.getTextSize(text, font, scale, thickness)
+    pad = 2 * thickness
+    coverage = np.zeros((height + baseline + 2 * pad, width + 2 * pad), dtype=np.uint8)
+    cv2.putText(coverage, text, (pad, pad + height), font, scale, 255, thickness, cv2.LINE_AA)
+    coverage = cv2.cvtColor(coverage, cv2.COLOR_GRAY2BGR)
+    keep = cv2.bitwise_not(coverage)
+    ink = cv2.multiply(coverage, (*color, 0), scale=1.0 / 255.0)
+    keep.setflags(write=False)
+    ink.setflags(write=False)
+    return TextSprite(keep=keep, ink=ink, offset=(-pad, -pad - height))
+
+
+def draw_text(
+    frame,
+    text: str,
+    origin: Tuple[int, int],
+    scale: float,
+    color: Tuple[int, int, int],
+    font: int = TEXT_FONT,
+    thickness: int = 1,
+    cached: bool = True,
+) -> None:
+    """``cv2.putText(..., cv2.LINE_AA)`` through the sprite cache (within a few levels per channel).
+
+    Pass ``cached=False`` for text that changes every frame (live values): a
+    miss costs more than ``putText`` and would push reusable sprites out.
+    """
+    if not cached:
+        cv2.putText(frame, text, origin, font, scale, color, thickness, cv2.LINE_AA)
+        return
+    sprite = text_sprite(text, scale, tuple(color), font, thickness)
+    x, y = origin[0] + sprite.offset[0], origin[1] + sprite.offset[1]
+    h, w = sprite.keep.shape[:2]
+    if x < 0 or y < 0 or x + w > frame.shape[1] or y + h > frame.shape[0]:
+        cv2.putText(frame, text, origin, font, scale, color, thickness, cv2.LINE_AA)
+        return
+    roi = frame[y : y + h, x : x + w]
+    cv2.multiply(roi, sprite.keep, dst=roi, scale=1.0 / 255.0)
+    cv2.add(roi, sprite.ink, dst=roi)
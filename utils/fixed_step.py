@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+
+class FixedStepClock:
+    """Accumulator clock that turns variable frame times into fixed steps.
+
+    ``advance`` returns how many steps of ``step`` seconds to simulate; the
+    remainder is carried to the next call and exposed as ``alpha`` for
+    interpolating between the last two simulated states. Up to
+    ``max_catchup_sec`` of frame time is simulated per call, whatever the
+    rate, so slow camera frames keep real-time motion and only longer
+    stalls are dropped.
+    """
+
+    def __init__(self, rate_hz: float = 120.0, max_catchup_sec: float = 0.25) -> None:
+        if rate_hz <= 0:
+            raise ValueError("rate_hz deve ser positivo.")
+        if max_catchup_sec <= 0:
+            raise ValueError("max_catchup_sec deve ser positivo.")
+        self.step = 1.0 / float(rate_hz)
+        self.max_steps = max(1, int(round(max_catchup_sec * rate_hz)))
+        self._accumulator = 0.0
+        self._last: Optional[float] = None
+        self.dropped_time = 0.0
+
+    @property
+    def alpha(self) -> float:
+        return min(1.0, self._accumulator / self.step)
+
+    def reset(self, now: Optional[float] = None) -> None:
+        self._accumulator = 0.0
+        self._last = now
+
+    def advance(self, now: Optional[float] = None) -> int:
+        now = time.perf_counter() if now is None else float(now)
+        if self._last is None:
+            self._last = now
+            return 0
+
+        self._accumulator += max(0.0, now - self._last)
+        self._last = now
+        steps = int(self._accumulator / self.step + 1e-9)
+        if steps > self.max_steps:
+            # Drop the backlog after a long stall instead of fast-forwarding through it.
+            dropped = (steps - self.max_steps) * self.step
+            self.dropped_time += dropped
+            self._accumulator -= dropped
+            steps = self.max_steps
+        self._accumulator = max(0.0, self._accumulator - steps * self.step)
+        return steps
@@ -5,8 +5,11 @@ from collections import deque
 
 
 class FPSCounter:
-    def __init__(self, window_size: int = 30) -> None:
+    def __init__(self, window_size: int = 30, display_interval: float = 0.25) -> None:
         self._window = deque(maxlen=max(2, window_size))
+        self._display_interval = display_interval
+        self._display_fps = 0.0
+        self._display_at = float("-inf")
 
     def tick(self) -> None:
         self._window.append(time.perf_counter())
@@ -18,3 +21,11 @@ class FPSCounter:
         if elapsed <= 1e-9:
             return 0.0
         return float((len(self._window) - 1) / elapsed)
+
+    def get_display_fps(self) -> float:
+        """``get_fps`` refreshed at most every ``display_interval`` seconds, so the HUD text stays cached."""
+        now = time.perf_counter()
+        if now - self._display_at >= self._display_interval:
+            self._display_fps = self.get_fps()
+            self._display_at = now
+        return self._display_fps
@@ -52,3 +52,91 @@ def rotation_matrix_z(angle_rad: float) -> np.ndarray:
     c = math.cos(angle_rad)
     s = math.sin(angle_rad)
     return np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]], dtype=np.float32)
+
+
+# Quaternions are (w, x, y, z) float64 arrays of unit length.
+
+
+def quat_identity() -> np.ndarray:
+    return np.array([1.0, 0.0, 0.0, 0.0])
+
+
+def quat_normalize(q: Sequence[float]) -> np.ndarray:
+    q = np.asarray(q, dtype=np.float64)
+    norm = float(np.linalg.norm(q))
+    if norm < 1e-12:
+        return quat_identity()
+    return q / norm
+
+
+def quat_multiply(a: Sequence[float], b: Sequence[float]) -> np.ndarray:
+    """Hamilton product ``a * b``: rotate by ``b`` first, then by ``a``."""
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+    return np.array(
+        [
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+        ]
+    )
+
+
+def quat_from_axis_angle(axis: Sequence[float], angle_rad: float) -> np.ndarray:
+    axis = normalize_vector(axis).astype(np.float64)
+    half = 0.5 * angle_rad
+    return np.concatenate(([math.cos(half)], axis * math.sin(half)))
+
+
+def quat_from_euler_deg(angles_deg: Sequence[float]) -> np.ndarray:
+    """Same rotation as ``glRotate(x, 1,0,0) * glRotate(y, 0,1,0) * glRotate(z, 0,0,1)``."""
+    hx, hy, hz = np.radians(np.asarray(angles_deg, dtype=np.float64)) * 0.5
+    qx = (math.cos(hx), math.sin(hx), 0.0, 0.0)
+    qy = (math.cos(hy), 0.0, math.sin(hy), 0.0)
+    qz = (math.cos(hz), 0.0, 0.0, math.sin(hz))
+    return quat_multiply(quat_multiply(qx, qy), qz)
+
+
+def quat_to_euler_deg(q: Sequence[float]) -> np.ndarray:
+    """Inverse of ``quat_from_euler_deg``, each angle in ``[0, 360)``."""
+    m = quat_to_matrix(q)
+    sy = clamp(float(m[0, 2]), -1.0, 1.0)
+    y = math.asin(sy)
+    if abs(sy) < 1.0 - 1e-9:
+        x = math.atan2(-m[1, 2], m[2, 2])
+        z = math.atan2(-m[0, 1], m[0, 0])
+    else:
+        # Gimbal lock: only x +/- z is defined, so put it all on x.
+        x = math.atan2(math.copysign(1.0, sy) * m[1, 0], m[1, 1])
+        y = math.copysign(math.pi / 2.0, sy)
+        z = 0.0
+    angles = np.degrees([x, y, z]) % 360.0
+    return np.where(angles >= 360.0, 0.0, angles)
+
+
+def quat_to_matrix(q: Sequence[float]) -> np.ndarray:
+    """``(3, 3)`` rotation matrix, or ``(n, 3, 3)`` for an ``(n, 4)`` array of quaternions."""
+    w, x, y, z = np.moveaxis(np.asarray(q, dtype=np.float64), -1, 0)
+    return np.stack(
+        [
+            np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=-1),
+            np.stack([2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], axis=-1),
+            np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+def quat_slerp(a: Sequence[float], b: Sequence[float], t: float) -> np.ndarray:
+    """Spherical interpolation along the shorter arc; ``t > 1`` keeps turning past ``b``."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    dot = float(np.dot(a, b))
+    if dot < 0.0:
+        b, dot = -b, -dot
+    if dot > 0.9995:
+        return quat_normalize(a + (b - a) * t)
+    theta = math.acos(min(dot, 1.0))
+    sin_theta = math.sin(theta)
+    return (math.sin((1.0 - t) * theta) * a + math.sin(t * theta) * b) / sin_theta
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+def save_npy_atomic(path: Path, array: np.ndarray) -> None:
+    """Write ``array`` to ``path`` via a temporary file, so readers never see a partial ``.npy``."""
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    with open(tmp_path, "wb") as fp:
+        np.save(fp, np.ascontiguousarray(array))
+    os.replace(tmp_path, path)
+
+
+def load_npy(path: Path) -> np.ndarray:
+    """Memory-map a cached ``.npy`` read-only."""
+    return np.load(path, mmap_mode="r")
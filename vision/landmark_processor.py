@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import numpy as np
 
-from utils.math_utils import angle_between, euclidean_distance
+from utils.math_utils import euclidean_distance
 
 
 @dataclass
@@ -59,6 +61,25 @@ class LandmarkProcessor:
     TIP_IDS = [4, 8, 12, 16, 20]
     MID_IDS = [3, 6, 10, 14, 18]
 
+    # Bump when the feature computation changes in a way the layout hash cannot see.
+    FEATURE_SCHEMA_VERSION = 1
+
+    @classmethod
+    def feature_count(cls) -> int:
+        return 21 * 3 + len(cls.DISTANCE_PAIRS) + len(cls.ANGLE_TRIPLETS) + 1 + len(cls.TIP_IDS) + 3
+
+    @classmethod
+    def feature_schema(cls) -> Dict[str, object]:
+        layout = {
+            "version": cls.FEATURE_SCHEMA_VERSION,
+            "distance_pairs": cls.DISTANCE_PAIRS,
+            "angle_triplets": cls.ANGLE_TRIPLETS,
+            "tip_ids": cls.TIP_IDS,
+            "feature_count": cls.feature_count(),
+        }
+        digest = hashlib.sha1(json.dumps(layout, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return {"version": cls.FEATURE_SCHEMA_VERSION, "hash": digest, "feature_count": cls.feature_count()}
+
     def process(self, hand_landmarks, frame_shape, handedness: str = "Unknown") -> HandAnalysis:
         points = np.array(
             [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark],
@@ -96,41 +117,56 @@ class LandmarkProcessor:
         scale = scale if scale > 1e-6 else 1.0
         return translated / scale
 
-    def _build_feature_vector(self, points_norm: np.ndarray) -> np.ndarray:
-        coords = points_norm.flatten()
-
-        distances = np.array(
-            [euclidean_distance(points_norm[a], points_norm[b]) for a, b in self.DISTANCE_PAIRS],
-            dtype=np.float32,
-        )
-
-        angles = np.array(
-            [angle_between(points_norm[a], points_norm[b], points_norm[c]) for a, b, c in self.ANGLE_TRIPLETS],
-            dtype=np.float32,
-        )
-
-        thumb_index_dist = np.array([euclidean_distance(points_norm[4], points_norm[8])], dtype=np.float32)
-        openness_vector = np.array(
-            [euclidean_distance(points_norm[0], points_norm[idx]) for idx in self.TIP_IDS],
-            dtype=np.float32,
-        )
-
-        palm_width = euclidean_distance(points_norm[5], points_norm[17])
-        palm_height = euclidean_distance(points_norm[0], points_norm[9])
+    @staticmethod
+    def normalize_batch(points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=np.float32)
+        translated = points - points[:, :1]
+        scale = np.max(np.linalg.norm(translated[..., :2], axis=2), axis=1)
+        scale = np.where(scale > 1e-6, scale, np.float32(1.0))
+        return translated / scale[:, None, None]
+
+    def build_feature_batch(self, points_norm: np.ndarray) -> np.ndarray:
+        points = np.asarray(points_norm, dtype=np.float32)
+        count = points.shape[0]
+
+        def _dist(a, b) -> np.ndarray:
+            return np.linalg.norm(points[:, a] - points[:, b], axis=-1)
+
+        pairs = np.array(self.DISTANCE_PAIRS)
+        distances = _dist(pairs[:, 0], pairs[:, 1])
+
+        triplets = np.array(self.ANGLE_TRIPLETS)
+        v1 = points[:, triplets[:, 0]] - points[:, triplets[:, 1]]
+        v2 = points[:, triplets[:, 2]] - points[:, triplets[:, 1]]
+        norm1 = np.linalg.norm(v1, axis=-1).astype(np.float64)
+        norm2 = np.linalg.norm(v2, axis=-1).astype(np.float64)
+        valid = (norm1 >= 1e-9) & (norm2 >= 1e-9)
+        dots = np.einsum("nkd,nkd->nk", v1, v2).astype(np.float64)
+        cosine = np.divide(dots, norm1 * norm2, out=np.ones_like(dots), where=valid)
+        angles = np.where(valid, np.arccos(np.clip(cosine, -1.0, 1.0)), 0.0)
+
+        thumb_index_dist = _dist(4, 8)
+        openness_vector = _dist(self.TIP_IDS, [0] * len(self.TIP_IDS))
+        palm_width = _dist(5, 17).astype(np.float64)
+        palm_height = _dist(0, 9).astype(np.float64)
         palm_ratio = palm_width / (palm_height + 1e-6)
-        palm_props = np.array([palm_width, palm_height, palm_ratio], dtype=np.float32)
 
-        features = np.concatenate(
+        return np.concatenate(
             [
-                coords.astype(np.float32),
+                points.reshape(count, -1),
                 distances,
                 angles,
-                thumb_index_dist,
+                thumb_index_dist[:, None],
                 openness_vector,
-                palm_props,
-            ]
+                np.column_stack([palm_width, palm_height, palm_ratio]),
+            ],
+            axis=1,
+            dtype=np.float32,
         )
-        return features.astype(np.float32)
+
+    def _build_feature_vector(self, points_norm: np.ndarray) -> np.ndarray:
+        # One implementation for live and cached features: the schema hash only covers the layout.
+        return self.build_feature_batch(np.asarray(points_norm)[None])[0]
 
     def _infer_builtin_gesture(self, points_norm: np.ndarray, handedness: str) -> str:
         wrist = points_norm[0]